@@ -8,7 +8,6 @@ import sys
 from pathlib import Path
 
 import click
-import toml
 from rich.console import Console
 
 from . import __version__
@@ -84,12 +83,18 @@ def workspace_init(ctx: click.Context, name: str, python_version: str) -> None:
 
 @workspace.command("setup")
 @click.option("--ci-mode", is_flag=True, help="Run in CI mode")
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Number of repositories to set up concurrently",
+)
 @click.pass_context
-def workspace_setup(ctx: click.Context, ci_mode: bool) -> None:
+def workspace_setup(ctx: click.Context, ci_mode: bool, jobs: int) -> None:
     """Set up the workspace (clone repos, install dependencies)."""
     try:
         manager = WorkspaceManager(ctx.obj["config_manager"])
-        manager.setup_workspace(ci_mode=ci_mode)
+        manager.setup_workspace(ci_mode=ci_mode, jobs=jobs)
         console.print("[green]✓ Workspace setup completed[/green]")
     except Exception as e:
         console.print(f"[red]Error setting up workspace: {e}[/red]")
@@ -270,6 +275,16 @@ def version(ctx: click.Context) -> None:
     default=True,
     help="Run validation tests after version bump",
 )
+@click.option(
+    "--use-poetry-cli",
+    is_flag=True,
+    help="Set versions with 'poetry version' instead of editing pyproject.toml",
+)
+@click.option(
+    "--no-parallel",
+    is_flag=True,
+    help="Update dependent repositories one at a time",
+)
 @click.pass_context
 def version_bump(
     ctx: click.Context,
@@ -280,6 +295,8 @@ def version_bump(
     update_dependents: bool,
     dependents_bump: str,
     validate: bool,
+    use_poetry_cli: bool,
+    no_parallel: bool,
 ) -> None:
     """Bump version for a repository and update all dependents.
 
@@ -300,7 +317,11 @@ def version_bump(
       mpr version bump buvis-pybase patch --alpha  # 0.1.6-alpha.2, 0.1.6-alpha.3, etc.
     """
     try:
-        manager = VersionManager(ctx.obj["config_manager"])
+        manager = VersionManager(
+            ctx.obj["config_manager"],
+            use_poetry_cli=use_poetry_cli,
+            parallel=not no_parallel,
+        )
 
         success = manager.bump_version(
             repository=repository,
@@ -380,8 +401,8 @@ def version_diagnose(ctx: click.Context, repository: str | None) -> None:
                 pyproject_path = repo.path / "pyproject.toml"
                 if pyproject_path.exists():
                     try:
-                        with open(pyproject_path) as f:
-                            pyproject_data = toml.load(f)
+                        # Served from the parse made for the current version
+                        pyproject_data = manager.read_pyproject(repo) or {}
 
                         dependencies = (
                             pyproject_data.get("tool", {})
@@ -593,12 +614,37 @@ def test(ctx: click.Context) -> None:
 @test.command("unit")
 @click.option("--parallel", is_flag=True, help="Run tests in parallel")
 @click.option("--coverage", is_flag=True, help="Generate coverage report")
+@click.option(
+    "--no-cache", is_flag=True, help="Run tests even if sources are unchanged"
+)
+@click.option("--no-progress", is_flag=True, help="Disable the progress spinner")
+@click.option(
+    "--batch",
+    is_flag=True,
+    help=(
+        "Run repositories sharing a virtualenv together; repositories with "
+        "their own pytest configuration still run separately"
+    ),
+)
 @click.pass_context
-def test_unit(ctx: click.Context, parallel: bool, coverage: bool) -> None:
+def test_unit(
+    ctx: click.Context,
+    parallel: bool,
+    coverage: bool,
+    no_cache: bool,
+    no_progress: bool,
+    batch: bool,
+) -> None:
     """Run unit tests in all repositories."""
     try:
-        runner = ExecutorService(ctx.obj["config_manager"])
-        success = runner.run_unit_tests(parallel=parallel, coverage=coverage)
+        runner = ExecutorService(
+            ctx.obj["config_manager"],
+            use_cache=not no_cache,
+            show_progress=False if no_progress else None,
+        )
+        success = runner.run_unit_tests(
+            parallel=parallel, coverage=coverage, batch=batch
+        )
 
         if success:
             console.print("[green]✓ All unit tests passed[/green]")
@@ -643,14 +689,39 @@ def test_integration(
 @test.command("all")
 @click.option("--parallel", is_flag=True, help="Run tests in parallel")
 @click.option("--coverage", is_flag=True, help="Generate coverage report")
+@click.option(
+    "--no-cache", is_flag=True, help="Run tests even if sources are unchanged"
+)
+@click.option("--no-progress", is_flag=True, help="Disable the progress spinner")
+@click.option(
+    "--batch",
+    is_flag=True,
+    help=(
+        "Run repositories sharing a virtualenv together; repositories with "
+        "their own pytest configuration still run separately"
+    ),
+)
 @click.pass_context
-def test_all(ctx: click.Context, parallel: bool, coverage: bool) -> None:
+def test_all(
+    ctx: click.Context,
+    parallel: bool,
+    coverage: bool,
+    no_cache: bool,
+    no_progress: bool,
+    batch: bool,
+) -> None:
     """Run all tests."""
     try:
-        runner = ExecutorService(ctx.obj["config_manager"])
+        runner = ExecutorService(
+            ctx.obj["config_manager"],
+            use_cache=not no_cache,
+            show_progress=False if no_progress else None,
+        )
 
         # Run unit tests first
-        unit_success = runner.run_unit_tests(parallel=parallel, coverage=coverage)
+        unit_success = runner.run_unit_tests(
+            parallel=parallel, coverage=coverage, batch=batch
+        )
 
         if not unit_success:
             console.print("[red]Unit tests failed, skipping integration tests[/red]")
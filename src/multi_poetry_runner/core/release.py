@@ -1,7 +1,11 @@
 """Release coordination functionality."""
 
+import os
+import re
 import shutil
 import subprocess
+import tomllib
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
@@ -9,17 +13,52 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
 
-import toml
+import tomli_w
+from packaging.version import InvalidVersion, Version
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ..utils.config import ConfigManager, RepositoryConfig
 from ..utils.logger import get_logger
+from ..utils.pyproject import PyprojectCache, package_name_variants
 
 logger = get_logger(__name__)
 console = Console()
 
+# Supports formats like "1.2.3", "1.2.3-alpha.1", "1.2.3+dev.123"
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-alpha\.(\d+))?(?:\+.*)?$")
+
+
+def _replace_dependency_versions(text: str, edits: dict[str, str]) -> str | None:
+    """Rewrite dependency version strings in place within [tool.poetry.dependencies].
+
+    Returns None when any edit cannot be located unambiguously, so callers
+    can fall back to reserializing the whole document.
+    """
+    header = re.search(r"^\[tool\.poetry\.dependencies\][ \t]*$", text, re.MULTILINE)
+    if header is None:
+        return None
+
+    next_header = re.compile(r"^[ \t]*\[", re.MULTILINE).search(text, header.end())
+    end = next_header.start() if next_header else len(text)
+    section = text[header.end() : end]
+
+    for dep_name, version_spec in edits.items():
+        name = re.escape(dep_name)
+        pattern = re.compile(
+            rf"""^(\s*["']?{name}["']?\s*=\s*(?:\{{[^}}\n]*?\bversion\s*=\s*)?)"""
+            r"""("[^"\n]*"|'[^'\n]*')""",
+            re.MULTILINE,
+        )
+        matches = list(pattern.finditer(section))
+        if len(matches) != 1:
+            return None
+        value = matches[0].span(2)
+        section = f'{section[: value[0]]}"{version_spec}"{section[value[1] :]}'
+
+    return text[: header.end()] + section + text[end:]
+
 
 class ReleaseStage(Enum):
     """Release stages."""
@@ -45,7 +84,15 @@ class ReleaseCoordinator:
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.workspace_root = config_manager.workspace_root
-        self.backups: dict[str, dict[str, Path | str | None]] = {}
+        self.backups: dict[str, dict[str, Path | str | bytes | None]] = {}
+        # Parsed pyproject.toml documents keyed by path, tagged with the mtime
+        # they were read at; dirty entries are written back on flush
+        self._pyprojects = PyprojectCache()
+        # Edited pyproject documents not yet written back to disk
+        self._pyproject_dirty: dict[Path, dict[str, Any]] = {}
+        self._pyproject_edits: dict[Path, dict[str, str | None]] = {}
+        # Current versions by repository name, dropped whenever a version changes
+        self._version_cache: dict[str, str | None] = {}
         self.release_results: dict[str, ReleaseStatus] = {}
 
     def create_release(
@@ -197,7 +244,7 @@ class ReleaseCoordinator:
         for repo in config.repositories:
             if repo.path.exists():
                 repo_backup_dir = backup_dir / repo.name
-                repo_backup: dict[str, Path | str | None] = {
+                repo_backup: dict[str, Path | str | bytes | None] = {
                     "pyproject_toml": None,
                     "git_commit": None,
                     "backup_dir": repo_backup_dir,
@@ -210,9 +257,11 @@ class ReleaseCoordinator:
                 pyproject_path = repo.path / "pyproject.toml"
                 if pyproject_path.exists():
                     backup_path = repo_backup_dir / "pyproject.toml"
-                    shutil.copy2(pyproject_path, backup_path)
+                    original = pyproject_path.read_bytes()
+                    backup_path.write_bytes(original)
+                    repo_backup["pyproject_toml_bytes"] = original
                     # Explicit type conversion to ensure type compatibility
-                    pyproject_backup: Path | str | None = (
+                    pyproject_backup: Path | str | bytes | None = (
                         Path(str(backup_path)) if backup_path.exists() else None
                     )
                     repo_backup["pyproject_toml"] = pyproject_backup
@@ -496,22 +545,32 @@ class ReleaseCoordinator:
             return "0.1.0"
 
         try:
-            with open(pyproject_path) as f:
-                pyproject_data = toml.load(f)
+            pyproject_data = self._pyprojects.load(pyproject_path) or {}
 
             version = pyproject_data.get("tool", {}).get("poetry", {}).get("version")
             return str(version) if version is not None else "0.1.0"
-        except (toml.TomlDecodeError, KeyError):
+        except (tomllib.TOMLDecodeError, KeyError):
             return "0.1.0"
 
+    def _get_cached_version(self, repo: RepositoryConfig) -> str | None:
+        """Get current version, memoized until the repository version changes."""
+        if repo.name not in self._version_cache:
+            self._version_cache[repo.name] = self._get_current_version(repo)
+        return self._version_cache[repo.name]
+
     def _update_repository_version(self, repo: RepositoryConfig, version: str) -> None:
         """Update repository version using Poetry."""
-        subprocess.run(
-            ["poetry", "version", version],
-            cwd=repo.path,
-            check=True,
-            capture_output=True,
-        )
+        self._version_cache.pop(repo.name, None)
+        try:
+            subprocess.run(
+                ["poetry", "version", version],
+                cwd=repo.path,
+                check=True,
+                capture_output=True,
+            )
+        finally:
+            # The file was rewritten; don't rely on mtime resolution to notice
+            self._pyprojects.discard(repo.path / "pyproject.toml")
 
     def _update_dependency_versions(self, repo: RepositoryConfig) -> None:
         """Update dependency versions in repository."""
@@ -643,6 +702,8 @@ class ReleaseCoordinator:
         self, released_repos: list[RepositoryConfig]
     ) -> bool:
         """Update dependent repositories to use the new released versions with cascading updates."""
+        repos_by_name = self._get_repositories_by_name()
+
         # Create a map of released repository versions
         released_versions: dict[str, str] = {}
         for repo in released_repos:
@@ -650,9 +711,10 @@ class ReleaseCoordinator:
             if new_version:
                 released_versions[repo.name] = new_version
                 # Also try with package name variations
-                released_versions[repo.package_name] = new_version
-                released_versions[repo.package_name.replace("-", "_")] = new_version
-                released_versions[repo.package_name.replace("_", "-")] = new_version
+                for name_variant in package_name_variants(repo.package_name):
+                    released_versions[name_variant] = new_version
+
+        released_repo_names = frozenset(repo.name for repo in released_repos)
 
         # Find all repositories that need updates (direct and cascading dependencies)
         all_dependents = self._find_all_dependent_repositories(released_repos)
@@ -674,135 +736,58 @@ class ReleaseCoordinator:
             if repo.name == repo_name
         ]
 
+        # Group dependents into topological levels: repositories within a level
+        # never depend on each other, so a level can be updated concurrently
+        levels: list[list[RepositoryConfig]] = []
+        level_of: dict[str, int] = {}
+        for dep_repo in ordered_dependents:
+            level = max(
+                (level_of[d] + 1 for d in dep_repo.dependencies if d in level_of),
+                default=0,
+            )
+            level_of[dep_repo.name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(dep_repo)
+
         # Track which repositories have been updated in this release cycle
         updated_in_this_cycle: dict[str, str | None] = {
             repo.name: self._get_current_version(repo) for repo in released_repos
         }
         success_count = 0
 
-        for dep_repo in ordered_dependents:
-            try:
-                console.print(f"  Updating {dep_repo.name}...")
-
-                # Check which dependencies need updating
-                dependencies_updated = False
-
-                # Check for direct dependencies on released repos
-                for released_repo in released_repos:
-                    released_version = released_versions.get(released_repo.name)
-                    if released_version and self._update_dependency_version(
-                        dep_repo, released_repo.package_name, released_version
-                    ):
-                        dependencies_updated = True
-
-                # Check for dependencies on other repos that were updated in this cycle
-                for updated_repo_name, updated_version in updated_in_this_cycle.items():
-                    if updated_repo_name in [r.name for r in released_repos]:
-                        continue  # Already handled above
-
-                    updated_repo = self.config_manager.get_repository(updated_repo_name)
-                    if updated_repo and self._update_dependency_version(
-                        dep_repo, updated_repo.package_name, updated_version or ""
-                    ):
-                        dependencies_updated = True
-
-                if dependencies_updated:
-                    # Bump the dependent repository's version
-                    current_dep_version = self._get_current_version(dep_repo)
-                    new_dep_version = None
-                    if current_dep_version:
-                        new_dep_version = self._calculate_dependent_version_bump(
-                            current_dep_version
-                        )
-                        self._update_repository_version(dep_repo, new_dep_version)
-                        console.print(
-                            f"    Bumped {dep_repo.name} version: {current_dep_version} → {new_dep_version}"
-                        )
-
-                        # Track this update for cascading to other dependents
-                        updated_in_this_cycle[dep_repo.name] = new_dep_version
-
-                    # Skip lock file update for dependent repositories - will be done after package is published
-                    # The CI/CD pipeline will handle poetry lock after the dependency is available
-
-                    # Check if there are actually changes to commit
-                    result = subprocess.run(
-                        ["git", "status", "--porcelain"],
-                        cwd=dep_repo.path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
-                    if result.stdout.strip():
-                        # Build commit message with all updated dependencies
-                        updated_deps: list[str] = []
-                        for released_repo in released_repos:
-                            if released_repo.name in updated_in_this_cycle:
-                                version_str = updated_in_this_cycle[released_repo.name]
-                                if version_str:
-                                    updated_deps.append(
-                                        f"{released_repo.package_name}@{version_str}"
-                                    )
-
-                        # Add other cascading updates
-                        for (
-                            updated_repo_name,
-                            updated_version,
-                        ) in updated_in_this_cycle.items():
-                            if (
-                                updated_repo_name
-                                not in [r.name for r in released_repos]
-                                and updated_repo_name != dep_repo.name
-                            ):
-                                updated_repo = self.config_manager.get_repository(
-                                    updated_repo_name
-                                )
-                                if (
-                                    updated_repo
-                                    and updated_repo_name in dep_repo.dependencies
-                                ):
-                                    if updated_version:
-                                        updated_deps.append(
-                                            f"{updated_repo.package_name}@{updated_version}"
-                                        )
-
-                        # Remove duplicates while preserving order
-                        unique_deps: list[str] = []
-                        seen = set()
-                        for dep in updated_deps:
-                            if dep not in seen:
-                                unique_deps.append(dep)
-                                seen.add(dep)
-
-                        commit_message = (
-                            f"Update dependencies: {', '.join(unique_deps)}"
-                        )
-
-                        # Add version bump info to commit message
-                        if current_dep_version and new_dep_version:
-                            commit_message += f"; bump version to {new_dep_version}"
+        for level_repos in levels:
+            # Dependents only cascade from updates made in earlier levels
+            updated_snapshot = dict(updated_in_this_cycle)
+
+            with ThreadPoolExecutor(max_workers=min(8, len(level_repos))) as executor:
+                futures = {
+                    executor.submit(
+                        self._update_single_dependent,
+                        dep_repo,
+                        released_repos,
+                        released_versions,
+                        released_repo_names,
+                        repos_by_name,
+                        updated_snapshot,
+                    ): dep_repo
+                    for dep_repo in level_repos
+                }
 
-                        self._commit_dependency_changes(dep_repo, commit_message)
-                        console.print(f"  [green]✓[/green] Updated {dep_repo.name}")
-                    else:
-                        # No changes needed, dependency was already at correct version
-                        console.print(
-                            f"  [green]✓[/green] {dep_repo.name} already at correct version"
-                        )
+                # Console output is printed from this thread only, so each
+                # repository's messages stay together
+                for future in as_completed(futures):
+                    dep_repo = futures[future]
+                    success, new_dep_version, messages = future.result()
 
-                    success_count += 1
-                else:
-                    console.print(
-                        f"  [yellow]?[/yellow] No updates needed for {dep_repo.name}"
-                    )
-                    success_count += 1  # Consider this successful
+                    for message in messages:
+                        console.print(message)
 
-            except Exception as e:
-                console.print(f"  [red]✗[/red] Failed to update {dep_repo.name}: {e}")
-                logger.error(
-                    f"Failed to update dependent repository {dep_repo.name}: {e}"
-                )
+                    if success:
+                        success_count += 1
+                    if new_dep_version:
+                        # Track this update for cascading to other dependents
+                        updated_in_this_cycle[dep_repo.name] = new_dep_version
 
         if success_count == len(ordered_dependents):
             console.print(
@@ -815,6 +800,128 @@ class ReleaseCoordinator:
             )
             return False
 
+    def _update_single_dependent(
+        self,
+        dep_repo: RepositoryConfig,
+        released_repos: list[RepositoryConfig],
+        released_versions: dict[str, str],
+        released_repo_names: frozenset[str],
+        repos_by_name: dict[str, RepositoryConfig],
+        updated_in_this_cycle: dict[str, str | None],
+    ) -> tuple[bool, str | None, list[str]]:
+        """Update one dependent repository.
+
+        Returns whether the update succeeded, the dependent's new version if it
+        was bumped, and the console messages to print.
+        """
+        messages = [f"  Updating {dep_repo.name}..."]
+        dep_names = frozenset(dep_repo.dependencies)
+        new_dep_version = None
+
+        try:
+            # Check which dependencies need updating
+            dependencies_updated = False
+
+            # Check for direct dependencies on released repos
+            for released_repo in released_repos:
+                released_version = released_versions.get(released_repo.name)
+                if released_version and self._update_dependency_version(
+                    dep_repo, released_repo.package_name, released_version
+                ):
+                    dependencies_updated = True
+
+            # Check for dependencies on other repos that were updated in this cycle
+            for updated_repo_name, updated_version in updated_in_this_cycle.items():
+                if updated_repo_name in released_repo_names:
+                    continue  # Already handled above
+
+                updated_repo = repos_by_name.get(updated_repo_name)
+                if updated_repo and self._update_dependency_version(
+                    dep_repo, updated_repo.package_name, updated_version or ""
+                ):
+                    dependencies_updated = True
+
+            # Write all dependency edits for this repository at once
+            self._flush_pyproject_writes(dep_repo.path / "pyproject.toml")
+
+            if not dependencies_updated:
+                messages.append(
+                    f"  [yellow]?[/yellow] No updates needed for {dep_repo.name}"
+                )
+                return True, None, messages  # Consider this successful
+
+            # Bump the dependent repository's version
+            current_dep_version = self._get_current_version(dep_repo)
+            if current_dep_version:
+                new_dep_version = self._calculate_dependent_version_bump(
+                    current_dep_version
+                )
+                self._update_repository_version(dep_repo, new_dep_version)
+                messages.append(
+                    f"    Bumped {dep_repo.name} version: {current_dep_version} → {new_dep_version}"
+                )
+
+            # Skip lock file update for dependent repositories - will be done after package is published
+            # The CI/CD pipeline will handle poetry lock after the dependency is available
+
+            # Check if there are actually changes to commit
+            result = subprocess.run(
+                ["git", "status", "--porcelain"],
+                cwd=dep_repo.path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+
+            if not result.stdout.strip():
+                # No changes needed, dependency was already at correct version
+                messages.append(
+                    f"  [green]✓[/green] {dep_repo.name} already at correct version"
+                )
+                return True, new_dep_version, messages
+
+            # Build commit message with all updated dependencies
+            # (dict keys keep insertion order and drop duplicates)
+            updated_deps: dict[str, None] = {}
+            for released_repo in released_repos:
+                version_str = updated_in_this_cycle.get(released_repo.name)
+                if version_str:
+                    updated_deps[f"{released_repo.package_name}@{version_str}"] = None
+
+            # Add other cascading updates
+            for updated_repo_name, updated_version in updated_in_this_cycle.items():
+                if (
+                    updated_repo_name not in released_repo_names
+                    and updated_repo_name in dep_names
+                    and updated_version
+                ):
+                    updated_repo = repos_by_name.get(updated_repo_name)
+                    if updated_repo:
+                        updated_deps[
+                            f"{updated_repo.package_name}@{updated_version}"
+                        ] = None
+
+            commit_message = f"Update dependencies: {', '.join(updated_deps)}"
+
+            # Add version bump info to commit message
+            if new_dep_version:
+                commit_message += f"; bump version to {new_dep_version}"
+
+            self._commit_dependency_changes(dep_repo, commit_message)
+            messages.append(f"  [green]✓[/green] Updated {dep_repo.name}")
+
+            return True, new_dep_version, messages
+
+        except Exception as e:
+            messages.append(f"  [red]✗[/red] Failed to update {dep_repo.name}: {e}")
+            logger.error(f"Failed to update dependent repository {dep_repo.name}: {e}")
+            return False, new_dep_version, messages
+
+    def _get_repositories_by_name(self) -> dict[str, RepositoryConfig]:
+        """Index configured repositories by name for repeated lookups."""
+        config = self.config_manager.load_config()
+        return {repo.name: repo for repo in config.repositories}
+
     def _find_all_dependent_repositories(
         self, released_repos: list[RepositoryConfig]
     ) -> list[RepositoryConfig]:
@@ -824,32 +931,38 @@ class ReleaseCoordinator:
         all_dependents: list[RepositoryConfig] = []
         dependent_names = set()  # Track names to avoid duplicates
 
+        # Stat each candidate repository exactly once, skipping the ones
+        # we just released
+        existing_repos = [
+            repo
+            for repo in config.repositories
+            if repo.name not in released_repo_names and repo.path.exists()
+        ]
+
+        # Build a reverse dependency index once (dependency name -> dependents)
+        dependents_index: dict[str, list[RepositoryConfig]] = {}
+        for repo in existing_repos:
+            for dep_name in repo.dependencies:
+                dependents_index.setdefault(dep_name, []).append(repo)
+
         # Use a queue to process dependencies level by level
-        to_process = list(released_repo_names)
+        to_process = deque(released_repo_names)
         processed = set()
 
         while to_process:
-            current_repo_name = to_process.pop(0)
+            current_repo_name = to_process.popleft()
             if current_repo_name in processed:
                 continue
 
             processed.add(current_repo_name)
 
             # Find direct dependents of current repo
-            for repo in config.repositories:
-                if repo.name in released_repo_names:
-                    continue  # Skip repositories we just released
-
-                if not repo.path.exists():
-                    continue
-
-                # Check if this repo depends on current repo
-                if current_repo_name in repo.dependencies:
-                    if repo.name not in dependent_names:
-                        all_dependents.append(repo)
-                        dependent_names.add(repo.name)
-                        # Add this repo to be processed for cascading dependencies
-                        to_process.append(repo.name)
+            for repo in dependents_index.get(current_repo_name, []):
+                if repo.name not in dependent_names:
+                    all_dependents.append(repo)
+                    dependent_names.add(repo.name)
+                    # Add this repo to be processed for cascading dependencies
+                    to_process.append(repo.name)
 
         return all_dependents
 
@@ -864,26 +977,22 @@ class ReleaseCoordinator:
             return False
 
         try:
-            # Read current pyproject.toml
-            with open(pyproject_path) as f:
-                pyproject_data = toml.load(f)
+            # Read current pyproject.toml (reusing edits not yet flushed)
+            pyproject_data = self._load_pyproject(pyproject_path)
+            if pyproject_data is None:
+                logger.warning(f"No pyproject.toml found in {dependent_repo.name}")
+                return False
 
             # Update dependency version
             dependencies = (
                 pyproject_data.get("tool", {}).get("poetry", {}).get("dependencies", {})
             )
 
-            # Try multiple package name variations (hyphen vs underscore)
-            possible_names = [
-                package_name,
-                package_name.replace("-", "_"),
-                package_name.replace("_", "-"),
-            ]
-
             found_dependency = None
-            actual_dep_name = None
+            actual_dep_name = package_name
 
-            for dep_name in possible_names:
+            # Try multiple package name variations (hyphen vs underscore)
+            for dep_name in package_name_variants(package_name):
                 if dep_name in dependencies:
                     found_dependency = dependencies[dep_name]
                     actual_dep_name = dep_name
@@ -930,9 +1039,13 @@ class ReleaseCoordinator:
                     changed = True
 
             if changed:
-                # Write back to file
-                with open(pyproject_path, "w") as f:
-                    toml.dump(pyproject_data, f)
+                # Defer the write until _flush_pyproject_writes(); a None edit
+                # means the line cannot be patched and forces a full rewrite
+                self._pyproject_dirty[pyproject_path] = pyproject_data
+                edits = self._pyproject_edits.setdefault(pyproject_path, {})
+                edits[actual_dep_name] = (
+                    new_version_spec if original_dependency is not None else None
+                )
                 logger.info(
                     f"Updated {actual_dep_name} from {original_dependency} to {new_version_spec} in {dependent_repo.name}"
                 )
@@ -949,29 +1062,90 @@ class ReleaseCoordinator:
             )
             return False
 
+    def _load_pyproject(self, pyproject_path: Path) -> dict[str, Any] | None:
+        """Load pyproject.toml, reusing the cached document if the file is unchanged."""
+        pending = self._pyproject_dirty.get(pyproject_path)
+        if pending is not None:
+            return pending
+        return self._pyprojects.load(pyproject_path)
+
+    def _flush_pyproject_writes(self, pyproject_path: Path | None = None) -> None:
+        """Write modified pyproject.toml files back to disk exactly once.
+
+        Only the given file is flushed when a path is passed, so concurrent
+        dependent updates never write each other's documents.
+        """
+        if pyproject_path is None:
+            pending = list(self._pyproject_dirty)
+        elif pyproject_path in self._pyproject_dirty:
+            pending = [pyproject_path]
+        else:
+            pending = []
+
+        for path in pending:
+            pyproject_data = self._pyproject_dirty.pop(path)
+            edits = self._pyproject_edits.pop(path, {})
+
+            try:
+                # Patch only the changed version strings when possible, which
+                # keeps formatting and comments intact
+                new_text = None
+                if all(spec is not None for spec in edits.values()):
+                    new_text = _replace_dependency_versions(
+                        path.read_text(encoding="utf-8"),
+                        {name: spec for name, spec in edits.items() if spec},
+                    )
+
+                if new_text is not None:
+                    path.write_text(new_text, encoding="utf-8")
+                else:
+                    with open(path, "wb") as f:
+                        tomli_w.dump(pyproject_data, f)
+            except Exception:
+                # Never serve edits that did not make it to disk
+                self._pyprojects.discard(path)
+                raise
+
+            self._pyprojects.store(path, pyproject_data)
+
     def _calculate_dependent_version_bump(self, current_version: str) -> str:
         """Calculate the next version for a dependent repository when dependencies are updated.
 
         Rules:
         - If already alpha: increment alpha number (e.g., 1.2.3-alpha.1 -> 1.2.3-alpha.2)
+        - If a PEP 440 pre-release: increment it in the same spelling
+          (e.g., 1.2.3a4 -> 1.2.3a5, 1.2.3rc1 -> 1.2.3rc2)
         - If not alpha: increment patch and add alpha.1 (e.g., 1.2.3 -> 1.2.4-alpha.1)
         """
-        import re
-
-        # Parse current version - support formats like "1.2.3", "1.2.3-alpha.1", etc.
-        version_pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-alpha\.(\d+))?(?:\+.*)?$"
-        match = re.match(version_pattern, current_version)
+        match = _VERSION_RE.match(current_version)
 
         if not match:
+            try:
+                parsed: Version | None = Version(current_version)
+            except InvalidVersion:
+                parsed = None
+
+            if (
+                parsed is not None
+                and parsed.pre is not None
+                and parsed.epoch == 0
+                and len(parsed.release) == 3
+                and parsed.post is None
+                and parsed.dev is None
+                and parsed.local is None
+            ):
+                major, minor, patch = parsed.release
+                label, number = parsed.pre
+                return f"{major}.{minor}.{patch}{label}{number + 1}"
+
             # If we can't parse it, just append alpha.1
             logger.warning(
                 f"Could not parse version {current_version}, appending -alpha.1"
             )
             return f"{current_version}-alpha.1"
 
-        major, minor, patch, alpha = match.groups()
-        major, minor, patch = int(major), int(minor), int(patch)
-        alpha = int(alpha) if alpha else None
+        major, minor, patch = (int(group) for group in match.groups()[:3])
+        alpha = int(match.group(4)) if match.group(4) else None
 
         if alpha is not None:
             # Already an alpha version, just increment alpha number
@@ -992,15 +1166,32 @@ class ReleaseCoordinator:
         """Rollback failed release."""
         console.print("Rolling back release changes...")
 
+        repos_by_name = self._get_repositories_by_name()
+        repos_to_lock: list[RepositoryConfig] = []
+
+        # Phase 1: restore files and git state serially
         for repo_name, backup in self.backups.items():
-            repo = self.config_manager.get_repository(repo_name)
+            repo = repos_by_name.get(repo_name)
             if not repo:
                 continue
 
+            self._version_cache.pop(repo_name, None)
+
             try:
-                # Restore pyproject.toml
-                if backup["pyproject_toml"]:
-                    shutil.copy2(backup["pyproject_toml"], repo.path / "pyproject.toml")
+                pyproject_path = repo.path / "pyproject.toml"
+                needs_lock = True
+
+                # Restore pyproject.toml from the bytes held in memory
+                original = backup.get("pyproject_toml_bytes")
+                if isinstance(original, bytes):
+                    try:
+                        needs_lock = pyproject_path.read_bytes() != original
+                    except OSError:
+                        needs_lock = True
+                    if needs_lock:
+                        self._write_bytes_atomic(pyproject_path, original)
+                elif backup["pyproject_toml"]:
+                    shutil.copy2(Path(str(backup["pyproject_toml"])), pyproject_path)
 
                 # Reset git
                 if backup["git_commit"]:
@@ -1015,34 +1206,82 @@ class ReleaseCoordinator:
                 if git_commit and isinstance(git_commit, str):
                     self._cleanup_orphaned_tags(repo, git_commit)
 
-                # Update lock file during rollback
-                try:
-                    subprocess.run(
-                        ["poetry", "lock"],
-                        cwd=repo.path,
-                        check=True,
-                        capture_output=True,
-                        timeout=60,
-                    )
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                    # If standard lock fails during rollback, try regenerate
-                    logger.warning(
-                        f"Standard lock failed during rollback for {repo.name}, trying --regenerate"
-                    )
-                    subprocess.run(
-                        ["poetry", "lock", "--regenerate"],
-                        cwd=repo.path,
-                        check=True,
-                        capture_output=True,
-                        timeout=120,
-                    )
-
-                self.release_results[repo_name] = ReleaseStatus.ROLLED_BACK
-                logger.info(f"Rolled back {repo_name}")
+                if needs_lock:
+                    repos_to_lock.append(repo)
+                else:
+                    self.release_results[repo_name] = ReleaseStatus.ROLLED_BACK
+                    logger.info(f"Rolled back {repo_name} (pyproject.toml unchanged)")
 
             except Exception as e:
                 logger.error(f"Failed to rollback {repo_name}: {e}")
 
+        if not repos_to_lock:
+            return
+
+        # Phase 2: update lock files in parallel
+        failed: list[RepositoryConfig] = []
+        with ThreadPoolExecutor(max_workers=min(4, len(repos_to_lock))) as executor:
+            futures = {
+                executor.submit(self._lock_repository, repo, False): repo
+                for repo in repos_to_lock
+            }
+            for future in as_completed(futures):
+                repo = futures[future]
+                if future.result():
+                    self.release_results[repo.name] = ReleaseStatus.ROLLED_BACK
+                    logger.info(f"Rolled back {repo.name}")
+                else:
+                    failed.append(repo)
+
+        if not failed:
+            return
+
+        # If standard lock fails during rollback, try regenerate for those only
+        for repo in failed:
+            logger.warning(
+                f"Standard lock failed during rollback for {repo.name}, trying --regenerate"
+            )
+        with ThreadPoolExecutor(max_workers=min(4, len(failed))) as executor:
+            futures = {
+                executor.submit(self._lock_repository, repo, True): repo
+                for repo in failed
+            }
+            for future in as_completed(futures):
+                repo = futures[future]
+                if future.result():
+                    self.release_results[repo.name] = ReleaseStatus.ROLLED_BACK
+                    logger.info(f"Rolled back {repo.name}")
+                else:
+                    logger.error(f"Failed to rollback {repo.name}: poetry lock failed")
+
+    def _write_bytes_atomic(self, path: Path, data: bytes) -> None:
+        """Write bytes to a staging file and move it over the target."""
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _lock_repository(self, repo: RepositoryConfig, regenerate: bool) -> bool:
+        """Run poetry lock for a repository, returning whether it succeeded."""
+        cmd = ["poetry", "lock"]
+        if regenerate:
+            cmd.append("--regenerate")
+
+        try:
+            subprocess.run(
+                cmd,
+                cwd=repo.path,
+                check=True,
+                capture_output=True,
+                timeout=120 if regenerate else 60,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"{' '.join(cmd)} failed for {repo.name}: {e}")
+            return False
+        return True
+
     def _cleanup_orphaned_tags(
         self, repo: RepositoryConfig, backup_commit: str | None
     ) -> None:
@@ -1052,56 +1291,40 @@ class ReleaseCoordinator:
             return
 
         try:
-            # Get all tags
-            result = subprocess.run(
-                ["git", "tag", "-l"],
+            # Let git walk history once and stream only the tags whose
+            # commit is not reachable from HEAD, instead of materializing
+            # the full rev-list in memory (annotated tags are peeled)
+            cmd = [
+                "git",
+                "for-each-ref",
+                "--no-merged=HEAD",
+                "--format=%(refname:short)",
+                "refs/tags",
+            ]
+
+            with subprocess.Popen(
+                cmd,
                 cwd=repo.path,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                check=True,
-            )
+            ) as process:
+                orphaned_tags = [
+                    tag for line in process.stdout or () if (tag := line.strip())
+                ]
 
-            if not result.stdout.strip():
-                return
-
-            tags = result.stdout.strip().split("\n")
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, cmd)
 
-            for tag in tags:
-                if not tag.strip():
-                    continue
-
-                try:
-                    # Get the commit that the tag points to
-                    tag_commit_result = subprocess.run(
-                        ["git", "rev-list", "-n", "1", tag],
-                        cwd=repo.path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    tag_commit = tag_commit_result.stdout.strip()
-
-                    # Check if this commit is reachable from current HEAD
-                    reachable_result = subprocess.run(
-                        ["git", "merge-base", "--is-ancestor", tag_commit, "HEAD"],
-                        cwd=repo.path,
-                        capture_output=True,
-                        text=True,
-                    )
-
-                    # If exit code is not 0, the tag commit is not an ancestor of HEAD (orphaned)
-                    if reachable_result.returncode != 0:
-                        logger.warning(f"Removing orphaned tag {tag} from {repo.name}")
-                        subprocess.run(
-                            ["git", "tag", "-d", tag],
-                            cwd=repo.path,
-                            check=True,
-                            capture_output=True,
-                        )
-
-                except subprocess.CalledProcessError:
-                    # If we can't check this tag, skip it
-                    continue
+            if orphaned_tags:
+                for tag in orphaned_tags:
+                    logger.warning(f"Removing orphaned tag {tag} from {repo.name}")
+                subprocess.run(
+                    ["git", "tag", "-d", *orphaned_tags],
+                    cwd=repo.path,
+                    check=True,
+                    capture_output=True,
+                )
 
         except subprocess.CalledProcessError:
             logger.warning(f"Could not clean up orphaned tags in {repo.name}")
@@ -1113,9 +1336,11 @@ class ReleaseCoordinator:
         table.add_column("Status", style="green")
         table.add_column("Version", style="yellow")
 
+        repos_by_name = self._get_repositories_by_name()
+
         for repo_name, status in self.release_results.items():
-            repo = self.config_manager.get_repository(repo_name)
-            version = self._get_current_version(repo) if repo else "unknown"
+            repo = repos_by_name.get(repo_name)
+            version = self._get_cached_version(repo) if repo else "unknown"
 
             status_icon = {
                 ReleaseStatus.SUCCESS: "✓",
@@ -1142,20 +1367,36 @@ class ReleaseCoordinator:
         config = self.config_manager.load_config()
         status: dict[str, Any] = {"workspace": config.name, "repositories": []}
 
-        for repo in config.repositories:
-            repo_status = {
-                "name": repo.name,
-                "current_version": self._get_current_version(repo),
-                "last_release": self._get_last_release_info(repo),
-                "pending_changes": self._get_pending_changes(repo),
-            }
+        # Each repository's queries are independent subprocess calls, so run
+        # them concurrently; map() keeps the configured repository order
+        if config.repositories:
+            with ThreadPoolExecutor(
+                max_workers=min(32, len(config.repositories))
+            ) as executor:
+                status["repositories"] = list(
+                    executor.map(
+                        lambda repo: self._get_repository_status(repo, verbose),
+                        config.repositories,
+                    )
+                )
+
+        return status
 
-            if verbose:
-                repo_status["detailed_status"] = self._get_detailed_status(repo)
+    def _get_repository_status(
+        self, repo: RepositoryConfig, verbose: bool = False
+    ) -> dict[str, Any]:
+        """Get release status for a single repository."""
+        repo_status = {
+            "name": repo.name,
+            "current_version": self._get_cached_version(repo),
+            "last_release": self._get_last_release_info(repo),
+            "pending_changes": self._get_pending_changes(repo),
+        }
 
-            status["repositories"].append(repo_status)
+        if verbose:
+            repo_status["detailed_status"] = self._get_detailed_status(repo)
 
-        return status
+        return repo_status
 
     def _get_last_release_info(self, repo: RepositoryConfig) -> dict[str, str] | None:
         """Get information about the last release."""
@@ -1163,29 +1404,32 @@ class ReleaseCoordinator:
             return None
 
         try:
-            # Get latest tag
+            # Get latest tag reachable from HEAD and its commit date in one call
+            # (annotated tags report the date of the commit they point to)
             result = subprocess.run(
-                ["git", "describe", "--tags", "--abbrev=0"],
+                [
+                    "git",
+                    "for-each-ref",
+                    "--merged",
+                    "HEAD",
+                    "--sort=-creatordate",
+                    "--count=1",
+                    "--format=%(refname:short)%09%(committerdate:iso)%09%(*committerdate:iso)",
+                    "refs/tags",
+                ],
                 cwd=repo.path,
                 capture_output=True,
                 text=True,
                 check=True,
             )
 
-            tag = result.stdout.strip()
-
-            # Get tag date
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%cd", "--date=iso", tag],
-                cwd=repo.path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            output = result.stdout.strip("\n")
+            if not output:
+                return None
 
-            date = result.stdout.strip()
+            tag, commit_date, peeled_date = output.split("\t", 2)
 
-            return {"tag": tag, "date": date}
+            return {"tag": tag, "date": peeled_date or commit_date}
 
         except subprocess.CalledProcessError:
             return None
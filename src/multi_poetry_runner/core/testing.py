@@ -1,37 +1,307 @@
 """Testing functionality for MPR."""
 
+import atexit
+import functools
+import hashlib
+import io
 import json
+import os
+import re
+import shutil
 import subprocess
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
+from xml.etree import ElementTree
+
+from ..templates import (
+    BASIC_INTEGRATION_TEST_TEMPLATE,
+    DOCKER_COMPOSE_TEST_TEMPLATE,
+    DOCKERFILE_TEST_REPO_LAYER_TEMPLATE,
+    DOCKERFILE_TEST_TEMPLATE,
+)
+from ..utils.config import ConfigManager, RepositoryConfig, WorkspaceConfig
+from ..utils.logger import get_logger
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+if TYPE_CHECKING:
+    from rich.console import Console
 
-from ..utils.config import ConfigManager, RepositoryConfig
-from ..utils.logger import get_logger
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 logger = get_logger(__name__)
-console = Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=32)
+def _build_basic_integration_test(package_names: tuple[str, ...]) -> str:
+    """Render the basic integration test for a set of packages."""
+    module_names = [name.replace("-", "_") for name in package_names]
+    imports_block = "\n".join(f"    import {name}" for name in module_names)
+    asserts_block = "\n".join(f"    assert {name} is not None" for name in module_names)
+
+    return BASIC_INTEGRATION_TEST_TEMPLATE.format(
+        import_tests=f"{imports_block}\n\n{asserts_block}"
+    )
+
+
+@dataclass(frozen=True)
+class _TestCase:
+    """A test case read from a JUnit XML report."""
+
+    file: str
+    name: str
+    outcome: str  # passed, failed, skipped
+    duration: float
+
+
+def _read_junit_cases(junit_path: Path) -> list[_TestCase]:
+    """Stream the test cases out of a JUnit XML report."""
+    cases = []
+    for _, element in ElementTree.iterparse(junit_path):
+        if element.tag != "testcase":
+            continue
+
+        outcome = "passed"
+        for child in element:
+            if child.tag in ("failure", "error"):
+                outcome = "failed"
+                break
+            if child.tag == "skipped":
+                outcome = "skipped"
+
+        name = element.get("name", "")
+        classname = element.get("classname")
+        cases.append(
+            _TestCase(
+                file=element.get("file", ""),
+                name=f"{classname}::{name}" if classname else name,
+                outcome=outcome,
+                duration=float(element.get("time") or 0),
+            )
+        )
+        # Drop the parsed subtree to keep memory flat on large reports
+        element.clear()
+    return cases
+
+
+def _summarize_junit_cases(cases: list[_TestCase]) -> dict[str, Any]:
+    """Summarize test cases into counts, total duration and failing names."""
+    summary: dict[str, Any] = {
+        "passed": 0,
+        "failed": 0,
+        "skipped": 0,
+        "duration": 0.0,
+        "failing_names": [],
+    }
+    for case in cases:
+        summary[case.outcome] += 1
+        summary["duration"] += case.duration
+        if case.outcome == "failed":
+            summary["failing_names"].append(case.name)
+    summary["duration"] = round(summary["duration"], 3)
+    return summary
+
+
+@functools.cache
+def _find_executable(name: str) -> str | None:
+    """Locate an executable on PATH once per process."""
+    return shutil.which(name)
+
+
+# HTML report template, pre-split around the result rows
+_HTML_REPORT_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Test Report - {workspace}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; }}
+        .summary {{ margin: 20px 0; }}
+        .results {{ margin: 20px 0; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f2f2f2; }}
+        .passed {{ color: green; }}
+        .failed {{ color: red; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Test Report</h1>
+        <p><strong>Workspace:</strong> {workspace}</p>
+        <p><strong>Generated:</strong> {timestamp}</p>
+    </div>
+
+    <div class="summary">
+        <h2>Summary</h2>
+        <p>Total: {total}, Passed: <span class="passed">{passed}</span>, Failed: <span class="failed">{failed}</span></p>
+    </div>
+
+    <div class="results">
+        <h2>Results</h2>
+        <table>
+            <tr>
+                <th>Repository</th>
+                <th>Type</th>
+                <th>Status</th>
+                <th>Coverage</th>
+            </tr>
+            """
+
+_HTML_REPORT_ROW = """
+            <tr>
+                <td>{repo_name}</td>
+                <td>{test_type}</td>
+                <td class="{status_class}">{status_text}</td>
+                <td>{coverage_text}</td>
+            </tr>
+            """
+
+_HTML_REPORT_TAIL = """
+        </table>
+    </div>
+</body>
+</html>
+"""
+
+_DOCKER_COMPOSE_TEST = DOCKER_COMPOSE_TEST_TEMPLATE.strip()
+
+
+@dataclass(frozen=True)
+class _RepositoryLayout:
+    """Test-related entries found in a repository checkout."""
+
+    has_pyproject: bool = False
+    has_tests: bool = False
+    has_unit_dir: bool = False
+    has_integration_dir: bool = False
+
+
+def _scan_repository(path: Path) -> _RepositoryLayout | None:
+    """Inspect a repository with scandir, or return None if it does not exist."""
+    try:
+        with os.scandir(path) as entries:
+            top = {
+                entry.name: entry.is_dir()
+                for entry in entries
+                if entry.name in ("pyproject.toml", "tests")
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    test_dirs: set[str] = set()
+    if top.get("tests"):
+        try:
+            with os.scandir(path / "tests") as entries:
+                test_dirs = {
+                    entry.name
+                    for entry in entries
+                    if entry.name in ("unit", "integration") and entry.is_dir()
+                }
+        except OSError:
+            pass
+
+    return _RepositoryLayout(
+        has_pyproject="pyproject.toml" in top,
+        has_tests=top.get("tests", False),
+        has_unit_dir="unit" in test_dirs,
+        has_integration_dir="integration" in test_dirs,
+    )
+
+
+# Config files pytest reads, with the section holding its settings; None
+# means the file configures pytest whatever it contains
+_PYTEST_CONFIG_SECTIONS = {
+    "pytest.ini": None,
+    "pyproject.toml": re.compile(r"^\[tool\.pytest(?:\.ini_options)?\]", re.M),
+    "tox.ini": re.compile(r"^\[pytest\]", re.M),
+    "setup.cfg": re.compile(r"^\[tool:pytest\]", re.M),
+}
+
+
+def _has_pytest_config(path: Path) -> bool:
+    """Check whether a repository carries its own pytest configuration."""
+    for name, section in _PYTEST_CONFIG_SECTIONS.items():
+        try:
+            text = (path / name).read_text(encoding="utf-8", errors="replace")
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError:
+            # Unreadable config: assume it matters
+            return True
+        if section is None or section.search(text):
+            return True
+
+    return False
+
+
+# Workers mostly block on pytest subprocesses, so oversubscribe the CPUs
+_MAX_WORKERS = (os.cpu_count() or 4) * 2
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide test executor, creating it on first use."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="mpr-tests"
+            )
+            atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+        return _executor
 
 
 class ExecutorService:
     """Executes various types of tests across repositories."""
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        use_cache: bool = True,
+        show_progress: bool | None = None,
+    ):
         self.config_manager = config_manager
+        # None means show the spinner only on an interactive terminal
+        self.show_progress = show_progress
         self.workspace_root = config_manager.workspace_root
         self.test_results: dict[str, dict[str, Any]] = {}
-
-    def run_unit_tests(self, parallel: bool = False, coverage: bool = False) -> bool:
+        self.use_cache = use_cache
+        self.cached_repositories: set[str] = set()
+        self._state_path = self.workspace_root / ".mpr_cache" / "test_state.json"
+        self._test_state: dict[str, dict[str, Any]] | None = None
+        self._state_lock = threading.Lock()
+        self._junit_summaries: dict[str, dict[str, Any]] = {}
+
+    def run_unit_tests(
+        self, parallel: bool = False, coverage: bool = False, batch: bool = False
+    ) -> bool:
         """Run unit tests in all repositories."""
         config = self.config_manager.load_config()
 
-        console.print("\n[bold]Running unit tests...[/bold]")
+        _console().print("\n[bold]Running unit tests...[/bold]")
 
-        if parallel:
+        if batch:
+            return self._run_tests_batched(config.repositories, "unit", coverage)
+        elif parallel:
             return self._run_tests_parallel(config.repositories, "unit", coverage)
         else:
             return self._run_tests_sequential(config.repositories, "unit", coverage)
@@ -43,7 +313,7 @@ class ExecutorService:
         junit_output: bool = False,
     ) -> bool:
         """Run integration tests."""
-        console.print("\n[bold]Running integration tests...[/bold]")
+        _console().print("\n[bold]Running integration tests...[/bold]")
 
         if environment == "docker":
             return self._run_integration_tests_docker(junit_output)
@@ -58,34 +328,53 @@ class ExecutorService:
     ) -> bool:
         """Run tests sequentially across repositories."""
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(
-                f"Running {test_type} tests...", total=len(repositories)
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        console = _console()
+        show_progress = (
+            console.is_terminal if self.show_progress is None else self.show_progress
+        )
+        progress = (
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
             )
+            if show_progress
+            else None
+        )
 
-            all_passed = True
+        all_passed = True
 
-            for repo in repositories:
-                if not repo.path.exists():
+        with progress or nullcontext():
+            task = (
+                progress.add_task(
+                    f"Running {test_type} tests...", total=len(repositories)
+                )
+                if progress
+                else None
+            )
+
+            for index, repo in enumerate(repositories, start=1):
+                layout = _scan_repository(repo.path)
+                if layout is None:
                     continue
 
-                progress.update(task, description=f"Testing {repo.name}...")
+                if progress and task is not None:
+                    progress.update(task, description=f"Testing {repo.name}...")
+                else:
+                    logger.info(f"[{index}/{len(repositories)}] Testing {repo.name}")
 
-                success = self._run_repository_tests(repo, test_type, coverage)
-                self.test_results[repo.name] = {
-                    "type": test_type,
-                    "success": success,
-                    "coverage": coverage,
-                }
+                success = self._run_repository_tests(repo, test_type, coverage, layout)
+                self.test_results[repo.name] = self._make_result(
+                    repo.name, test_type, success, coverage
+                )
 
                 if not success:
                     all_passed = False
 
-                progress.advance(task)
+                if progress and task is not None:
+                    progress.advance(task)
 
         self._print_test_results()
 
@@ -99,94 +388,135 @@ class ExecutorService:
     ) -> bool:
         """Run tests in parallel across repositories."""
 
-        console.print(f"Running {test_type} tests in parallel...")
+        _console().print(f"Running {test_type} tests in parallel...")
 
         all_passed = True
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {
-                executor.submit(
-                    self._run_repository_tests, repo, test_type, coverage
-                ): repo
-                for repo in repositories
-                if repo.path.exists()
-            }
+        executor = _get_executor()
+        futures = {}
+        for repo in repositories:
+            layout = _scan_repository(repo.path)
+            if layout is None:
+                continue
+            future = executor.submit(
+                self._run_repository_tests, repo, test_type, coverage, layout
+            )
+            futures[future] = repo
 
-            for future in as_completed(futures):
-                repo = futures[future]
+        for future in as_completed(futures):
+            repo = futures[future]
 
-                try:
-                    success = future.result()
-                    self.test_results[repo.name] = {
-                        "type": test_type,
-                        "success": success,
-                        "coverage": coverage,
-                    }
-
-                    if not success:
-                        all_passed = False
-
-                except Exception as e:
-                    logger.error(f"Error running tests for {repo.name}: {e}")
-                    self.test_results[repo.name] = {
-                        "type": test_type,
-                        "success": False,
-                        "error": str(e),
-                    }
+            try:
+                success = future.result()
+                self.test_results[repo.name] = self._make_result(
+                    repo.name, test_type, success, coverage
+                )
+
+                if not success:
                     all_passed = False
 
+            except Exception as e:
+                logger.error(f"Error running tests for {repo.name}: {e}")
+                self.test_results[repo.name] = {
+                    "type": test_type,
+                    "success": False,
+                    "error": str(e),
+                }
+                all_passed = False
+
         self._print_test_results()
 
         return all_passed
 
     def _run_repository_tests(
-        self, repo: RepositoryConfig, test_type: str, coverage: bool = False
+        self,
+        repo: RepositoryConfig,
+        test_type: str,
+        coverage: bool = False,
+        layout: _RepositoryLayout | None = None,
     ) -> bool:
         """Run tests for a single repository."""
+        if layout is None:
+            layout = _scan_repository(repo.path) or _RepositoryLayout()
 
-        if not (repo.path / "pyproject.toml").exists():
+        if not layout.has_pyproject:
             logger.warning(f"No pyproject.toml found in {repo.name}, skipping tests")
 
             return True
 
         # Check if tests directory exists
-        tests_dir = repo.path / "tests"
-
-        if not tests_dir.exists():
+        if not layout.has_tests:
             logger.info(f"No tests directory in {repo.name}, skipping")
 
             return True
 
-        # Build pytest command
-        cmd = ["poetry", "run", "pytest", "-v"]
-
-        if coverage:
-            cmd.extend(["--cov", "--cov-report=term", "--cov-report=xml"])
+        # Build pytest arguments
+        cmd = self._pytest_options(coverage)
 
         # Add specific test directory if needed
+        test_target = self._get_test_target(repo, test_type, layout)
+        if test_target is not None:
+            cmd.append(str(test_target))
+
+        # Skip repositories whose sources are unchanged since the last green run
+        fingerprint = None
+        if self.use_cache and not coverage:
+            fingerprint = self._source_fingerprint(repo)
+            if self._is_cached_success(repo.name, test_type, fingerprint):
+                logger.info(f"✓ No changes since last passing run for {repo.name}")
+                self.cached_repositories.add(repo.name)
 
-        if test_type == "unit":
-            if (tests_dir / "unit").exists():
-                cmd.append(str(tests_dir / "unit"))
-            else:
-                cmd.append(str(tests_dir))
-        elif test_type == "integration":
-            if (tests_dir / "integration").exists():
-                cmd.append(str(tests_dir / "integration"))
+                return True
+
+        # Run pytest from the repository's virtualenv directly when known,
+        # skipping the Poetry startup that `poetry run` pays on every call
+        venv_python = self._get_venv_python(repo)
+        if venv_python is not None:
+            cmd = [venv_python, "-m", "pytest", *cmd]
+        else:
+            cmd = ["poetry", "run", "pytest", *cmd]
+
+        # Stream output to a log file instead of buffering it in memory and
+        # collect per-test results from a JUnit report
+        log_dir = self.workspace_root / "logs" / "tests"
+        log_path = log_dir / f"{repo.name}.log"
+        junit_path = self.workspace_root / ".mpr_cache" / f"{repo.name}.junit.xml"
+        cmd.append(f"--junitxml={junit_path}")
 
         try:
-            result = subprocess.run(
-                cmd, cwd=repo.path, capture_output=True, text=True, timeout=600
-            )
+            log_dir.mkdir(parents=True, exist_ok=True)
+            junit_path.parent.mkdir(parents=True, exist_ok=True)
+            junit_path.unlink(missing_ok=True)
+
+            with open(log_path, "wb") as log_file:
+                result = subprocess.run(
+                    cmd,
+                    cwd=repo.path,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    timeout=600,
+                )
+
+            summary = self._read_junit_summary(junit_path)
+            if summary is not None:
+                self._junit_summaries[repo.name] = summary
 
             if result.returncode == 0:
                 logger.info(f"✓ Tests passed for {repo.name}")
+                if fingerprint is not None:
+                    self._record_test_success(repo.name, test_type, fingerprint)
 
                 return True
             else:
-                logger.error(f"✗ Tests failed for {repo.name}")
-                logger.error(result.stdout)
-                logger.error(result.stderr)
+                logger.error(
+                    f"✗ Tests failed for {repo.name} (full output: {log_path})"
+                )
+                if summary is not None and summary["failing_names"]:
+                    for name in summary["failing_names"]:
+                        logger.error(f"  FAILED {name}")
+                else:
+                    # No per-test failures, e.g. a collection error
+                    logger.error(self._read_log_tail(log_path))
 
                 return False
 
@@ -199,6 +529,386 @@ class ExecutorService:
 
             return False
 
+    def _read_junit_summary(self, junit_path: Path) -> dict[str, Any] | None:
+        """Summarize a JUnit XML report, or None if it is missing or invalid."""
+        if not junit_path.is_file():
+            return None
+
+        try:
+            return _summarize_junit_cases(_read_junit_cases(junit_path))
+        except (OSError, ElementTree.ParseError):
+            return None
+
+    def _pytest_options(self, coverage: bool) -> list[str]:
+        """Get the pytest options shared by every test run."""
+        options = [
+            "-q",
+            "--tb=line",
+            "--no-header",
+            "-o",
+            "console_output_style=count",
+        ]
+
+        if coverage:
+            options.extend(["--cov", "--cov-report=term", "--cov-report=xml"])
+
+        return options
+
+    def _get_test_target(
+        self, repo: RepositoryConfig, test_type: str, layout: _RepositoryLayout
+    ) -> Path | None:
+        """Get the test directory to run for a test type, if any."""
+        tests_dir = repo.path / "tests"
+
+        if test_type == "unit":
+            return tests_dir / "unit" if layout.has_unit_dir else tests_dir
+        if test_type == "integration" and layout.has_integration_dir:
+            return tests_dir / "integration"
+
+        return None
+
+    def _run_tests_batched(
+        self,
+        repositories: list[RepositoryConfig],
+        test_type: str,
+        coverage: bool = False,
+    ) -> bool:
+        """Run tests with one pytest process per shared virtualenv.
+
+        Repositories without a resolvable virtualenv, alone in theirs, or
+        with their own pytest configuration are tested individually, since
+        a batch runs with the workspace as rootdir and ignores that config.
+        """
+        _console().print(f"Running {test_type} tests in batches...")
+
+        all_passed = True
+        layouts: dict[str, _RepositoryLayout] = {}
+        single: list[RepositoryConfig] = []
+        groups: dict[str, list[tuple[RepositoryConfig, Path, str | None]]] = {}
+
+        for repo in repositories:
+            layout = _scan_repository(repo.path)
+            if layout is None:
+                continue
+            layouts[repo.name] = layout
+
+            venv_python = None
+            if (
+                layout.has_pyproject
+                and layout.has_tests
+                and not _has_pytest_config(repo.path)
+            ):
+                venv_python = self._get_venv_python(repo)
+            if venv_python is None:
+                single.append(repo)
+                continue
+
+            fingerprint = None
+            if self.use_cache and not coverage:
+                fingerprint = self._source_fingerprint(repo)
+                if self._is_cached_success(repo.name, test_type, fingerprint):
+                    logger.info(f"✓ No changes since last passing run for {repo.name}")
+                    self.cached_repositories.add(repo.name)
+                    self.test_results[repo.name] = self._make_result(
+                        repo.name, test_type, True, coverage
+                    )
+                    continue
+
+            target = self._get_test_target(repo, test_type, layout) or repo.path
+            groups.setdefault(venv_python, []).append((repo, target, fingerprint))
+
+        for venv_python, members in groups.items():
+            outcomes = None
+            if len(members) > 1:
+                outcomes = self._run_pytest_batch(venv_python, members, coverage)
+
+            if outcomes is None:
+                # Batch not possible or pytest itself failed: test one by one
+                single.extend(repo for repo, _, _ in members)
+                continue
+
+            for repo, _, fingerprint in members:
+                success = outcomes.get(repo.name, True)
+                if success:
+                    logger.info(f"✓ Tests passed for {repo.name}")
+                    if fingerprint is not None:
+                        self._record_test_success(repo.name, test_type, fingerprint)
+                else:
+                    logger.error(f"✗ Tests failed for {repo.name}")
+                    all_passed = False
+                self.test_results[repo.name] = self._make_result(
+                    repo.name, test_type, success, coverage
+                )
+
+        for repo in single:
+            success = self._run_repository_tests(
+                repo, test_type, coverage, layouts[repo.name]
+            )
+            self.test_results[repo.name] = self._make_result(
+                repo.name, test_type, success, coverage
+            )
+            if not success:
+                all_passed = False
+
+        self._print_test_results()
+
+        return all_passed
+
+    def _run_pytest_batch(
+        self,
+        venv_python: str,
+        members: list[tuple[RepositoryConfig, Path, str | None]],
+        coverage: bool,
+    ) -> dict[str, bool] | None:
+        """Run one pytest process over several repositories.
+
+        Returns per-repository success, or None if the batch did not
+        produce usable results.
+        """
+        log_dir = self.workspace_root / "logs" / "tests"
+        batch_id = hashlib.sha1(
+            venv_python.encode(), usedforsecurity=False
+        ).hexdigest()[:12]
+        log_path = log_dir / f"batch-{batch_id}.log"
+        junit_path = log_dir / f"batch-{batch_id}.xml"
+
+        cmd = [
+            venv_python,
+            "-m",
+            "pytest",
+            *self._pytest_options(coverage),
+            "-o",
+            "addopts=",
+            "-o",
+            "junit_family=xunit1",
+            "--import-mode=importlib",
+            f"--rootdir={self.workspace_root}",
+            f"--junitxml={junit_path}",
+            *(str(target) for _, target, _ in members),
+        ]
+
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            junit_path.unlink(missing_ok=True)
+
+            with open(log_path, "wb") as log_file:
+                result = subprocess.run(
+                    cmd,
+                    cwd=self.workspace_root,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    timeout=600 * len(members),
+                )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Batched test run failed: {e}")
+            return None
+
+        # 0: passed, 1: some tests failed, 5: nothing collected
+        if result.returncode not in (0, 1, 5):
+            logger.warning(
+                f"Batched test run exited with {result.returncode}, "
+                f"retrying repositories individually (see {log_path})"
+            )
+            return None
+
+        try:
+            cases = _read_junit_cases(junit_path)
+        except (OSError, ElementTree.ParseError) as e:
+            logger.warning(f"Could not read batched test results: {e}")
+            return None
+
+        prefixes = {
+            repo.name: Path(os.path.relpath(repo.path, self.workspace_root)).as_posix()
+            + "/"
+            for repo, _, _ in members
+        }
+        repo_cases: dict[str, list[_TestCase]] = {name: [] for name in prefixes}
+        for case in cases:
+            for repo_name, prefix in prefixes.items():
+                if case.file.startswith(prefix):
+                    repo_cases[repo_name].append(case)
+                    break
+
+        outcomes = {}
+        for repo_name, cases_for_repo in repo_cases.items():
+            summary = _summarize_junit_cases(cases_for_repo)
+            self._junit_summaries[repo_name] = summary
+            outcomes[repo_name] = summary["failed"] == 0
+
+        if result.returncode == 1:
+            logger.error(f"Batched test run had failures (full output: {log_path})")
+
+        if result.returncode == 1 and all(outcomes.values()):
+            # Failures that could not be attributed to a repository
+            return None
+
+        return outcomes
+
+    def _get_venv_python(self, repo: RepositoryConfig) -> str | None:
+        """Get the repository's virtualenv interpreter, caching its location."""
+        cache_path = self.workspace_root / ".mpr_cache" / f"{repo.name}.venv"
+        bin_dir, python_name = (
+            ("Scripts", "python.exe") if os.name == "nt" else ("bin", "python")
+        )
+
+        try:
+            venv_path = cache_path.read_text().strip()
+        except OSError:
+            venv_path = ""
+
+        if not venv_path or not os.path.isfile(
+            os.path.join(venv_path, bin_dir, python_name)
+        ):
+            try:
+                result = subprocess.run(
+                    ["poetry", "env", "info", "-p"],
+                    cwd=repo.path,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+
+            venv_path = result.stdout.strip() if result.returncode == 0 else ""
+            if not venv_path or not os.path.isfile(
+                os.path.join(venv_path, bin_dir, python_name)
+            ):
+                return None
+
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(venv_path)
+            except OSError as e:
+                logger.debug(f"Could not cache virtualenv for {repo.name}: {e}")
+
+        return os.path.join(venv_path, bin_dir, python_name)
+
+    def _make_result(
+        self, repo_name: str, test_type: str, success: bool, coverage: bool
+    ) -> dict[str, Any]:
+        """Build the result entry for a repository test run."""
+        result: dict[str, Any] = {
+            "type": test_type,
+            "success": success,
+            "coverage": coverage,
+        }
+        if repo_name in self.cached_repositories:
+            result["cached"] = True
+        elif repo_name in self._junit_summaries:
+            result["tests"] = self._junit_summaries[repo_name]
+        return result
+
+    def _source_fingerprint(self, repo: RepositoryConfig) -> str:
+        """Fingerprint a repository with its workspace dependencies.
+
+        A change in any repository the tests depend on, directly or through
+        other workspace repositories, changes the fingerprint too.
+        """
+        own = self._fingerprint_files(repo.path)
+        if not repo.dependencies:
+            return own
+
+        by_name = {r.name: r for r in self.config_manager.load_config().repositories}
+        upstream: set[str] = set()
+        pending = list(repo.dependencies)
+        while pending:
+            name = pending.pop()
+            if name == repo.name or name in upstream or name not in by_name:
+                continue
+            upstream.add(name)
+            pending.extend(by_name[name].dependencies)
+        if not upstream:
+            return own
+
+        try:
+            order = [
+                name
+                for name in self.config_manager.get_dependency_order()
+                if name in upstream
+            ]
+        except ValueError:
+            order = sorted(upstream)
+
+        digest = hashlib.sha1(own.encode(), usedforsecurity=False)
+        for name in order:
+            fingerprint = self._fingerprint_files(by_name[name].path)
+            digest.update(f"{name}\0{fingerprint}\n".encode())
+        return digest.hexdigest()
+
+    def _fingerprint_files(self, path: Path) -> str:
+        """Fingerprint the sources of one repository from file stats."""
+        digest = hashlib.sha1(usedforsecurity=False)
+
+        for root, dirs, files in os.walk(path):
+            # Skip VCS metadata, virtualenvs, caches and other hidden dirs
+            dirs[:] = sorted(
+                d for d in dirs if not d.startswith(".") and d != "__pycache__"
+            )
+            for name in sorted(files):
+                if not name.endswith(".py") and name not in (
+                    "pyproject.toml",
+                    "poetry.lock",
+                ):
+                    continue
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                rel_path = os.path.relpath(file_path, path)
+                digest.update(
+                    f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode()
+                )
+
+        return digest.hexdigest()
+
+    def _load_test_state(self) -> dict[str, dict[str, Any]]:
+        """Load the last successful test runs, once per service."""
+        if self._test_state is None:
+            try:
+                self._test_state = json.loads(self._state_path.read_text())
+            except (OSError, ValueError):
+                self._test_state = {}
+        return self._test_state
+
+    def _is_cached_success(
+        self, repo_name: str, test_type: str, fingerprint: str
+    ) -> bool:
+        """Check whether the last passing run saw the same sources."""
+        with self._state_lock:
+            entry = self._load_test_state().get(repo_name, {}).get(test_type, {})
+        return bool(entry.get("last_hash") == fingerprint)
+
+    def _record_test_success(
+        self, repo_name: str, test_type: str, fingerprint: str
+    ) -> None:
+        """Remember a passing run so unchanged sources can skip tests."""
+        with self._state_lock:
+            state = self._load_test_state()
+            state.setdefault(repo_name, {})[test_type] = {
+                "last_hash": fingerprint,
+                "last_success_ts": datetime.now().isoformat(),
+            }
+
+            try:
+                self._state_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._state_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(state, indent=2))
+                os.replace(tmp_path, self._state_path)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Could not save test state: {e}")
+
+    def _read_log_tail(self, log_path: Path, max_bytes: int = 16 * 1024) -> str:
+        """Read the last ``max_bytes`` of a test log."""
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - max_bytes))
+                return f.read().decode(errors="replace")
+        except OSError:
+            return ""
+
     def _run_integration_tests_local(
         self, parallel: bool = False, junit_output: bool = False
     ) -> bool:
@@ -219,14 +929,20 @@ class ExecutorService:
             cmd.extend(["--junit-output"])
 
         try:
+            # Only stderr is needed, and only to report a failure
             result = subprocess.run(
                 cmd,
                 cwd=self.workspace_root,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=1800,  # 30 minutes
             )
 
+            if result.returncode != 0:
+                logger.error("Integration tests failed")
+                if result.stderr:
+                    logger.error(result.stderr.decode(errors="replace"))
+
             return result.returncode == 0
 
         except subprocess.TimeoutExpired:
@@ -243,13 +959,17 @@ class ExecutorService:
 
         # Check if Docker is available
 
-        try:
-            subprocess.run(["docker", "--version"], check=True, capture_output=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if _find_executable("docker") is None:
             logger.error("Docker is not available")
 
             return False
 
+        docker_compose = _find_executable("docker-compose")
+        if docker_compose is None:
+            logger.error("docker-compose is not available")
+
+            return False
+
         # Look for docker-compose test configuration
         docker_compose_test = self.workspace_root / "docker-compose.test.yml"
 
@@ -261,7 +981,7 @@ class ExecutorService:
             # Build and run tests
             result = subprocess.run(
                 [
-                    "docker-compose",
+                    docker_compose,
                     "-f",
                     "docker-compose.test.yml",
                     "up",
@@ -269,18 +989,29 @@ class ExecutorService:
                     "--abort-on-container-exit",
                 ],
                 cwd=self.workspace_root,
-                capture_output=True,
-                text=True,
+                env={
+                    **os.environ,
+                    "DOCKER_BUILDKIT": "1",
+                    "COMPOSE_DOCKER_CLI_BUILD": "1",
+                },
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=1800,
             )
 
             # Clean up
             subprocess.run(
-                ["docker-compose", "-f", "docker-compose.test.yml", "down"],
+                [docker_compose, "-f", "docker-compose.test.yml", "down"],
                 cwd=self.workspace_root,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
+            if result.returncode != 0:
+                logger.error("Docker integration tests failed")
+                if result.stderr:
+                    logger.error(result.stderr.decode(errors="replace"))
+
             return result.returncode == 0
 
         except subprocess.TimeoutExpired:
@@ -337,106 +1068,37 @@ class ExecutorService:
         basic_test = test_dir / "test_basic_integration.py"
 
         if not basic_test.exists():
-            basic_test.write_text(self._get_basic_integration_test_template())
+            basic_test.write_text(self._get_basic_integration_test_template(config))
 
     def _create_default_docker_config(self) -> None:
         """Create default Docker test configuration."""
-        docker_compose_content = """
-version: '3.8'
-
-services:
-  test-runner:
-    build:
-      context: .
-      dockerfile: Dockerfile.test
-    volumes:
-      - ./tests:/tests
-      - ./reports:/reports
-    environment:
-      - PYTHONPATH=/app
-    command: |
-      python -m pytest /tests/integration
-      --junit-xml=/reports/results.xml
-      --html=/reports/report.html
-      --self-contained-html
-"""
-
-        dockerfile_content = f"""
-FROM python:{self.config_manager.load_config().python_version}-slim
-
-WORKDIR /app
-
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
-    git \\
-    build-essential \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install Poetry
-RUN pip install poetry
-
-# Copy workspace
-COPY . .
-
-# Install all packages
-RUN poetry config virtualenvs.create false
-RUN for dir in repos/*/; do \\
-        if [ -f "$dir/pyproject.toml" ]; then \\
-            cd "$dir" && poetry install && cd /app; \\
-        fi \\
-    done
-
-# Install test dependencies
-RUN pip install pytest pytest-html pytest-timeout
-"""
+        config = self.config_manager.load_config()
+        repo_layers = "".join(
+            DOCKERFILE_TEST_REPO_LAYER_TEMPLATE.format(name=repo.name)
+            for repo in config.repositories
+            if (repo.path / "pyproject.toml").is_file()
+        )
 
         # Write files
         (self.workspace_root / "docker-compose.test.yml").write_text(
-            docker_compose_content.strip()
+            _DOCKER_COMPOSE_TEST
+        )
+        (self.workspace_root / "Dockerfile.test").write_text(
+            DOCKERFILE_TEST_TEMPLATE.format(
+                python_version=config.python_version, repo_layers=repo_layers
+            ).strip()
         )
-        (self.workspace_root / "Dockerfile.test").write_text(dockerfile_content.strip())
 
-    def _get_basic_integration_test_template(self) -> str:
+    def _get_basic_integration_test_template(
+        self, config: WorkspaceConfig | None = None
+    ) -> str:
         """Get template for basic integration test."""
-        config = self.config_manager.load_config()
-
-        imports = []
-        test_code = []
-
-        for repo in config.repositories:
-            # Generate import statement
-            package_name = repo.package_name.replace("-", "_")
-            imports.append(f"    import {package_name}")
-
-            # Generate basic test code
-            test_code.append(f"    assert {package_name} is not None")
-
-        template = f'''"""Basic integration tests."""
-
-import pytest
-
-
-def test_package_imports():
-    """Test that all packages can be imported."""
-{chr(10).join(imports)}
-
-{chr(10).join(test_code)}
-
-
-def test_basic_functionality():
-    """Test basic functionality across packages."""
-    # TODO: Add specific tests for your workflow
-    pass
+        if config is None:
+            config = self.config_manager.load_config()
 
-
-@pytest.mark.asyncio
-async def test_async_operations():
-    """Test async operations if applicable."""
-    # TODO: Add async tests if needed
-    pass
-'''
-
-        return template
+        return _build_basic_integration_test(
+            tuple(repo.package_name for repo in config.repositories)
+        )
 
     def _print_test_results(self) -> None:
         """Print test results in a formatted table."""
@@ -444,21 +1106,31 @@ async def test_async_operations():
         if not self.test_results:
             return
 
-        # Less rich-dependent output
+        # Less rich-dependent output, counting passes in the same pass
         logger.info("Test Results:")
+        passed_tests = 0
         for repo_name, result in self.test_results.items():
-            status = "PASSED" if result["success"] else "FAILED"
+            if result["success"]:
+                passed_tests += 1
+                status = "PASSED"
+            else:
+                status = "FAILED"
             logger.info(f"{repo_name}: {status} ({result['type']} tests)")
 
         # Calculate summary
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results.values() if r["success"])
         failed_tests = total_tests - passed_tests
 
         logger.info(
             f"Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed"
         )
 
+    def _summarize_results(self) -> dict[str, int]:
+        """Count total, passed and failed results in a single pass."""
+        total = len(self.test_results)
+        passed = sum(bool(result["success"]) for result in self.test_results.values())
+        return {"total": total, "passed": passed, "failed": total - passed}
+
     def generate_test_report(self, output_format: str = "json") -> Path | None:
         """Generate a test report."""
 
@@ -469,13 +1141,7 @@ async def test_async_operations():
             "timestamp": str(datetime.now()),
             "workspace": self.config_manager.load_config().name,
             "results": self.test_results,
-            "summary": {
-                "total": len(self.test_results),
-                "passed": sum(1 for r in self.test_results.values() if r["success"]),
-                "failed": sum(
-                    1 for r in self.test_results.values() if not r["success"]
-                ),
-            },
+            "summary": self._summarize_results(),
         }
 
         # Ensure reports directory exists
@@ -484,12 +1150,19 @@ async def test_async_operations():
 
         if output_format == "json":
             report_path = reports_dir / "test-report.json"
-            with open(report_path, "w") as f:
-                json.dump(report_data, f, indent=2)
+            if orjson is not None:
+                report_path.write_bytes(
+                    orjson.dumps(
+                        report_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+            else:
+                report_path.write_text(json.dumps(report_data, indent=2))
         elif output_format == "html":
             report_path = reports_dir / "test-report.html"
-            html_content = self._generate_html_report(report_data)
-            report_path.write_text(html_content)
+            with open(report_path, "w", encoding="utf-8") as f:
+                self._write_html_report(report_data, f)
         else:
             logger.error(f"Unsupported report format: {output_format}")
 
@@ -501,74 +1174,36 @@ async def test_async_operations():
 
     def _generate_html_report(self, report_data: dict[str, Any]) -> str:
         """Generate HTML test report."""
-
-        html_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Test Report - {workspace}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 5px; }}
-        .summary {{ margin: 20px 0; }}
-        .results {{ margin: 20px 0; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        .passed {{ color: green; }}
-        .failed {{ color: red; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Test Report</h1>
-        <p><strong>Workspace:</strong> {workspace}</p>
-        <p><strong>Generated:</strong> {timestamp}</p>
-    </div>
-
-    <div class="summary">
-        <h2>Summary</h2>
-        <p>Total: {total}, Passed: <span class="passed">{passed}</span>, Failed: <span class="failed">{failed}</span></p>
-    </div>
-
-    <div class="results">
-        <h2>Results</h2>
-        <table>
-            <tr>
-                <th>Repository</th>
-                <th>Type</th>
-                <th>Status</th>
-                <th>Coverage</th>
-            </tr>
-            {rows}
-        </table>
-    </div>
-</body>
-</html>
-"""
-
-        rows = []
+        buffer = io.StringIO()
+        self._write_html_report(report_data, buffer)
+        return buffer.getvalue()
+
+    def _write_html_report(self, report_data: dict[str, Any], out: TextIO) -> None:
+        """Write HTML test report incrementally, one row at a time."""
+
+        out.write(
+            _HTML_REPORT_HEAD.format(
+                workspace=report_data["workspace"],
+                timestamp=report_data["timestamp"],
+                total=report_data["summary"]["total"],
+                passed=report_data["summary"]["passed"],
+                failed=report_data["summary"]["failed"],
+            )
+        )
 
         for repo_name, result in report_data["results"].items():
             status_class = "passed" if result["success"] else "failed"
             status_text = "✓ Passed" if result["success"] else "✗ Failed"
             coverage_text = "✓" if result.get("coverage") else ""
 
-            row = f"""
-            <tr>
-                <td>{repo_name}</td>
-                <td>{result["type"]}</td>
-                <td class="{status_class}">{status_text}</td>
-                <td>{coverage_text}</td>
-            </tr>
-            """
-            rows.append(row)
-
-        return html_template.format(
-            workspace=report_data["workspace"],
-            timestamp=report_data["timestamp"],
-            total=report_data["summary"]["total"],
-            passed=report_data["summary"]["passed"],
-            failed=report_data["summary"]["failed"],
-            rows="".join(rows),
-        )
+            out.write(
+                _HTML_REPORT_ROW.format(
+                    repo_name=repo_name,
+                    test_type=result["type"],
+                    status_class=status_class,
+                    status_text=status_text,
+                    coverage_text=coverage_text,
+                )
+            )
+
+        out.write(_HTML_REPORT_TAIL)
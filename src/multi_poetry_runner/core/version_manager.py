@@ -1,29 +1,315 @@
 """Advanced version management functionality for coordinated releases."""
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import json
+import os
 import re
 import subprocess
+import threading
+import tomllib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, NamedTuple
 
-import toml
+import tomli_w
 from rich.console import Console
 from rich.table import Table
 
-from ..utils.config import ConfigManager, RepositoryConfig
+from ..utils.config import ConfigManager, RepositoryConfig, WorkspaceConfig
 from ..utils.logger import get_logger
+from ..utils.process import run_async
+from ..utils.pyproject import PyprojectCache, package_name_variants
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 logger = get_logger(__name__)
 console = Console()
 
+# Number of version history entries kept, and the file size that triggers
+# trimming the history down to them
+_HISTORY_LIMIT = 100
+_HISTORY_TRIM_BYTES = 64 * 1024
+
+_POETRY_HEADER_RE = re.compile(r"^\[tool\.poetry\][ \t]*$", re.MULTILINE)
+_TABLE_HEADER_RE = re.compile(r"^[ \t]*\[", re.MULTILINE)
+_PROJECT_VERSION_RE = re.compile(
+    r"""^(\s*version\s*=\s*)("[^"\n]*"|'[^'\n]*')""", re.MULTILINE
+)
+
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-alpha\.(\d+))?(?:\+.*)?$")
+
+# Operators of requirements that the version itself satisfies, e.g. "^", "~="
+# or ">="; exclusions like "!=" or "<" are kept so they never look in sync
+_VERSION_PREFIX_RE = re.compile(r"^(?:~=|==|>=|\^|~)\s*")
+
+
+def _parse_version(version: str) -> tuple[int, int, int, int] | None:
+    """Parse "X.Y.Z[-alpha.N][+meta]" into (major, minor, patch, alpha).
+
+    The alpha number is 0 for non-alpha versions. Returns None if the
+    version is not in a supported format.
+    """
+    # Plain string splitting handles the common shapes without the regex
+    core, _, meta = version.partition("+")
+    base, sep, pre = core.partition("-")
+    parts = base.split(".")
+    if len(parts) == 3 and all(part.isdecimal() for part in parts) and "\n" not in meta:
+        if not sep:
+            return int(parts[0]), int(parts[1]), int(parts[2]), 0
+        alpha = pre[6:]
+        if pre.startswith("alpha.") and alpha.isdecimal():
+            return int(parts[0]), int(parts[1]), int(parts[2]), int(alpha)
+
+    match = _VERSION_RE.match(version)
+    if not match:
+        return None
+
+    major, minor, patch, alpha = match.groups()
+    return int(major), int(minor), int(patch), int(alpha) if alpha else 0
+
+
+def _dump_history_line(entry: dict[str, Any]) -> bytes:
+    """Serialize a version history entry as one JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry, default=datetime.isoformat) + "\n").encode()
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON data, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_tail_lines(path: Path, limit: int, block_size: int = 8192) -> list[bytes]:
+    """Read the last non-empty lines of a file, seeking back from its end."""
+    if limit <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        # One extra newline so the first kept line is known to be complete
+        while position > 0 and data.count(b"\n") <= limit:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = [line for line in data.splitlines() if line.strip()]
+    if position > 0:
+        # The first line may have been cut at the block boundary
+        lines = lines[1:]
+    return lines[-limit:]
+
+
+def _replace_project_version(text: str, version: str) -> str | None:
+    """Rewrite the version string in the [tool.poetry] table in place.
+
+    Returns None when the version cannot be located unambiguously.
+    """
+    header = _POETRY_HEADER_RE.search(text)
+    if header is None:
+        return None
+
+    next_header = _TABLE_HEADER_RE.search(text, header.end())
+    end = next_header.start() if next_header else len(text)
+    section = text[header.end() : end]
+
+    matches = list(_PROJECT_VERSION_RE.finditer(section))
+    if len(matches) != 1:
+        return None
+
+    start, stop = matches[0].span(2)
+    return f'{text[: header.end() + start]}"{version}"{text[header.end() + stop :]}'
+
+
+def _poetry_version(pyproject_data: dict[str, Any]) -> str | None:
+    """Get the [tool.poetry] version from parsed pyproject.toml data."""
+    version = pyproject_data.get("tool", {}).get("poetry", {}).get("version")
+    return str(version) if version is not None else None
+
+
+def _file_digest(path: Path) -> bytes | None:
+    """Hash a file's contents, or None if it cannot be read."""
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+    except OSError:
+        return None
+
+
+def _major_minor(version: str) -> tuple[str, str, str]:
+    """Split off the major and minor parts of a version string."""
+    major, sep, rest = version.partition(".")
+    return major, sep, rest.partition(".")[0]
+
+
+@functools.lru_cache(maxsize=1024)
+def _calc_new_version(current_version: str, bump_type: str, alpha: bool) -> str:
+    """Calculate new version based on current version and bump type."""
+    # Validate bump type
+    valid_bump_types = {"patch", "minor", "major"}
+    if bump_type not in valid_bump_types:
+        raise ValueError(
+            f"Invalid version type: {bump_type}. Must be one of {valid_bump_types}"
+        )
+
+    # Parse current version
+    # Support formats: "1.2.3", "1.2.3-alpha.1", "1.2.3+dev.123", etc.
+    parsed = _parse_version(current_version)
+
+    if parsed is None:
+        raise ValueError(f"Unable to parse version: {current_version}")
+
+    major, minor, patch, current_alpha = parsed
+
+    # Initialize variables for new version
+    new_major, new_minor, new_patch = major, minor, patch
+    new_alpha = current_alpha
+
+    # Calculate new version based on bump type and alpha flag
+    if alpha:
+        if current_alpha > 0:
+            # Already an alpha version, just increment alpha number
+            new_alpha = current_alpha + 1
+        else:
+            # Convert to alpha version with bump
+            new_alpha = 1
+            if bump_type == "patch":
+                new_patch += 1
+            elif bump_type == "minor":
+                new_minor += 1
+                new_patch = 0
+            elif bump_type == "major":
+                new_major += 1
+                new_minor = 0
+                new_patch = 0
+
+        return f"{new_major}.{new_minor}.{new_patch}-alpha.{new_alpha}"
+    else:
+        # Regular version bump (remove alpha if present)
+        if bump_type == "patch":
+            new_patch += 1
+        elif bump_type == "minor":
+            new_minor += 1
+            new_patch = 0
+        elif bump_type == "major":
+            new_major += 1
+            new_minor = 0
+            new_patch = 0
+
+        return f"{new_major}.{new_minor}.{new_patch}"
+
+
+def _strip_version_prefix(requirement: str) -> str:
+    """Remove a pinning or compatible operator from a version requirement."""
+    return _VERSION_PREFIX_RE.sub("", requirement)
+
+
+@functools.lru_cache(maxsize=1024)
+def _version_compatible(requirement: str, version: str) -> bool:
+    """Check if a version satisfies a requirement."""
+    # Simple compatibility check - in production you'd want proper semver parsing
+    # Cheapest checks first: exact pins, then a single-character dispatch
+    if requirement == version:
+        return True
+
+    operator = requirement[:1]
+    if operator == "^":
+        # For caret requirements, major version must match
+        return requirement[1:].partition(".")[0] == version.partition(".")[0]
+    elif operator == "~":
+        # For tilde requirements, major.minor must match
+        return _major_minor(requirement[1:]) == _major_minor(version)
+    else:
+        # Default to compatible for other cases
+        return True
+
+
+class _HistoryRow(NamedTuple):
+    """A version history entry formatted for the history table."""
+
+    date: str
+    repository: str
+    change: str
+    dependents: str
+
+    @classmethod
+    def from_entry(cls, entry: dict[str, Any]) -> "_HistoryRow":
+        timestamp = entry.get("timestamp") or ""
+        alpha = " alpha" if entry.get("alpha") else ""
+        dependents = [
+            dep["name"] if isinstance(dep, dict) else str(dep)
+            for dep in entry.get("dependents_updated") or ()
+        ]
+        return cls(
+            date=timestamp.partition("T")[0] or "Unknown",
+            repository=entry.get("repository", "Unknown"),
+            change=(
+                f"{entry.get('old_version', '')} → {entry.get('new_version', '')} "
+                f"({entry.get('bump_type', '')}{alpha})"
+            ),
+            dependents=", ".join(dependents) if dependents else "[dim]None[/dim]",
+        )
+
+
+_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared dependent update executor, creating it on first use."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="mpr-versions"
+            )
+            atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+        return _executor
+
 
 class VersionManager:
     """Manages semantic versioning and coordinated version bumps across repositories."""
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        use_poetry_cli: bool = False,
+        parallel: bool = True,
+    ):
         self.config_manager = config_manager
+        # Update dependent repositories concurrently on the shared executor
+        self.parallel = parallel
+        # Bump versions with `poetry version` instead of editing pyproject.toml,
+        # for setups whose Poetry plugins hook into that command
+        self.use_poetry_cli = use_poetry_cli
         self.workspace_root = config_manager.workspace_root
-        self.version_history_file = self.workspace_root / ".version-history.json"
+        self.version_history_file = self.workspace_root / ".version-history.jsonl"
+        self.legacy_history_file = self.workspace_root / ".version-history.json"
+        # Parsed pyproject.toml data keyed by path, with the mtime it was read at
+        self._pyprojects = PyprojectCache()
+        # Dependents of each repository, for the config object it was built
+        # from; dropped when VersionManager edits a dependency
+        self._reverse_deps_cache: dict[str, list[RepositoryConfig]] | None = None
+        self._reverse_deps_config: WorkspaceConfig | None = None
+        # Config pinned for the duration of a bump or status query
+        self._config_snapshot: WorkspaceConfig | None = None
+        self._repos_by_name: dict[str, RepositoryConfig] = {}
 
     def bump_version(
         self,
@@ -64,174 +350,269 @@ class VersionManager:
             f"\n[bold]Version Bump: {repository} ({bump_type}{' alpha' if alpha else ''})[/bold]"
         )
 
-        # Get repository config
-        repo = self.config_manager.get_repository(repository)
-        if not repo:
-            console.print(
-                f"[red]Repository '{repository}' not found in configuration[/red]"
-            )
-            return False
-
-        if not repo.path.exists():
-            console.print(f"[red]Repository path does not exist: {repo.path}[/red]")
-            return False
-
-        try:
-            # Step 1: Get current version and calculate new version
-            current_version = self._get_current_version(repo)
-            if not current_version:
+        with self._pinned_config():
+            # Get repository config
+            repo = self._get_repository(repository)
+            if not repo:
                 console.print(
-                    f"[red]Could not determine current version for {repository}[/red]"
+                    f"[red]Repository '{repository}' not found in configuration[/red]"
                 )
                 return False
 
-            new_version = self._calculate_new_version(current_version, bump_type, alpha)
-            console.print(
-                f"Version bump: [yellow]{current_version}[/yellow] → [green]{new_version}[/green]"
-            )
+            if not repo.path.exists():
+                console.print(f"[red]Repository path does not exist: {repo.path}[/red]")
+                return False
 
-            if dry_run:
-                console.print("[dim]DRY RUN MODE - No changes will be made[/dim]")
+            try:
+                # Step 1: Get current version and calculate new version
+                current_version = self._get_current_version(repo)
+                if not current_version:
+                    console.print(
+                        f"[red]Could not determine current version for {repository}[/red]"
+                    )
+                    return False
 
-            # Step 2: Update repository version
-            if not dry_run:
-                self._update_repository_version(repo, new_version)
-                console.print(
-                    f"[green]✓[/green] Updated {repository} to version {new_version}"
+                new_version = self._calculate_new_version(
+                    current_version, bump_type, alpha
                 )
-            else:
                 console.print(
-                    f"[dim]Would update {repository} to version {new_version}[/dim]"
+                    f"Version bump: [yellow]{current_version}[/yellow] → [green]{new_version}[/green]"
                 )
 
-            # Step 3: Update dependent repositories
-            dependents_updated = []
-            if update_dependents:
-                dependents = self._get_dependent_repositories(repository)
-                if dependents:
+                if dry_run:
+                    console.print("[dim]DRY RUN MODE - No changes will be made[/dim]")
+
+                # Step 2: Update repository version
+                if not dry_run:
+                    self._update_repository_version(repo, new_version)
                     console.print(
-                        f"\n[bold]Updating {len(dependents)} dependent repositories:[/bold]"
+                        f"[green]✓[/green] Updated {repository} to version {new_version}"
                     )
+                else:
                     console.print(
-                        f"  [dim]Dependents will get {dependents_bump}{' alpha' if alpha else ''} version bump[/dim]"
+                        f"[dim]Would update {repository} to version {new_version}[/dim]"
                     )
 
-                    for dependent_repo in dependents:
-                        console.print(f"  Processing {dependent_repo.name}...")
-
-                        if not dry_run:
-                            # First update dependency version in dependent repo
-                            dep_update_success = self._update_dependency_version(
-                                dependent_repo, repo.package_name, new_version
-                            )
+                # Step 3: Update dependent repositories
+                dependents_updated = []
+                if update_dependents:
+                    dependents = self._get_dependent_repositories(repository)
+                    if dependents:
+                        console.print(
+                            f"\n[bold]Updating {len(dependents)} dependent repositories:[/bold]"
+                        )
+                        console.print(
+                            f"  [dim]Dependents will get {dependents_bump}{' alpha' if alpha else ''} version bump[/dim]"
+                        )
 
-                            if dep_update_success:
-                                # Then bump the dependent repository's own version
-                                dependent_current_version = self._get_current_version(
-                                    dependent_repo
-                                )
-                                if dependent_current_version:
-                                    dependent_new_version = self._calculate_new_version(
-                                        dependent_current_version,
-                                        dependents_bump,
-                                        alpha,
-                                    )
-
-                                    try:
-                                        self._update_repository_version(
-                                            dependent_repo, dependent_new_version
-                                        )
-                                        dependents_updated.append(
-                                            {
-                                                "name": dependent_repo.name,
-                                                "old_version": dependent_current_version,
-                                                "new_version": dependent_new_version,
-                                                "bump_type": dependents_bump,
-                                            }
-                                        )
-                                        console.print(
-                                            f"  [green]✓[/green] Updated {dependent_repo.name}: {dependent_current_version} → {dependent_new_version}"
-                                        )
-                                    except Exception as e:
-                                        console.print(
-                                            f"  [red]✗[/red] Failed to bump version for {dependent_repo.name}: {e}"
-                                        )
-                                else:
-                                    console.print(
-                                        f"  [yellow]?[/yellow] Could not determine current version for {dependent_repo.name}"
-                                    )
-                            else:
-                                console.print(
-                                    f"  [red]✗[/red] Failed to update dependency in {dependent_repo.name}"
+                        name_variants = package_name_variants(repo.package_name)
+                        records: list[dict[str, str] | None] = []
+                        if dry_run or not self.parallel:
+                            for dependent_repo in dependents:
+                                record, messages = self._process_dependent(
+                                    dependent_repo,
+                                    repo.package_name,
+                                    new_version,
+                                    dependents_bump,
+                                    alpha,
+                                    dry_run=dry_run,
+                                    name_variants=name_variants,
                                 )
+                                for message in messages:
+                                    console.print(message)
+                                records.append(record)
                         else:
-                            # Dry run mode - show what would happen
-                            dependent_current_version = self._get_current_version(
-                                dependent_repo
-                            )
-                            if dependent_current_version:
-                                dependent_new_version = self._calculate_new_version(
-                                    dependent_current_version, dependents_bump, alpha
-                                )
-                                dependents_updated.append(
-                                    {
-                                        "name": dependent_repo.name,
-                                        "old_version": dependent_current_version,
-                                        "new_version": dependent_new_version,
-                                        "bump_type": dependents_bump,
-                                    }
-                                )
-                                console.print(
-                                    f"  [dim]Would update {dependent_repo.name}: {dependent_current_version} → {dependent_new_version}[/dim]"
-                                )
-                            else:
-                                console.print(
-                                    f"  [dim]Would update {dependent_repo.name} (could not determine current version)[/dim]"
-                                )
-                else:
-                    console.print("[dim]No dependent repositories found[/dim]")
+                            # Dependents only share the already written primary
+                            # version, so their Poetry calls can run concurrently
+                            executor = _get_executor()
+                            futures = {
+                                executor.submit(
+                                    self._process_dependent,
+                                    dependent_repo,
+                                    repo.package_name,
+                                    new_version,
+                                    dependents_bump,
+                                    alpha,
+                                    name_variants=name_variants,
+                                ): index
+                                for index, dependent_repo in enumerate(dependents)
+                            }
+                            records = [None] * len(dependents)
+
+                            # Console output is printed from this thread only,
+                            # so each dependent's messages stay together
+                            for future in as_completed(futures):
+                                record, messages = future.result()
+                                for message in messages:
+                                    console.print(message)
+                                records[futures[future]] = record
+
+                        dependents_updated = [
+                            record for record in records if record is not None
+                        ]
+                    else:
+                        console.print("[dim]No dependent repositories found[/dim]")
+
+                # Step 4: Record version history
+                if not dry_run:
+                    self._record_version_history(
+                        repository,
+                        current_version,
+                        new_version,
+                        bump_type,
+                        alpha,
+                        dependents_updated,
+                    )
 
-            # Step 4: Record version history
-            if not dry_run:
-                self._record_version_history(
-                    repository,
-                    current_version,
-                    new_version,
-                    bump_type,
-                    alpha,
-                    dependents_updated,
+                # Step 5: Run validation tests
+                if validate and not dry_run:
+                    console.print("\n[bold]Running validation tests...[/bold]")
+                    validation_success = self._run_validation_tests(
+                        repo, dependents_updated
+                    )
+                    if not validation_success:
+                        console.print("[red]Validation tests failed[/red]")
+                        return False
+
+                # Step 6: Summary
+                console.print(
+                    "\n[green bold]✓ Version bump completed successfully![/green bold]"
                 )
+                console.print(f"  Repository: {repository}")
+                console.print(f"  Version: {current_version} → {new_version}")
+                if dependents_updated:
+                    dependent_names = [dep["name"] for dep in dependents_updated]
+                    console.print(f"  Updated dependents: {', '.join(dependent_names)}")
+                    for dep in dependents_updated:
+                        console.print(
+                            f"    {dep['name']}: {dep['old_version']} → {dep['new_version']} ({dep['bump_type']})"
+                        )
 
-            # Step 5: Run validation tests
-            if validate and not dry_run:
-                console.print("\n[bold]Running validation tests...[/bold]")
-                validation_success = self._run_validation_tests(
-                    repo, dependents_updated
+                return True
+
+            except Exception as e:
+                console.print(f"[red]Error during version bump: {e}[/red]")
+                logger.error(f"Version bump failed for {repository}: {e}")
+                return False
+
+    @contextmanager
+    def _pinned_config(self) -> Iterator[None]:
+        """Use a single config snapshot for the duration of an operation."""
+        if self._config_snapshot is not None:
+            yield
+            return
+
+        config = self.config_manager.load_config()
+        self._config_snapshot = config
+        self._repos_by_name = {}
+        for repo in config.repositories:
+            self._repos_by_name.setdefault(repo.name, repo)
+
+        try:
+            yield
+        finally:
+            self._config_snapshot = None
+            self._repos_by_name = {}
+
+    def _load_config(self) -> WorkspaceConfig:
+        """Get the pinned config snapshot, or load the config."""
+        if self._config_snapshot is not None:
+            return self._config_snapshot
+        return self.config_manager.load_config()
+
+    def _get_repository(self, name: str) -> RepositoryConfig | None:
+        """Get a repository by name, from the pinned snapshot if there is one."""
+        if self._config_snapshot is not None:
+            return self._repos_by_name.get(name)
+        return self.config_manager.get_repository(name)
+
+    def _process_dependent(
+        self,
+        dependent_repo: RepositoryConfig,
+        package_name: str,
+        new_version: str,
+        dependents_bump: str,
+        alpha: bool,
+        dry_run: bool = False,
+        name_variants: tuple[str, ...] | None = None,
+    ) -> tuple[dict[str, str] | None, list[str]]:
+        """Update a dependent repository for a new dependency version.
+
+        Returns the history record for the dependent, or None if it was
+        not updated, and the console messages to print.
+        """
+        messages = [f"  Processing {dependent_repo.name}..."]
+
+        if dry_run:
+            dependent_current_version = self._get_current_version(dependent_repo)
+            if not dependent_current_version:
+                messages.append(
+                    f"  [dim]Would update {dependent_repo.name} (could not determine current version)[/dim]"
                 )
-                if not validation_success:
-                    console.print("[red]Validation tests failed[/red]")
-                    return False
+                return None, messages
 
-            # Step 6: Summary
-            console.print(
-                "\n[green bold]✓ Version bump completed successfully![/green bold]"
+            dependent_new_version = self._calculate_new_version(
+                dependent_current_version, dependents_bump, alpha
             )
-            console.print(f"  Repository: {repository}")
-            console.print(f"  Version: {current_version} → {new_version}")
-            if dependents_updated:
-                dependent_names = [dep["name"] for dep in dependents_updated]
-                console.print(f"  Updated dependents: {', '.join(dependent_names)}")
-                for dep in dependents_updated:
-                    console.print(
-                        f"    {dep['name']}: {dep['old_version']} → {dep['new_version']} ({dep['bump_type']})"
-                    )
+            messages.append(
+                f"  [dim]Would update {dependent_repo.name}: {dependent_current_version} → {dependent_new_version}[/dim]"
+            )
+            record = {
+                "name": dependent_repo.name,
+                "old_version": dependent_current_version,
+                "new_version": dependent_new_version,
+                "bump_type": dependents_bump,
+            }
+            return record, messages
 
-            return True
+        # First update dependency version in dependent repo, leaving the
+        # lock file to the single lock run after the version bump below
+        pyproject_path = dependent_repo.path / "pyproject.toml"
+        digest_before = _file_digest(pyproject_path)
+        if not self._update_dependency_version(
+            dependent_repo, package_name, new_version, name_variants, lock=False
+        ):
+            messages.append(
+                f"  [red]✗[/red] Failed to update dependency in {dependent_repo.name}"
+            )
+            return None, messages
 
+        # Then bump the dependent repository's own version
+        dependent_current_version = self._get_current_version(dependent_repo)
+        if not dependent_current_version:
+            messages.append(
+                f"  [yellow]?[/yellow] Could not determine current version for {dependent_repo.name}"
+            )
+            return None, messages
+
+        dependent_new_version = self._calculate_new_version(
+            dependent_current_version, dependents_bump, alpha
+        )
+
+        # Poetry's lock hash ignores the package's own version, so only
+        # relock when the dependency edit actually changed the file
+        needs_lock = _file_digest(pyproject_path) != digest_before
+
+        try:
+            self._update_repository_version(
+                dependent_repo, dependent_new_version, lock=needs_lock
+            )
         except Exception as e:
-            console.print(f"[red]Error during version bump: {e}[/red]")
-            logger.error(f"Version bump failed for {repository}: {e}")
-            return False
+            messages.append(
+                f"  [red]✗[/red] Failed to bump version for {dependent_repo.name}: {e}"
+            )
+            return None, messages
+
+        messages.append(
+            f"  [green]✓[/green] Updated {dependent_repo.name}: {dependent_current_version} → {dependent_new_version}"
+        )
+        record = {
+            "name": dependent_repo.name,
+            "old_version": dependent_current_version,
+            "new_version": dependent_new_version,
+            "bump_type": dependents_bump,
+        }
+        return record, messages
 
     def _get_current_version(self, repo: RepositoryConfig) -> str | None:
         """Get current version from repository's pyproject.toml."""
@@ -241,111 +622,121 @@ class VersionManager:
             return None
 
         try:
-            with open(pyproject_path) as f:
-                pyproject_data = toml.load(f)
+            pyproject_data = self._load_pyproject(pyproject_path)
+            if pyproject_data is None:
+                return None
 
-            version = pyproject_data.get("tool", {}).get("poetry", {}).get("version")
-            return str(version) if version is not None else None
-        except (toml.TomlDecodeError, KeyError):
+            return _poetry_version(pyproject_data)
+        except (tomllib.TOMLDecodeError, KeyError):
             return None
 
+    def read_pyproject(self, repo: RepositoryConfig) -> dict[str, Any] | None:
+        """Read a repository's pyproject.toml, None if it has none.
+
+        Reuses the data parsed for version lookups while the file is
+        unchanged. Raises tomllib.TOMLDecodeError for an invalid file.
+        """
+        return self._load_pyproject(repo.path / "pyproject.toml")
+
+    def _load_pyproject(self, pyproject_path: Path) -> dict[str, Any] | None:
+        """Load a pyproject.toml, reusing the parsed data while it is unchanged."""
+        return self._pyprojects.load(pyproject_path)
+
     def _calculate_new_version(
         self, current_version: str, bump_type: str, alpha: bool = False
     ) -> str:
         """Calculate new version based on current version and bump type."""
+        return _calc_new_version(current_version, bump_type, alpha)
 
-        # Validate bump type
-        valid_bump_types = {"patch", "minor", "major"}
-        if bump_type not in valid_bump_types:
-            raise ValueError(
-                f"Invalid version type: {bump_type}. Must be one of {valid_bump_types}"
-            )
-
-        # Parse current version
-        # Support formats: "1.2.3", "1.2.3-alpha.1", "1.2.3+dev.123", etc.
-        version_pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-alpha\.(\d+))?(?:\+.*)?$"
-        match = re.match(version_pattern, current_version)
-
-        if not match:
-            raise ValueError(f"Unable to parse version: {current_version}")
-
-        # Ensure string inputs are converted to integers, defaulting to 0 if None
-        major, minor, patch, current_alpha = [
-            int(group) if group is not None else 0 for group in match.groups()
-        ]
+    def _update_repository_version(
+        self, repo: RepositoryConfig, version: str, lock: bool = True
+    ) -> None:
+        """Update repository version in pyproject.toml.
 
-        # Initialize variables for new version
-        new_major, new_minor, new_patch = major, minor, patch
-        new_alpha = current_alpha
+        The version line is edited in place; Poetry is only invoked when
+        the line cannot be located or `use_poetry_cli` is set.
+        """
+        pyproject_path = repo.path / "pyproject.toml"
+        try:
+            new_text = None
+            if not self.use_poetry_cli:
+                try:
+                    new_text = _replace_project_version(
+                        pyproject_path.read_text(encoding="utf-8"), version
+                    )
+                except OSError:
+                    new_text = None
 
-        # Calculate new version based on bump type and alpha flag
-        if alpha:
-            if current_alpha > 0:
-                # Already an alpha version, just increment alpha number
-                new_alpha = current_alpha + 1
+            if new_text is not None:
+                pyproject_path.write_text(new_text, encoding="utf-8")
             else:
-                # Convert to alpha version with bump
-                new_alpha = 1
-                if bump_type == "patch":
-                    new_patch += 1
-                elif bump_type == "minor":
-                    new_minor += 1
-                    new_patch = 0
-                elif bump_type == "major":
-                    new_major += 1
-                    new_minor = 0
-                    new_patch = 0
-
-            return f"{new_major}.{new_minor}.{new_patch}-alpha.{new_alpha}"
-        else:
-            # Regular version bump (remove alpha if present)
-            if bump_type == "patch":
-                new_patch += 1
-            elif bump_type == "minor":
-                new_minor += 1
-                new_patch = 0
-            elif bump_type == "major":
-                new_major += 1
-                new_minor = 0
-                new_patch = 0
+                subprocess.run(
+                    ["poetry", "version", version],
+                    cwd=repo.path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
 
-            return f"{new_major}.{new_minor}.{new_patch}"
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"Failed to update version for {repo.name}: {e}") from e
+        finally:
+            # The file was rewritten; don't rely on mtime resolution to notice
+            self._pyprojects.discard(pyproject_path)
 
-    def _update_repository_version(self, repo: RepositoryConfig, version: str) -> None:
-        """Update repository version using Poetry."""
+        # Also update the lock file
+        if lock:
+            try:
+                self._update_lock_file(repo)
+            except subprocess.CalledProcessError as e:
+                raise Exception(
+                    f"Failed to update lock file for {repo.name}: {e}"
+                ) from e
+
+    def _update_lock_file(self, repo: RepositoryConfig) -> None:
+        """Update Poetry lock file."""
         try:
+            # Try with --no-update first (older Poetry versions)
             subprocess.run(
-                ["poetry", "version", version],
+                ["poetry", "lock", "--no-update"],
                 cwd=repo.path,
                 check=True,
                 capture_output=True,
-                text=True,
             )
-
-            # Also update the lock file
+        except subprocess.CalledProcessError:
+            # Fallback for newer Poetry versions
             subprocess.run(
-                ["poetry", "lock", "--no-update"],
-                cwd=repo.path,
-                capture_output=True,
-                check=False,  # Don't fail if this doesn't work
+                ["poetry", "lock"], cwd=repo.path, check=True, capture_output=True
             )
 
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Failed to update version for {repo.name}: {e}") from e
-
     def _get_dependent_repositories(self, repository: str) -> list[RepositoryConfig]:
         """Get all repositories that depend on the given repository."""
-        config = self.config_manager.load_config()
-        dependents = []
+        return list(self._ensure_reverse_index().get(repository, []))
 
-        for repo in config.repositories:
-            if repository in repo.dependencies:
-                dependents.append(repo)
+    def _ensure_reverse_index(self) -> dict[str, list[RepositoryConfig]]:
+        """Get the repositories depending on each repository, built once per config."""
+        config = self._load_config()
+        index = self._reverse_deps_cache
 
-        return dependents
+        # The config manager hands out a new config object after a reload
+        if index is None or self._reverse_deps_config is not config:
+            index = {}
+            for repo in config.repositories:
+                # A dependency listed twice still makes one dependent
+                for dep in dict.fromkeys(repo.dependencies):
+                    index.setdefault(dep, []).append(repo)
+            self._reverse_deps_cache = index
+            self._reverse_deps_config = config
+
+        return index
 
     def _update_dependency_version(
-        self, dependent_repo: RepositoryConfig, package_name: str, version: str
+        self,
+        dependent_repo: RepositoryConfig,
+        package_name: str,
+        version: str,
+        name_variants: tuple[str, ...] | None = None,
+        lock: bool = True,
     ) -> bool:
         """Update dependency version in a dependent repository."""
         pyproject_path = dependent_repo.path / "pyproject.toml"
@@ -356,8 +747,10 @@ class VersionManager:
 
         try:
             # Read current pyproject.toml
-            with open(pyproject_path) as f:
-                pyproject_data = toml.load(f)
+            pyproject_data = self._load_pyproject(pyproject_path)
+            if pyproject_data is None:
+                logger.warning(f"No pyproject.toml found in {dependent_repo.name}")
+                return False
 
             # Update dependency version
             dependencies = (
@@ -365,20 +758,18 @@ class VersionManager:
             )
 
             # Try multiple package name variations (hyphen vs underscore)
-            possible_names = [
-                package_name,
-                package_name.replace("-", "_"),
-                package_name.replace("_", "-"),
-            ]
+            if name_variants is None:
+                name_variants = package_name_variants(package_name)
+            matches = dependencies.keys() & name_variants
 
             found_dependency = None
             actual_dep_name = None
 
-            for dep_name in possible_names:
-                if dep_name in dependencies:
-                    found_dependency = dependencies[dep_name]
-                    actual_dep_name = dep_name
-                    break
+            if matches:
+                actual_dep_name = (
+                    package_name if package_name in matches else min(matches)
+                )
+                found_dependency = dependencies[actual_dep_name]
 
             if found_dependency is None:
                 logger.warning(
@@ -391,14 +782,29 @@ class VersionManager:
                 f"Found dependency '{actual_dep_name}' in {dependent_repo.name}"
             )
 
+            # Nothing to write or relock if the requirement is already current
+            new_spec = f"^{version}"
+            if isinstance(found_dependency, dict):
+                existing_spec = found_dependency.get("version")
+            else:
+                existing_spec = found_dependency
+            if existing_spec == new_spec:
+                logger.info(
+                    f"Dependency {actual_dep_name} in {dependent_repo.name} is already {new_spec}"
+                )
+                return True
+
+            # The parsed data is edited in place below, so drop it from the cache
+            self._pyprojects.discard(pyproject_path)
+
             # Handle different dependency formats
             if isinstance(found_dependency, str):
                 # Simple version string, update it
-                dependencies[actual_dep_name] = f"^{version}"
+                dependencies[actual_dep_name] = new_spec
             elif isinstance(found_dependency, dict):
                 if "version" in found_dependency:
                     # Dict with version key
-                    found_dependency["version"] = f"^{version}"
+                    found_dependency["version"] = new_spec
                 elif "path" in found_dependency:
                     # Local path dependency - don't update version
                     logger.info(
@@ -407,23 +813,22 @@ class VersionManager:
                     return True
                 else:
                     # Add version to existing dict
-                    found_dependency["version"] = f"^{version}"
+                    found_dependency["version"] = new_spec
 
             # Write back to file
-            with open(pyproject_path, "w") as f:
-                toml.dump(pyproject_data, f)
+            with open(pyproject_path, "wb") as f:
+                tomli_w.dump(pyproject_data, f)
+            self._reverse_deps_cache = None
 
             # Update lock file
+            if not lock:
+                return True
+
             try:
-                subprocess.run(
-                    ["poetry", "lock"],
-                    cwd=dependent_repo.path,
-                    capture_output=True,
-                    check=True,
-                    timeout=60,
-                )
+                self._update_lock_file(dependent_repo)
             except subprocess.CalledProcessError:
-                logger.warning(f"Failed to update lock file for {dependent_repo.name}")
+                logger.error(f"Failed to update lock file for {dependent_repo.name}")
+                return False
 
             return True
 
@@ -445,7 +850,7 @@ class VersionManager:
         """Record version change in history file."""
 
         history_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "repository": repository,
             "old_version": old_version,
             "new_version": new_version,
@@ -454,142 +859,240 @@ class VersionManager:
             "dependents_updated": dependents_updated,
         }
 
-        # Load existing history
-        history = []
-        if self.version_history_file.exists():
-            try:
-                with open(self.version_history_file) as f:
-                    history = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                history = []
+        self._migrate_version_history()
 
-        # Add new entry
-        history.append(history_entry)
+        # Append the entry as one JSON line instead of rewriting the history
+        with open(self.version_history_file, "ab") as f:
+            f.write(_dump_history_line(history_entry))
 
-        # Keep only last 100 entries
-        history = history[-100:]
+        # Keep only the last entries once the file has grown past the limit
+        if self.version_history_file.stat().st_size > _HISTORY_TRIM_BYTES:
+            with open(self.version_history_file, "rb") as f:
+                tail = deque(f, maxlen=_HISTORY_LIMIT)
+
+            tmp_path = self.version_history_file.with_suffix(".jsonl.tmp")
+            with open(tmp_path, "wb") as f:
+                f.writelines(tail)
+            os.replace(tmp_path, self.version_history_file)
+
+    def _migrate_version_history(self) -> None:
+        """Convert a JSON array history file to the JSON lines format."""
+        if self.version_history_file.exists() or not self.legacy_history_file.exists():
+            return
+
+        try:
+            history = _load_json(self.legacy_history_file.read_bytes())
+        except (json.JSONDecodeError, FileNotFoundError):
+            return
 
-        # Save history
-        with open(self.version_history_file, "w") as f:
-            json.dump(history, f, indent=2)
+        with open(self.version_history_file, "wb") as f:
+            f.writelines(_dump_history_line(entry) for entry in history)
+        self.legacy_history_file.unlink()
 
     def _run_validation_tests(
         self, repo: RepositoryConfig, dependents_updated: list[dict[str, str]]
     ) -> bool:
         """Run validation tests after version bump."""
+        # Test the repository itself and its dependent repositories
+        targets = [(repo, repo.name)]
+        for dependent_info in dependents_updated:
+            dependent_name = dependent_info["name"]
+            dependent_repo = self._get_repository(dependent_name)
+            if dependent_repo is not None and dependent_repo.path.exists():
+                targets.append((dependent_repo, dependent_name))
 
-        def _test_repository(repo_config: RepositoryConfig, repo_name: str) -> bool:
-            """Test a single repository and return True if tests pass or no tests exist."""
-            console.print(f"  Testing {repo_name}...")
-            try:
-                result = subprocess.run(
-                    ["poetry", "run", "pytest", "-x", "--tb=short"],
-                    cwd=repo_config.path,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                )
+        return asyncio.run(self._run_validation_tests_async(targets))
 
-                if result.returncode == 0:
-                    console.print(f"  [green]✓[/green] Tests passed for {repo_name}")
-                    return True
-                elif result.returncode == 5:
-                    # Exit code 5 means "no tests found" - this is OK
-                    console.print(
-                        f"  [yellow]?[/yellow] No tests found for {repo_name} (OK)"
-                    )
-                    return True
-                else:
-                    console.print(f"  [red]✗[/red] Tests failed for {repo_name}")
-                    logger.error(
-                        f"Test output for {repo_name}: {result.stdout}\n{result.stderr}"
-                    )
+    async def _run_validation_tests_async(
+        self, targets: list[tuple[RepositoryConfig, str]]
+    ) -> bool:
+        """Run independent test suites concurrently, stopping at the first failure."""
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def _test(repo_config: RepositoryConfig, repo_name: str) -> bool:
+            async with semaphore:
+                return await self._test_repository_async(repo_config, repo_name)
+
+        tasks = [asyncio.create_task(_test(*target)) for target in targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if not await next_done:
                     return False
+            return True
+        finally:
+            # Stop the suites still running, killing their processes
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _test_repository_async(
+        self, repo_config: RepositoryConfig, repo_name: str
+    ) -> bool:
+        """Test a single repository and return True if tests pass or no tests exist."""
+        console.print(f"  Testing {repo_name}...")
+        try:
+            result = await self._run_async(
+                ["poetry", "run", "pytest", "-x", "--tb=short"],
+                cwd=repo_config.path,
+                timeout=300,
+            )
 
-            except subprocess.TimeoutExpired:
-                console.print(f"  [red]✗[/red] Tests timed out for {repo_name}")
-                return False
-            except FileNotFoundError:
+            if result.returncode == 0:
+                console.print(f"  [green]✓[/green] Tests passed for {repo_name}")
+                return True
+            elif result.returncode == 5:
+                # Exit code 5 means "no tests found" - this is OK
                 console.print(
-                    f"  [yellow]?[/yellow] pytest not found for {repo_name} (OK)"
+                    f"  [yellow]?[/yellow] No tests found for {repo_name} (OK)"
                 )
                 return True
+            else:
+                console.print(f"  [red]✗[/red] Tests failed for {repo_name}")
+                logger.error(
+                    f"Test output for {repo_name}: {result.stdout}\n{result.stderr}"
+                )
+                return False
 
-        # Test the repository itself
-        if not _test_repository(repo, repo.name):
+        except subprocess.TimeoutExpired:
+            console.print(f"  [red]✗[/red] Tests timed out for {repo_name}")
             return False
+        except FileNotFoundError:
+            console.print(f"  [yellow]?[/yellow] pytest not found for {repo_name} (OK)")
+            return True
 
-        # Test dependent repositories
-        for dependent_info in dependents_updated:
-            dependent_name = dependent_info["name"]
-            dependent_repo = self.config_manager.get_repository(dependent_name)
-            if dependent_repo is not None and dependent_repo.path.exists():
-                if not _test_repository(dependent_repo, dependent_name):
-                    return False
-
-        return True
+    async def _run_async(
+        self, cmd: list[str], cwd: Path, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a command without blocking the event loop."""
+        return await run_async(cmd, cwd, timeout=timeout)
 
     def get_version_status(self, repository: str | None = None) -> dict[str, Any]:
         """Get version status for repositories."""
-        config = self.config_manager.load_config()
+        with self._pinned_config():
+            config = self._load_config()
+
+            if repository:
+                # Get status for specific repository
+                repo = self._get_repository(repository)
+                if not repo:
+                    raise ValueError(f"Repository '{repository}' not found")
+                repos_to_check = [repo]
+            else:
+                # Get status for all repositories
+                repos_to_check = config.repositories
 
-        if repository:
-            # Get status for specific repository
-            repo = self.config_manager.get_repository(repository)
-            if not repo:
-                raise ValueError(f"Repository '{repository}' not found")
-            repos_to_check = [repo]
-        else:
-            # Get status for all repositories
-            repos_to_check = config.repositories
+            status: dict[str, Any] = {
+                "repositories": [],
+                "dependency_graph": {},
+                "version_history": self._get_recent_version_history(),
+            }
 
-        status: dict[str, Any] = {
-            "repositories": [],
-            "dependency_graph": {},
-            "version_history": self._get_recent_version_history(),
-        }
+            versions, forward, reverse = self._build_graph_snapshot(repos_to_check)
 
-        for repo in repos_to_check:
-            repo_status: dict[str, Any] = {
-                "name": repo.name,
-                "package_name": repo.package_name,
-                "current_version": None,
-                "is_alpha": False,
-                "dependencies": [],
-                "dependents": [],
-                "path_exists": repo.path.exists(),
-            }
+            for repo in repos_to_check:
+                path_exists = repo.name in forward
+                repo_status: dict[str, Any] = {
+                    "name": repo.name,
+                    "package_name": repo.package_name,
+                    "current_version": None,
+                    "is_alpha": False,
+                    "dependencies": [],
+                    "dependents": [],
+                    "path_exists": path_exists,
+                }
 
-            if repo.path.exists():
-                # Get current version
-                current_version = self._get_current_version(repo)
-                repo_status["current_version"] = current_version
+                if path_exists:
+                    current_version = versions.get(repo.name)
+                    repo_status["current_version"] = current_version
 
-                if current_version:
-                    repo_status["is_alpha"] = "-alpha." in current_version
+                    if current_version:
+                        repo_status["is_alpha"] = "-alpha." in current_version
 
-                # Get dependencies info
-                repo_status["dependencies"] = self._get_dependency_info(repo)
+                    repo_status["dependencies"] = forward[repo.name]
+                    repo_status["dependents"] = reverse.get(repo.name, [])
 
-                # Get dependents
-                dependents = self._get_dependent_repositories(repo.name)
-                repo_status["dependents"] = [dep.name for dep in dependents]
+                status["repositories"].append(repo_status)
+                status["dependency_graph"][repo.name] = repo_status["dependencies"]
 
-            status["repositories"].append(repo_status)
-            status["dependency_graph"][repo.name] = repo_status["dependencies"]
+            return status
 
-        return status
+    def _read_workspace_pyprojects(
+        self,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, str | None]]:
+        """Parse every repository's pyproject.toml once.
 
-    def _get_dependency_info(self, repo: RepositoryConfig) -> list[dict[str, Any]]:
-        """Get detailed dependency information for a repository."""
+        Returns the parsed data of each readable pyproject.toml and the
+        current version of every repository, both by repository name.
+        """
+        parsed: dict[str, dict[str, Any]] = {}
+        versions: dict[str, str | None] = {}
+        for repo in self._load_config().repositories:
+            try:
+                pyproject_data = self._load_pyproject(repo.path / "pyproject.toml")
+            except (OSError, tomllib.TOMLDecodeError):
+                pyproject_data = None
+
+            if pyproject_data is not None:
+                parsed[repo.name] = pyproject_data
+            versions[repo.name] = (
+                _poetry_version(pyproject_data) if pyproject_data is not None else None
+            )
+
+        return parsed, versions
+
+    def _build_graph_snapshot(
+        self, repos: list[RepositoryConfig]
+    ) -> tuple[
+        dict[str, str | None], dict[str, list[dict[str, Any]]], dict[str, list[str]]
+    ]:
+        """Read the workspace once into version, dependency and dependent maps.
+
+        Returns the current version of every repository, the dependency
+        info of each given repository whose path exists, and the names of
+        the repositories depending on each repository.
+        """
+        parsed, versions = self._read_workspace_pyprojects()
+
+        forward = {
+            repo.name: self._get_dependency_info(
+                repo, parsed=parsed.get(repo.name), versions=versions
+            )
+            for repo in repos
+            if repo.path.exists()
+        }
+        reverse = {
+            name: [dependent.name for dependent in dependents]
+            for name, dependents in self._ensure_reverse_index().items()
+        }
+
+        return versions, forward, reverse
+
+    def _get_dependency_info(
+        self,
+        repo: RepositoryConfig,
+        *,
+        parsed: dict[str, Any] | None = None,
+        versions: dict[str, str | None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get detailed dependency information for a repository.
+
+        Args:
+            repo: Repository to inspect
+            parsed: Already parsed pyproject.toml data of the repository
+            versions: Current versions by repository name, to avoid reading
+                each managed dependency's pyproject.toml
+        """
         pyproject_path = repo.path / "pyproject.toml"
 
-        if not pyproject_path.exists():
+        if parsed is None and not pyproject_path.exists():
             return []
 
         try:
-            with open(pyproject_path) as f:
-                pyproject_data = toml.load(f)
+            pyproject_data = parsed
+            if pyproject_data is None:
+                pyproject_data = self._load_pyproject(pyproject_path)
+            if pyproject_data is None:
+                return []
 
             dependencies = (
                 pyproject_data.get("tool", {}).get("poetry", {}).get("dependencies", {})
@@ -601,18 +1104,19 @@ class VersionManager:
                     continue
 
                 # Check if this is one of our managed dependencies
-                dep_repo: RepositoryConfig | None = self.config_manager.get_repository(
-                    dep_name
-                )
+                dep_repo = self._get_repository(dep_name)
                 if dep_repo:
+                    if versions is not None:
+                        dep_version = versions.get(dep_repo.name)
+                    elif dep_repo.path.exists():
+                        dep_version = self._get_current_version(dep_repo)
+                    else:
+                        dep_version = None
+
                     info = {
                         "name": dep_name,
                         "managed": True,
-                        "current_version": (
-                            self._get_current_version(dep_repo)
-                            if dep_repo.path.exists()
-                            else None
-                        ),
+                        "current_version": dep_version,
                     }
 
                     if isinstance(dep_spec, dict):
@@ -640,45 +1144,43 @@ class VersionManager:
 
             return dependency_info
 
-        except (toml.TomlDecodeError, KeyError):
+        except (tomllib.TOMLDecodeError, KeyError):
             return []
 
     def _is_version_compatible(self, requirement: str, version: str) -> bool:
         """Check if a version satisfies a requirement."""
-        # Simple compatibility check - in production you'd want proper semver parsing
-        if requirement.startswith("^"):
-            req_version = requirement[1:]
-            # For caret requirements, major version must match
-            req_major = req_version.split(".")[0]
-            ver_major = version.split(".")[0]
-            return req_major == ver_major
-        elif requirement.startswith("~"):
-            req_version = requirement[1:]
-            # For tilde requirements, major.minor must match
-            req_parts = req_version.split(".")[:2]
-            ver_parts = version.split(".")[:2]
-            return req_parts == ver_parts
-        elif requirement == version:
-            return True
-        else:
-            # Default to compatible for other cases
-            return True
+        return _version_compatible(requirement, version)
 
     def _get_recent_version_history(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get recent version history."""
         if not self.version_history_file.exists():
-            return []
+            # Read a history not yet migrated by a bump without converting it
+            return self._read_legacy_version_history(limit)
 
         try:
-            with open(self.version_history_file) as f:
-                history: list[dict[str, Any]] = json.load(f)
+            # Only the end of the file is read and parsed
+            tail = _read_tail_lines(self.version_history_file, limit)
+        except FileNotFoundError:
+            return []
 
-            # Return most recent entries
-            return history[-limit:] if history else []
+        history = []
+        for line in tail:
+            try:
+                history.append(_load_json(line))
+            except json.JSONDecodeError:
+                # Skip a line left half-written by an interrupted bump
+                continue
+        return history
 
+    def _read_legacy_version_history(self, limit: int) -> list[dict[str, Any]]:
+        """Get the last entries of a JSON array history file."""
+        try:
+            history = _load_json(self.legacy_history_file.read_bytes())
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
+        return list(history[-limit:]) if limit > 0 else []
+
     def display_version_status(
         self, status: dict[str, Any], show_dependents: bool = False
     ) -> None:
@@ -770,26 +1272,9 @@ class VersionManager:
             history_table.add_column("Change", style="yellow")
             history_table.add_column("Dependents", style="green")
 
-            for entry in reversed(history[-5:]):  # Show last 5 entries
-                timestamp = entry.get("timestamp", "")
-                date_str = timestamp.split("T")[0] if timestamp else "Unknown"
-
-                repo_name = entry.get("repository", "Unknown")
-                old_ver = entry.get("old_version", "")
-                new_ver = entry.get("new_version", "")
-                bump_type = entry.get("bump_type", "")
-                alpha = entry.get("alpha", False)
-
-                change_str = (
-                    f"{old_ver} → {new_ver} ({bump_type}{'alpha' if alpha else ''})"
-                )
-
-                dependents = entry.get("dependents_updated", [])
-                dependents_str = (
-                    ", ".join(dependents) if dependents else "[dim]None[/dim]"
-                )
-
-                history_table.add_row(date_str, repo_name, change_str, dependents_str)
+            # Show the last 5 entries, newest first
+            for entry in reversed(history[-5:]):
+                history_table.add_row(*_HistoryRow.from_entry(entry))
 
             console.print(history_table)
 
@@ -803,48 +1288,53 @@ class VersionManager:
         if dry_run:
             console.print("[dim]DRY RUN MODE - No changes will be made[/dim]")
 
-        config = self.config_manager.load_config()
+        with self._pinned_config():
+            config = self._load_config()
 
-        # Build current version map
-        version_map = {}
-        for repo in config.repositories:
-            if repo.path.exists():
-                current_version = self._get_current_version(repo)
-                if current_version:
-                    version_map[repo.package_name] = {
-                        "version": current_version,
-                        "repo_name": repo.name,
-                    }
+            # Parse each pyproject.toml once for both the version map and
+            # the dependency checks below
+            parsed, versions = self._read_workspace_pyprojects()
 
-        console.print(f"Found versions for {len(version_map)} repositories")
-
-        # Check each repository for outdated dependencies
-        updates_needed = []
-        dependency_order = self.config_manager.get_dependency_order()
+            # Current version by package name
+            version_lookup: dict[str, str] = {}
+            for repo in config.repositories:
+                current_version = versions.get(repo.name)
+                if current_version:
+                    version_lookup[repo.package_name] = current_version
 
-        for repo_name in dependency_order:
-            repository = self.config_manager.get_repository(repo_name)
-            if repository is None or not repository.path.exists():
-                continue
+            console.print(f"Found versions for {len(version_lookup)} repositories")
 
-            dependencies = self._get_dependency_info(repository)
+            # Check each repository for outdated dependencies
+            updates_needed = []
+            dependency_order = self.config_manager.get_dependency_order()
 
-            for dep in dependencies:
-                if not dep.get("managed") or dep.get("is_path"):
+            for repo_name in dependency_order:
+                repository = self._get_repository(repo_name)
+                if repository is None or repository.name not in parsed:
                     continue
 
-                current_version = version_map.get(dep["name"], {}).get("version")
-                required_version = dep.get("required_version", "")
-
-                if current_version and required_version:
-                    # Extract version without prefix
-                    clean_required = required_version.lstrip("^~=")
-
-                    if clean_required != current_version:
+                dependencies = self._get_dependency_info(
+                    repository, parsed=parsed[repository.name], versions=versions
+                )
+                managed_deps = [
+                    dep
+                    for dep in dependencies
+                    if dep.get("managed") and not dep.get("is_path")
+                ]
+
+                for dep in managed_deps:
+                    dep_name = dep["name"]
+                    current_version = version_lookup.get(dep_name)
+                    required_version = dep.get("required_version")
+                    if not current_version or not required_version:
+                        continue
+
+                    # Compare the version without its operator prefix
+                    if _strip_version_prefix(required_version) != current_version:
                         updates_needed.append(
                             {
                                 "repo": repository,
-                                "dependency": dep["name"],
+                                "dependency": dep_name,
                                 "current_required": required_version,
                                 "new_required": f"^{current_version}",
                                 "actual_version": current_version,
@@ -880,19 +1370,18 @@ class VersionManager:
         # Apply updates
         success_count = 0
         for update in updates_needed:
+            update_repo = update["repo"]
             if not dry_run:
                 success = self._update_dependency_version(
-                    update["repo"], update["dependency"], update["actual_version"]
+                    update_repo, update["dependency"], update["actual_version"]
                 )
                 if success:
                     success_count += 1
-                    console.print(f"  [green]✓[/green] Updated {update['repo'].name}")
+                    console.print(f"  [green]✓[/green] Updated {update_repo.name}")
                 else:
-                    console.print(
-                        f"  [red]✗[/red] Failed to update {update['repo'].name}"
-                    )
+                    console.print(f"  [red]✗[/red] Failed to update {update_repo.name}")
             else:
-                console.print(f"  [dim]Would update {update['repo'].name}[/dim]")
+                console.print(f"  [dim]Would update {update_repo.name}[/dim]")
                 success_count += 1
 
         if not dry_run:
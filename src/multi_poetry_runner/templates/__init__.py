@@ -85,6 +85,7 @@ __pycache__/
 logs/
 backups/
 .dependency-mode
+.mpr_cache/
 
 # IDE
 .idea/
@@ -140,6 +141,7 @@ services:
 
 # Dockerfile for testing
 DOCKERFILE_TEST_TEMPLATE = """
+# syntax=docker/dockerfile:1.7
 FROM python:{python_version}-slim
 
 WORKDIR /app
@@ -152,13 +154,14 @@ RUN apt-get update && apt-get install -y \\
 
 # Install Poetry
 RUN pip install poetry
-
+RUN poetry config virtualenvs.create false
+{repo_layers}
 # Copy workspace
 COPY . .
 
 # Install all packages
-RUN poetry config virtualenvs.create false
-RUN for dir in repos/*/; do \\
+RUN --mount=type=cache,target=/root/.cache/pypoetry \\
+    for dir in repos/*/; do \\
         if [ -f "$dir/pyproject.toml" ]; then \\
             cd "$dir" && poetry install && cd /app; \\
         fi \\
@@ -168,11 +171,19 @@ RUN for dir in repos/*/; do \\
 RUN pip install pytest pytest-html pytest-timeout
 """
 
+# Per-repository dependency layer for the test Dockerfile, so unchanged
+# repositories are served from the build cache
+DOCKERFILE_TEST_REPO_LAYER_TEMPLATE = """
+# Dependencies for {name}
+COPY repos/{name}/pyproject.toml repos/{name}/poetry.lock* repos/{name}/
+RUN --mount=type=cache,target=/root/.cache/pypoetry \\
+    cd repos/{name} && poetry install --no-root --no-directory
+"""
+
 # Basic integration test template
 BASIC_INTEGRATION_TEST_TEMPLATE = '''"""Basic integration tests."""
 
 import pytest
-{imports}
 
 
 def test_package_imports():
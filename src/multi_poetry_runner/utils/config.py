@@ -1,10 +1,35 @@
 """Configuration management utilities."""
 
+import functools
+import os
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
+if TYPE_CHECKING:
+    import yaml
+
+# Parsed config files by resolved path, with the (mtime, size) they were
+# parsed at, shared by all ConfigManager instances
+_config_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+_config_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _yaml_codec() -> tuple[type["yaml.SafeLoader"], type["yaml.SafeDumper"]]:
+    """Import PyYAML on first use and pick its safe loader and dumper.
+
+    Commands that never touch the config file (like --help) skip the import.
+    The libyaml bindings are preferred when PyYAML was built with them.
+    """
+    import yaml
+
+    try:
+        return yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:  # pragma: no cover - PyYAML built without libyaml
+        return yaml.SafeLoader, yaml.SafeDumper
 
 
 @dataclass
@@ -38,17 +63,31 @@ class ConfigManager:
         self.workspace_root = workspace_root or Path.cwd()
         self.config_file = config_file or self.workspace_root / "mpr-config.yaml"
         self._config: WorkspaceConfig | None = None
+        # (mtime, size) of the config file the cached config was read from
+        # or written to, None for configs that did not come from the file
+        self._config_key: tuple[int, int] | None = None
+        # Repositories of the cached config by name, built on first lookup
+        self._by_name: dict[str, RepositoryConfig] | None = None
+        # Topological order of the config it was computed for
+        self._dependency_order: (
+            tuple[tuple[tuple[str, tuple[str, ...]], ...], list[str]] | None
+        ) = None
 
     def load_config(self) -> WorkspaceConfig:
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        The parsed config is reused until the file changes on disk.
+        """
         if self._config is not None:
-            return self._config
+            config_key = self._stat_config() if self._config_key else None
+            if config_key is None or config_key == self._config_key:
+                return self._config
 
-        if not self.config_file.exists():
+        config_key = self._stat_config()
+        if config_key is None:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
 
-        with open(self.config_file) as f:
-            data = yaml.safe_load(f)
+        data = self._read_config_data(config_key)
 
         # Parse repositories
         repositories = []
@@ -59,7 +98,7 @@ class ConfigManager:
                 package_name=repo_data["package_name"],
                 path=self.workspace_root / "repos" / repo_data["name"],
                 branch=repo_data.get("branch", "main"),
-                dependencies=repo_data.get("dependencies", []),
+                dependencies=list(repo_data.get("dependencies", [])),
                 source=repo_data.get("source", "pypi"),
             )
             repositories.append(repo)
@@ -69,9 +108,40 @@ class ConfigManager:
             python_version=data["workspace"].get("python_version", "3.11"),
             repositories=repositories,
         )
+        self._config_key = config_key
+        self._by_name = None
 
         return self._config
 
+    def _read_config_data(self, config_key: tuple[int, int]) -> Any:
+        """Parse the config file, reusing an earlier parse of the same file.
+
+        The parsed data is shared by all managers of the config file in the
+        process and must not be modified.
+        """
+        path = self.config_file.resolve()
+        with _config_cache_lock:
+            cached = _config_cache.get(path)
+        if cached is not None and cached[0] == config_key:
+            return cached[1]
+
+        import yaml
+
+        loader, _ = _yaml_codec()
+        data = yaml.load(self.config_file.read_bytes(), Loader=loader)
+
+        with _config_cache_lock:
+            _config_cache[path] = (config_key, data)
+        return data
+
+    def _stat_config(self) -> tuple[int, int] | None:
+        """Get the (mtime, size) of the config file, None if it is missing."""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def save_config(self, config: WorkspaceConfig) -> None:
         """Save configuration to file."""
         data: dict[str, Any] = {
@@ -86,7 +156,8 @@ class ConfigManager:
                 "url": repo.url,
                 "package_name": repo.package_name,
                 "branch": repo.branch,
-                "dependencies": repo.dependencies,
+                # Copied: the data is cached and must not follow later edits
+                "dependencies": list(repo.dependencies),
                 "source": repo.source,
             }
             data["repositories"].append(repo_data)
@@ -94,64 +165,116 @@ class ConfigManager:
         # Ensure directory exists
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.config_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        import yaml
+
+        _, dumper = _yaml_codec()
+        content = yaml.dump(
+            data,
+            Dumper=dumper,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding="utf-8",
+        )
+        # Stage the file and move it into place so readers never see a
+        # partially written config
+        tmp_path = self.config_file.with_name(f"{self.config_file.name}.tmp")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, self.config_file)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
         self._config = config
+        self._config_key = self._stat_config()
+        if self._config_key is not None:
+            # Later loads in this process can skip parsing what was written
+            with _config_cache_lock:
+                _config_cache[self.config_file.resolve()] = (self._config_key, data)
+        # The config may have been changed in place before saving
+        self._dependency_order = None
+        self._by_name = None
 
     def get_repository(self, name: str) -> RepositoryConfig | None:
         """Get repository configuration by name."""
-        config = self.load_config()
-        for repo in config.repositories:
-            if repo.name == name:
-                return repo
-        return None
+        return self._repository_index().get(name)
 
     def add_repository(self, repo: RepositoryConfig) -> None:
         """Add a repository to the configuration."""
+        self.add_repositories([repo])
+
+    def add_repositories(self, repos: list[RepositoryConfig]) -> None:
+        """Add several repositories to the configuration, saving it once.
+
+        Nothing is added if any of the repositories already exists.
+        """
+        by_name = self._repository_index()
         config = self.load_config()
 
-        # Check if repository already exists
-        for existing_repo in config.repositories:
-            if existing_repo.name == repo.name:
+        # Check if any repository already exists, including earlier in repos
+        names: set[str] = set()
+        for repo in repos:
+            if repo.name in by_name or repo.name in names:
                 raise ValueError(f"Repository {repo.name} already exists")
+            names.add(repo.name)
 
-        config.repositories.append(repo)
+        config.repositories.extend(repos)
         self.save_config(config)
 
+    def _repository_index(self) -> dict[str, RepositoryConfig]:
+        """Get the repositories of the current config by name.
+
+        The index is rebuilt when the config is reloaded or saved; edits made
+        to the repository list in place are seen after save_config.
+        """
+        config = self.load_config()
+        if self._by_name is None:
+            # Reversed so the first of any duplicate names wins, as in a scan
+            self._by_name = {repo.name: repo for repo in reversed(config.repositories)}
+        return self._by_name
+
     def get_dependency_order(self) -> list[str]:
         """Get repositories in dependency order (topological sort)."""
         config = self.load_config()
 
-        # Build dependency graph
-        graph: dict[str, list[str]] = {}
-        for repo in config.repositories:
-            graph[repo.name] = repo.dependencies
-
-        # Topological sort
-        visited = set()
-        temp_visited = set()
+        # The order only depends on repository names and their dependencies,
+        # so edits made to the loaded config in place are noticed too
+        graph = tuple(
+            (repo.name, tuple(repo.dependencies)) for repo in config.repositories
+        )
+        cached = self._dependency_order
+        if cached is not None and cached[0] == graph:
+            return list(cached[1])
+
+        # Build dependency graph; dependencies outside the workspace are
+        # nodes too, ordered before the repositories that need them
+        in_degree: dict[str, int] = {}
+        dependents: dict[str, list[str]] = {}
+        for name, dependencies in graph:
+            in_degree.setdefault(name, 0)
+            for dep in dependencies:
+                in_degree.setdefault(dep, 0)
+                in_degree[name] += 1
+                dependents.setdefault(dep, []).append(name)
+
+        # Kahn's algorithm, starting from the nodes without dependencies
+        queue = deque(name for name, degree in in_degree.items() if degree == 0)
         result = []
-
-        def visit(node: str) -> None:
-            if node in temp_visited:
-                raise ValueError(f"Circular dependency detected involving {node}")
-            if node in visited:
-                return
-
-            temp_visited.add(node)
-
-            for dep in graph.get(node, []):
-                visit(dep)
-
-            temp_visited.remove(node)
-            visited.add(node)
+        while queue:
+            node = queue.popleft()
             result.append(node)
+            for dependent in dependents.get(node, []):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(result) < len(in_degree):
+            cycle = sorted(name for name, degree in in_degree.items() if degree > 0)
+            raise ValueError(
+                f"Circular dependency detected involving {', '.join(cycle)}"
+            )
 
-        for repo_name in graph:
-            visit(repo_name)
-
-        return result
+        self._dependency_order = (graph, result)
+        return list(result)
 
     @property
     def workspace_root(self) -> Path:
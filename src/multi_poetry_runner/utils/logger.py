@@ -1,14 +1,35 @@
 """Logging utilities for MPR."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from rich.console import Console
-from rich.logging import RichHandler
+# Background listener writing queued records to the log file
+_file_listener: QueueListener | None = None
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and stop the listener."""
+    global _file_listener
+
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
 
 
 def setup_logging(level: int = logging.INFO, log_file: Path | None = None) -> None:
     """Set up logging configuration with Rich handler."""
+    # Imported here so importing the package doesn't load rich's logging
+    # and traceback machinery
+    from rich.console import Console
+    from rich.logging import RichHandler
 
     # Create logs directory if needed
     if log_file:
@@ -26,6 +47,7 @@ def setup_logging(level: int = logging.INFO, log_file: Path | None = None) -> No
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    _stop_file_listener()
 
     # Console handler with Rich
     console_handler = RichHandler(
@@ -46,9 +68,15 @@ def setup_logging(level: int = logging.INFO, log_file: Path | None = None) -> No
     )
     file_handler.setFormatter(file_formatter)
 
+    # Log calls only enqueue the record; a listener thread does the writes
+    global _file_listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
+
     # Add handlers
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(QueueHandler(log_queue))
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,43 @@
+"""Subprocess utilities for MPR."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+
+async def run_async(
+    cmd: list[str],
+    cwd: Path,
+    timeout: float | None = None,
+    check: bool = False,
+) -> subprocess.CompletedProcess[str]:
+    """Run a command without blocking the event loop.
+
+    Mirrors subprocess.run with captured text output. The process is killed
+    and reaped if it times out or the awaiting task is cancelled.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout or 0) from None
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+
+    result = subprocess.CompletedProcess(
+        cmd, process.returncode or 0, stdout.decode(), stderr.decode()
+    )
+    if check:
+        result.check_returncode()
+
+    return result
@@ -0,0 +1,78 @@
+"""pyproject.toml utilities for MPR."""
+
+import functools
+import os
+import threading
+import tomllib
+from pathlib import Path
+from typing import Any
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Get the (mtime, size) of a file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=1024)
+def package_name_variants(name: str) -> tuple[str, str, str]:
+    """Get the spellings a package name may have in a dependency table.
+
+    The name as given comes first, then underscored and hyphenated.
+    """
+    return (name, name.replace("-", "_"), name.replace("_", "-"))
+
+
+class PyprojectCache:
+    """Parsed pyproject.toml files, reparsed only when a file changes.
+
+    Entries are validated against the file's (mtime, size), so a rewrite
+    within the timestamp resolution of the filesystem is still noticed
+    when the size changes. Callers that edit parsed data in place must
+    store() it after writing or discard() it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> dict[str, Any] | None:
+        """Load a pyproject.toml, or None if the file does not exist.
+
+        Raises tomllib.TOMLDecodeError if the file is not valid TOML.
+        """
+        key = _stat_key(path)
+        if key is None:
+            return None
+
+        with self._lock:
+            cached = self._entries.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            self._entries[path] = (key, data)
+        return data
+
+    def store(self, path: Path, data: dict[str, Any]) -> None:
+        """Remember data that was just written to path."""
+        key = _stat_key(path)
+        with self._lock:
+            if key is None:
+                self._entries.pop(path, None)
+            else:
+                self._entries[path] = (key, data)
+
+    def discard(self, path: Path) -> None:
+        """Forget the parsed data of path."""
+        with self._lock:
+            self._entries.pop(path, None)
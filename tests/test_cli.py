@@ -1,5 +1,6 @@
 """Test CLI interface."""
 
+import shutil
 import unittest.mock
 from pathlib import Path
 from unittest.mock import patch
@@ -10,12 +11,34 @@ from click.testing import CliRunner as _CliRunner
 from multi_poetry_runner.cli import main
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner() -> _CliRunner:
     """Create a Click test runner."""
     return _CliRunner()
 
 
+@pytest.fixture(scope="session")
+def initialized_workspace_source(
+    runner: _CliRunner, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Initialize a workspace once for the whole session."""
+    workspace = tmp_path_factory.mktemp("ws")
+    result = runner.invoke(
+        main, ["--workspace", str(workspace), "workspace", "init", "test-workspace"]
+    )
+    assert result.exit_code == 0
+    return workspace
+
+
+@pytest.fixture
+def initialized_workspace(
+    temp_workspace: Path, initialized_workspace_source: Path
+) -> Path:
+    """Create an initialized workspace the test is free to modify."""
+    shutil.copytree(initialized_workspace_source, temp_workspace, dirs_exist_ok=True)
+    return temp_workspace
+
+
 def test_main_help(runner: _CliRunner) -> None:
     """Test main help command."""
     result = runner.invoke(main, ["--help"])
@@ -58,31 +81,28 @@ def test_workspace_init_with_python_version(
 
 @patch("multi_poetry_runner.core.workspace.WorkspaceManager.setup_workspace")
 def test_workspace_setup(
-    mock_setup: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_setup: unittest.mock.MagicMock, runner: _CliRunner, initialized_workspace: Path
 ) -> None:
     """Test workspace setup command."""
-    # First initialize workspace
     with runner.isolated_filesystem():
         runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
+            main, ["--workspace", str(initialized_workspace), "workspace", "setup"]
         )
 
-        # Then test setup
-        runner.invoke(main, ["--workspace", str(temp_workspace), "workspace", "setup"])
-
         mock_setup.assert_called_once()
 
 
 @patch("multi_poetry_runner.core.workspace.WorkspaceManager.get_status")
 def test_workspace_status(
-    mock_status: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_status: unittest.mock.MagicMock,
+    runner: _CliRunner,
+    initialized_workspace: Path,
 ) -> None:
     """Test workspace status command."""
     mock_status.return_value = {
         "workspace": {
             "name": "test-workspace",
-            "root": str(temp_workspace),
+            "root": str(initialized_workspace),
             "python_version": "3.11",
             "dependency_mode": "remote",
         },
@@ -91,30 +111,24 @@ def test_workspace_status(
 
     with runner.isolated_filesystem():
         runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
+            main, ["--workspace", str(initialized_workspace), "workspace", "status"]
         )
 
-        runner.invoke(main, ["--workspace", str(temp_workspace), "workspace", "status"])
-
         mock_status.assert_called_once()
 
 
 @patch("multi_poetry_runner.core.dependencies.DependencyManager.switch_to_local")
 def test_deps_switch_local(
-    mock_switch: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_switch: unittest.mock.MagicMock,
+    runner: _CliRunner,
+    initialized_workspace: Path,
 ) -> None:
     """Test dependency switch to local command."""
     mock_switch.return_value = True
 
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
-            main, ["--workspace", str(temp_workspace), "deps", "switch", "local"]
+            main, ["--workspace", str(initialized_workspace), "deps", "switch", "local"]
         )
 
         assert result.exit_code == 0
@@ -123,19 +137,17 @@ def test_deps_switch_local(
 
 @patch("multi_poetry_runner.core.dependencies.DependencyManager.switch_to_remote")
 def test_deps_switch_remote(
-    mock_switch: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_switch: unittest.mock.MagicMock,
+    runner: _CliRunner,
+    initialized_workspace: Path,
 ) -> None:
     """Test dependency switch to remote command."""
     mock_switch.return_value = True
 
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
-            main, ["--workspace", str(temp_workspace), "deps", "switch", "remote"]
+            main,
+            ["--workspace", str(initialized_workspace), "deps", "switch", "remote"],
         )
 
         assert result.exit_code == 0
@@ -144,38 +156,30 @@ def test_deps_switch_remote(
 
 @patch("multi_poetry_runner.core.dependencies.DependencyManager.switch_to_test")
 def test_deps_switch_test(
-    mock_switch: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_switch: unittest.mock.MagicMock,
+    runner: _CliRunner,
+    initialized_workspace: Path,
 ) -> None:
     """Test dependency switch to test command."""
     mock_switch.return_value = True
 
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
-            main, ["--workspace", str(temp_workspace), "deps", "switch", "test"]
+            main, ["--workspace", str(initialized_workspace), "deps", "switch", "test"]
         )
 
         assert result.exit_code == 0
         mock_switch.assert_called_once_with(dry_run=False)
 
 
-def test_deps_switch_dry_run(runner: _CliRunner, temp_workspace: Path) -> None:
+def test_deps_switch_dry_run(runner: _CliRunner, initialized_workspace: Path) -> None:
     """Test dependency switch with dry run."""
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
             main,
             [
                 "--workspace",
-                str(temp_workspace),
+                str(initialized_workspace),
                 "deps",
                 "switch",
                 "local",
@@ -189,20 +193,24 @@ def test_deps_switch_dry_run(runner: _CliRunner, temp_workspace: Path) -> None:
 
 @patch("multi_poetry_runner.core.release.ReleaseCoordinator.create_release")
 def test_release_create(
-    mock_release: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_release: unittest.mock.MagicMock,
+    runner: _CliRunner,
+    initialized_workspace: Path,
 ) -> None:
     """Test release creation command."""
     mock_release.return_value = True
 
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
             main,
-            ["--workspace", str(temp_workspace), "release", "create", "--stage", "dev"],
+            [
+                "--workspace",
+                str(initialized_workspace),
+                "release",
+                "create",
+                "--stage",
+                "dev",
+            ],
         )
 
         assert result.exit_code == 0
@@ -211,40 +219,32 @@ def test_release_create(
 
 @patch("multi_poetry_runner.core.testing.ExecutorService.run_unit_tests")
 def test_test_unit(
-    mock_test: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_test: unittest.mock.MagicMock, runner: _CliRunner, initialized_workspace: Path
 ) -> None:
     """Test unit test command."""
     mock_test.return_value = True
 
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
-            main, ["--workspace", str(temp_workspace), "test", "unit"]
+            main, ["--workspace", str(initialized_workspace), "test", "unit"]
         )
 
         assert result.exit_code == 0
-        mock_test.assert_called_once_with(parallel=False, coverage=False)
+        mock_test.assert_called_once_with(
+            parallel=False, coverage=False, batch=False
+        )
 
 
 @patch("multi_poetry_runner.core.testing.ExecutorService.run_integration_tests")
 def test_test_integration(
-    mock_test: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_test: unittest.mock.MagicMock, runner: _CliRunner, initialized_workspace: Path
 ) -> None:
     """Test integration test command."""
     mock_test.return_value = True
 
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
-            main, ["--workspace", str(temp_workspace), "test", "integration"]
+            main, ["--workspace", str(initialized_workspace), "test", "integration"]
         )
 
         assert result.exit_code == 0
@@ -253,17 +253,14 @@ def test_test_integration(
 
 @patch("multi_poetry_runner.core.hooks.GitHooksManager.install_hooks")
 def test_hooks_install(
-    mock_install: unittest.mock.MagicMock, runner: _CliRunner, temp_workspace: Path
+    mock_install: unittest.mock.MagicMock,
+    runner: _CliRunner,
+    initialized_workspace: Path,
 ) -> None:
     """Test hooks installation command."""
     with runner.isolated_filesystem():
-        runner.invoke(
-            main,
-            ["--workspace", str(temp_workspace), "workspace", "init", "test-workspace"],
-        )
-
         result = runner.invoke(
-            main, ["--workspace", str(temp_workspace), "hooks", "install"]
+            main, ["--workspace", str(initialized_workspace), "hooks", "install"]
         )
 
         assert result.exit_code == 0
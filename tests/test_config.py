@@ -1,6 +1,10 @@
 """Test configuration manager."""
 
+import os
+import shutil
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -12,9 +16,9 @@ from multi_poetry_runner.utils.config import (
 )
 
 
-@pytest.fixture
-def sample_config(temp_workspace: Path) -> Path:
-    """Create a sample configuration file."""
+@pytest.fixture(scope="session")
+def sample_config_source(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the sample configuration file once for the whole session."""
     config_data = {
         "version": "1.0",
         "workspace": {"name": "test-workspace", "python_version": "3.11"},
@@ -38,13 +42,21 @@ def sample_config(temp_workspace: Path) -> Path:
         ],
     }
 
-    config_file = temp_workspace / "mpr-config.yaml"
+    config_file = tmp_path_factory.mktemp("cfg") / "mpr-config.yaml"
     with open(config_file, "w") as f:
         yaml.dump(config_data, f)
 
     return config_file
 
 
+@pytest.fixture
+def sample_config(temp_workspace: Path, sample_config_source: Path) -> Path:
+    """Create a sample configuration file the test is free to modify."""
+    config_file = temp_workspace / "mpr-config.yaml"
+    shutil.copy(sample_config_source, config_file)
+    return config_file
+
+
 def test_config_manager_init(temp_workspace: Path) -> None:
     """Test ConfigManager initialization."""
     config_manager = ConfigManager(workspace_root=temp_workspace)
@@ -76,6 +88,42 @@ def test_load_config(temp_workspace: Path, sample_config: Path) -> None:
     assert repo2.dependencies == ["repo1"]
 
 
+def test_load_config_reuses_unchanged_file(
+    temp_workspace: Path, sample_config: Path
+) -> None:
+    """Test that the config is only reparsed after the file changes."""
+    config_manager = ConfigManager(
+        config_file=sample_config, workspace_root=temp_workspace
+    )
+    config = config_manager.load_config()
+    assert config_manager.load_config() is config
+
+    data = yaml.safe_load(sample_config.read_text())
+    data["workspace"]["name"] = "renamed-workspace"
+    sample_config.write_text(yaml.dump(data))
+    os.utime(sample_config, ns=(0, 1))
+
+    assert config_manager.load_config().name == "renamed-workspace"
+
+
+def test_load_config_shares_parse_across_managers(
+    temp_workspace: Path, sample_config: Path
+) -> None:
+    """Test that managers of the same file share one parse of it."""
+    with patch("yaml.load", wraps=yaml.load) as mock_load:
+        first = ConfigManager(config_file=sample_config, workspace_root=temp_workspace)
+        second = ConfigManager(config_file=sample_config, workspace_root=temp_workspace)
+        first.load_config()
+        second.load_config()
+        assert mock_load.call_count == 1
+
+        sample_config.write_text(sample_config.read_text() + "\n")
+        ConfigManager(
+            config_file=sample_config, workspace_root=temp_workspace
+        ).load_config()
+        assert mock_load.call_count == 2
+
+
 def test_save_config(temp_workspace: Path) -> None:
     """Test saving configuration to file."""
     config_manager = ConfigManager(workspace_root=temp_workspace)
@@ -94,6 +142,7 @@ def test_save_config(temp_workspace: Path) -> None:
     # Verify file was created and contains correct data
     config_file = temp_workspace / "mpr-config.yaml"
     assert config_file.exists()
+    assert not config_file.with_name("mpr-config.yaml.tmp").exists()
 
     with open(config_file) as f:
         data = yaml.safe_load(f)
@@ -103,6 +152,24 @@ def test_save_config(temp_workspace: Path) -> None:
     assert data["repositories"][0]["name"] == "test-repo"
 
 
+def test_save_config_caches_a_snapshot(temp_workspace: Path) -> None:
+    """Test in-place edits after a save don't leak into the shared parse."""
+    config_manager = ConfigManager(workspace_root=temp_workspace)
+    repo = RepositoryConfig(
+        name="test-repo",
+        url="https://github.com/test/test-repo.git",
+        package_name="test_repo",
+        path=temp_workspace / "repos" / "test-repo",
+        dependencies=["base"],
+    )
+    config_manager.save_config(WorkspaceConfig(name="test", repositories=[repo]))
+
+    repo.dependencies.append("other")
+
+    other_manager = ConfigManager(workspace_root=temp_workspace)
+    assert other_manager.load_config().repositories[0].dependencies == ["base"]
+
+
 def test_get_dependency_order(temp_workspace: Path, sample_config: Path) -> None:
     """Test dependency order calculation."""
     config_manager = ConfigManager(
@@ -148,6 +215,62 @@ def test_get_dependency_order_circular(temp_workspace: Path) -> None:
         config_manager.get_dependency_order()
 
 
+def test_get_dependency_order_deep_chain(temp_workspace: Path) -> None:
+    """Test ordering a dependency chain deeper than the recursion limit."""
+    depth = sys.getrecursionlimit() + 100
+    config_manager = ConfigManager(workspace_root=temp_workspace)
+    config_manager._config = WorkspaceConfig(
+        name="test-workspace",
+        repositories=[
+            RepositoryConfig(
+                name=f"repo{i}",
+                url=f"https://github.com/test/repo{i}.git",
+                package_name=f"repo{i}",
+                path=temp_workspace / "repos" / f"repo{i}",
+                dependencies=[f"repo{i + 1}"] if i + 1 < depth else [],
+            )
+            for i in range(depth)
+        ],
+    )
+
+    order = config_manager.get_dependency_order()
+
+    assert order == [f"repo{i}" for i in reversed(range(depth))]
+
+
+def test_get_dependency_order_is_cached(
+    temp_workspace: Path, sample_config: Path
+) -> None:
+    """Test that the dependency order is reused until the config is saved."""
+    config_manager = ConfigManager(
+        config_file=sample_config, workspace_root=temp_workspace
+    )
+
+    order = config_manager.get_dependency_order()
+    assert order == ["repo1", "repo2"]
+
+    # Callers get their own copy of the cached order
+    order.clear()
+    assert config_manager.get_dependency_order() == ["repo1", "repo2"]
+
+    config_manager.add_repository(
+        RepositoryConfig(
+            name="repo0",
+            url="https://github.com/test/repo0.git",
+            package_name="repo0",
+            path=temp_workspace / "repos" / "repo0",
+            dependencies=["repo2"],
+        )
+    )
+    assert config_manager.get_dependency_order() == ["repo1", "repo2", "repo0"]
+
+    # Dependencies edited on the loaded config are picked up without a save
+    config = config_manager.load_config()
+    config.repositories[0].dependencies.append("repo0")
+    with pytest.raises(ValueError, match="Circular dependency"):
+        config_manager.get_dependency_order()
+
+
 def test_add_repository(temp_workspace: Path, sample_config: Path) -> None:
     """Test adding a repository to configuration."""
     config_manager = ConfigManager(
@@ -201,3 +324,96 @@ def test_get_repository(temp_workspace: Path, sample_config: Path) -> None:
 
     non_existent = config_manager.get_repository("non-existent")
     assert non_existent is None
+
+
+def test_get_repository_follows_config_changes(
+    temp_workspace: Path, sample_config: Path
+) -> None:
+    """Test that repository lookups see repositories added or replaced."""
+    config_manager = ConfigManager(
+        config_file=sample_config, workspace_root=temp_workspace
+    )
+    assert config_manager.get_repository("repo3") is None
+
+    new_repo = RepositoryConfig(
+        name="repo3",
+        url="https://github.com/test/repo3.git",
+        package_name="repo3",
+        path=temp_workspace / "repos" / "repo3",
+    )
+    config_manager.add_repository(new_repo)
+    assert config_manager.get_repository("repo3") is new_repo
+
+    config = config_manager.load_config()
+    config.repositories = [new_repo]
+    config_manager.save_config(config)
+    assert config_manager.get_repository("repo1") is None
+    assert config_manager.get_repository("repo3") is new_repo
+
+    # A same-named replacement is returned instead of the original
+    replacement = RepositoryConfig(
+        name="repo3",
+        url="https://github.com/test/fork.git",
+        package_name="repo3",
+        path=temp_workspace / "repos" / "repo3",
+    )
+    config.repositories[0] = replacement
+    config_manager.save_config(config)
+    assert config_manager.get_repository("repo3") is replacement
+
+    # Reloading a rewritten file replaces the repositories
+    other_manager = ConfigManager(
+        config_file=sample_config, workspace_root=temp_workspace
+    )
+    other_config = other_manager.load_config()
+    other_config.repositories[0].url = "https://github.com/test/moved.git"
+    other_manager.save_config(other_config)
+    os.utime(sample_config, ns=(0, 1))
+    repo = config_manager.get_repository("repo3")
+    assert repo is not None
+    assert repo.url == "https://github.com/test/moved.git"
+
+
+def test_add_repositories_saves_once(temp_workspace: Path, sample_config: Path) -> None:
+    """Test adding several repositories writes the config a single time."""
+    config_manager = ConfigManager(
+        config_file=sample_config, workspace_root=temp_workspace
+    )
+    new_repos = [
+        RepositoryConfig(
+            name=name,
+            url=f"https://github.com/test/{name}.git",
+            package_name=name,
+            path=temp_workspace / "repos" / name,
+        )
+        for name in ("repo3", "repo4")
+    ]
+
+    with patch.object(
+        config_manager, "save_config", wraps=config_manager.save_config
+    ) as mock_save:
+        config_manager.add_repositories(new_repos)
+
+    mock_save.assert_called_once()
+    reloaded = ConfigManager(config_file=sample_config, workspace_root=temp_workspace)
+    assert [repo.name for repo in reloaded.load_config().repositories] == [
+        "repo1",
+        "repo2",
+        "repo3",
+        "repo4",
+    ]
+
+    # A batch with any existing name is rejected as a whole
+    with pytest.raises(ValueError, match="repo4 already exists"):
+        config_manager.add_repositories(
+            [
+                RepositoryConfig(
+                    name="repo5",
+                    url="https://github.com/test/repo5.git",
+                    package_name="repo5",
+                    path=temp_workspace / "repos" / "repo5",
+                ),
+                new_repos[1],
+            ]
+        )
+    assert config_manager.get_repository("repo5") is None
@@ -0,0 +1,64 @@
+"""Test subprocess utilities."""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from multi_poetry_runner.utils.process import run_async
+
+
+def test_run_async_captures_output(tmp_path: Path) -> None:
+    """Test the helper returns output like subprocess.run."""
+    result = asyncio.run(run_async([sys.executable, "-c", "print('hello')"], tmp_path))
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "hello"
+
+    result = asyncio.run(run_async([sys.executable, "-c", "exit(3)"], tmp_path))
+    assert result.returncode == 3
+
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(run_async([sys.executable, "-c", "exit(3)"], tmp_path, check=True))
+
+
+def test_run_async_kills_process_on_timeout(tmp_path: Path) -> None:
+    """Test a command running past its timeout is killed."""
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(
+            run_async(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                tmp_path,
+                timeout=0.2,
+            )
+        )
+
+
+def test_run_async_kills_process_on_cancel(tmp_path: Path) -> None:
+    """Test cancelling the awaiting task kills and reaps the process."""
+    processes: list[asyncio.subprocess.Process] = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def tracking_exec(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+        process = await create_subprocess_exec(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    async def cancel_running() -> None:
+        task = asyncio.create_task(
+            run_async([sys.executable, "-c", "import time; time.sleep(30)"], tmp_path)
+        )
+        while not processes:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with patch("asyncio.create_subprocess_exec", side_effect=tracking_exec):
+        asyncio.run(cancel_running())
+
+    assert processes[0].returncode is not None
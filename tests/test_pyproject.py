@@ -0,0 +1,64 @@
+"""Test pyproject.toml utilities."""
+
+import os
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from multi_poetry_runner.utils.pyproject import PyprojectCache, package_name_variants
+
+
+def test_load_reuses_unchanged_file(tmp_path: Path) -> None:
+    """Test that a file is only reparsed after it changes."""
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text('[tool.poetry]\nname = "pkg"\nversion = "1.0.0"\n')
+    cache = PyprojectCache()
+
+    first = cache.load(pyproject_path)
+    assert first is not None
+    assert cache.load(pyproject_path) is first
+
+    # Same mtime, different size: still reparsed
+    stat = pyproject_path.stat()
+    pyproject_path.write_text('[tool.poetry]\nname = "pkg"\nversion = "1.0.10"\n')
+    os.utime(pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    second = cache.load(pyproject_path)
+    assert second is not None
+    assert second["tool"]["poetry"]["version"] == "1.0.10"
+
+
+def test_load_missing_and_invalid_files(tmp_path: Path) -> None:
+    """Test a missing file loads as None and invalid TOML raises."""
+    pyproject_path = tmp_path / "pyproject.toml"
+    cache = PyprojectCache()
+    assert cache.load(pyproject_path) is None
+
+    pyproject_path.write_text("[tool.poetry\n")
+    with pytest.raises(tomllib.TOMLDecodeError):
+        cache.load(pyproject_path)
+
+
+def test_store_and_discard(tmp_path: Path) -> None:
+    """Test written data is served until it is discarded."""
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text('[tool.poetry]\nname = "pkg"\n')
+    cache = PyprojectCache()
+    written = {"tool": {"poetry": {"name": "pkg"}}}
+
+    cache.store(pyproject_path, written)
+    assert cache.load(pyproject_path) is written
+
+    cache.discard(pyproject_path)
+    reloaded = cache.load(pyproject_path)
+    assert reloaded == written
+    assert reloaded is not written
+
+
+def test_package_name_variants() -> None:
+    """Test the name as given comes first, then underscored and hyphenated."""
+    assert package_name_variants("my-pkg_name") == (
+        "my-pkg_name",
+        "my_pkg_name",
+        "my-pkg-name",
+    )
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import tomllib
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 
-from multi_poetry_runner.core.release import ReleaseCoordinator
+from multi_poetry_runner.core.release import (
+    ReleaseCoordinator,
+    ReleaseStage,
+    ReleaseStatus,
+)
+from multi_poetry_runner.utils.config import ConfigManager, RepositoryConfig
 
 
 def test_release_coordinator_initialization(
@@ -95,3 +104,349 @@ def test_get_repository_changelog(
 
         # Validate current version retrieval
         assert result is not None
+
+
+def test_process_repositories_parallel_dry_run(
+    release_coordinator: ReleaseCoordinator,
+    temp_workspace: Path,
+) -> None:
+    """Test independent repositories are processed concurrently in dry run."""
+    repos = []
+    for name in ["repo-a", "repo-b"]:
+        repo_path = temp_workspace / "repos" / name
+        repo_path.mkdir(parents=True)
+        repos.append(
+            RepositoryConfig(
+                name=name,
+                url=f"https://github.com/test/{name}.git",
+                package_name=name,
+                path=repo_path,
+            )
+        )
+
+    success = release_coordinator._process_repositories_parallel(
+        ["repo-a", "repo-b"], ReleaseStage.DEV, repos, "1.0.0", None, True, True
+    )
+
+    assert success is True
+    assert release_coordinator.release_results == {
+        "repo-a": ReleaseStatus.SUCCESS,
+        "repo-b": ReleaseStatus.SUCCESS,
+    }
+
+
+def test_process_repositories_parallel_uses_release_pipeline(
+    release_coordinator: ReleaseCoordinator,
+    temp_workspace: Path,
+) -> None:
+    """Test concurrent releases run the same per-repository steps."""
+    repos = [
+        RepositoryConfig(
+            name=name,
+            url=f"https://github.com/test/{name}.git",
+            package_name=name,
+            path=temp_workspace / "repos" / name,
+        )
+        for name in ["repo-a", "repo-b"]
+    ]
+
+    with patch.object(
+        release_coordinator, "_process_single_repository", return_value=True
+    ) as mock_process:
+        success = release_coordinator._process_repositories_parallel(
+            ["repo-a", "repo-b"],
+            ReleaseStage.PROD,
+            repos,
+            None,
+            {"repo-a": "2.0.0"},
+            False,
+            True,
+        )
+
+    assert success is True
+    calls = sorted(mock_process.call_args_list, key=lambda call: call.args[0].name)
+    assert [call.args for call in calls] == [
+        (repos[0], ReleaseStage.PROD, "2.0.0", False, True),
+        (repos[1], ReleaseStage.PROD, None, False, True),
+    ]
+
+
+def test_calculate_dependent_version_bump(
+    release_coordinator: ReleaseCoordinator,
+) -> None:
+    """Test dependent version bump rules."""
+    bump = release_coordinator._calculate_dependent_version_bump
+
+    assert bump("1.2.3") == "1.2.4-alpha.1"
+    assert bump("1.2.3-alpha.1") == "1.2.3-alpha.2"
+    assert bump("1.2.3+dev.20240101") == "1.2.4-alpha.1"
+    assert bump("1.2.3a4") == "1.2.3a5"
+    assert bump("1.2.3b2") == "1.2.3b3"
+    assert bump("1.2.3rc1") == "1.2.3rc2"
+    assert bump("1.2.3.post1") == "1.2.3.post1-alpha.1"
+    assert bump("not-a-version") == "not-a-version-alpha.1"
+
+
+def test_find_all_dependent_repositories_cascades(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test cascading dependents are discovered in breadth-first order."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo_d = real_config_manager.get_repository("repo-d")
+    assert repo_d is not None
+
+    dependents = coordinator._find_all_dependent_repositories([repo_d])
+
+    assert [repo.name for repo in dependents] == ["repo-c", "repo-b", "repo-a"]
+
+
+def test_cleanup_orphaned_tags_removes_unreachable_tags(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test tags pointing at commits no longer reachable from HEAD are removed."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo = real_config_manager.get_repository("repo-a")
+    assert repo is not None
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=repo.path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    backup_commit = git("rev-parse", "HEAD")
+    git("tag", "v1.0.0")
+    git("commit", "--allow-empty", "-m", "Release version 1.1.0")
+    git("tag", "-a", "v1.1.0", "-m", "Release v1.1.0")
+    git("tag", "v1.1.0-light")
+    git("reset", "--hard", backup_commit)
+
+    coordinator._cleanup_orphaned_tags(repo, backup_commit)
+
+    assert git("tag", "-l").split() == ["v1.0.0"]
+
+
+def test_update_dependency_version_rewrites_pyproject(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test a dependent's pyproject.toml is rewritten with the new constraint."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo = real_config_manager.get_repository("repo-a")
+    assert repo is not None
+
+    pyproject_path = repo.path / "pyproject.toml"
+    pyproject_path.write_text(
+        '[tool.poetry]\nname = "repo-a"\nversion = "1.0.0"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.11"\nrepo_b = "^1.0.0"\n'
+    )
+
+    assert coordinator._update_dependency_version(repo, "repo-b", "1.1.0") is True
+    assert coordinator._update_dependency_version(repo, "repo-b", "1.1.0") is False
+    assert "^1.0.0" in pyproject_path.read_text()  # write is deferred
+
+    coordinator._flush_pyproject_writes()
+
+    with open(pyproject_path, "rb") as f:
+        dependencies = tomllib.load(f)["tool"]["poetry"]["dependencies"]
+    assert dependencies == {"python": "^3.11", "repo_b": "^1.1.0"}
+
+
+def test_update_repository_version_invalidates_parsed_pyproject(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test a same-length version rewrite within one mtime tick is noticed."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo = real_config_manager.get_repository("repo-a")
+    assert repo is not None
+
+    pyproject_path = repo.path / "pyproject.toml"
+    pyproject_path.write_text('[tool.poetry]\nname = "repo-a"\nversion = "1.2.3"\n')
+    assert coordinator._get_current_version(repo) == "1.2.3"
+
+    stat = os.stat(pyproject_path)
+
+    def fake_poetry_version(cmd: list[str], **kwargs: Any) -> Mock:
+        pyproject_path.write_text('[tool.poetry]\nname = "repo-a"\nversion = "1.2.4"\n')
+        os.utime(pyproject_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        return Mock(returncode=0)
+
+    with patch("subprocess.run", side_effect=fake_poetry_version):
+        coordinator._update_repository_version(repo, "1.2.4")
+
+    assert coordinator._get_current_version(repo) == "1.2.4"
+
+
+def test_update_dependent_repositories_cascades_by_level(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test released versions cascade through dependents level by level."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo_dependencies = {"repo-c": "repo-d", "repo-b": "repo-c", "repo-a": "repo-b"}
+
+    for repo_name, dependency in repo_dependencies.items():
+        repo = real_config_manager.get_repository(repo_name)
+        assert repo is not None
+        (repo.path / "pyproject.toml").write_text(
+            f'[tool.poetry]\nname = "{repo_name}"\nversion = "1.0.0"\n\n'
+            f'[tool.poetry.dependencies]\npython = "^3.11"\n{dependency} = "^1.0.0"\n'
+        )
+        subprocess.run(
+            ["git", "commit", "-am", "Add dependency"],
+            cwd=repo.path,
+            check=True,
+            capture_output=True,
+        )
+
+    repo_d = real_config_manager.get_repository("repo-d")
+    assert repo_d is not None
+    (repo_d.path / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "repo-d"\nversion = "1.1.0"\n'
+    )
+
+    def fake_poetry_version(repo: RepositoryConfig, version: str) -> None:
+        pyproject_path = repo.path / "pyproject.toml"
+        pyproject_path.write_text(
+            pyproject_path.read_text().replace(
+                'version = "1.0.0"', f'version = "{version}"', 1
+            )
+        )
+
+    with patch.object(
+        coordinator, "_update_repository_version", side_effect=fake_poetry_version
+    ):
+        assert coordinator._update_dependent_repositories([repo_d]) is True
+
+    repo_a = real_config_manager.get_repository("repo-a")
+    assert repo_a is not None
+    with open(repo_a.path / "pyproject.toml", "rb") as f:
+        poetry = tomllib.load(f)["tool"]["poetry"]
+    assert poetry["version"] == "1.0.1-alpha.1"
+    assert poetry["dependencies"]["repo-b"] == "^1.0.1-alpha.1"
+
+    last_message = subprocess.run(
+        ["git", "log", "-1", "--format=%s"],
+        cwd=repo_a.path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert last_message == (
+        "Update dependencies: repo-d@1.1.0, repo-b@1.0.1-alpha.1; "
+        "bump version to 1.0.1-alpha.1"
+    )
+
+
+def test_get_last_release_info(real_config_manager: ConfigManager) -> None:
+    """Test the latest reachable tag and its commit date are reported."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo = real_config_manager.get_repository("repo-e")
+    assert repo is not None
+
+    assert coordinator._get_last_release_info(repo) is None
+
+    subprocess.run(
+        ["git", "tag", "-a", "v1.0.0", "-m", "Release v1.0.0"],
+        cwd=repo.path,
+        check=True,
+        capture_output=True,
+    )
+    commit_date = subprocess.run(
+        ["git", "log", "-1", "--format=%cd", "--date=iso"],
+        cwd=repo.path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+    assert coordinator._get_last_release_info(repo) == {
+        "tag": "v1.0.0",
+        "date": commit_date,
+    }
+
+
+def test_get_status_preserves_repository_order(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test concurrent status collection keeps the configured order."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+
+    status = coordinator.get_status()
+
+    assert status["workspace"] == "test-workspace"
+    assert [repo["name"] for repo in status["repositories"]] == [
+        "repo-a",
+        "repo-b",
+        "repo-c",
+        "repo-d",
+        "repo-e",
+    ]
+    assert all(repo["current_version"] == "1.0.0" for repo in status["repositories"])
+
+
+def test_rollback_release_relocks_only_changed_repositories(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test rollback skips locking unchanged repos and regenerates failed locks."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    coordinator._create_backups()
+
+    repo_a = real_config_manager.get_repository("repo-a")
+    assert repo_a is not None
+    pyproject_path = repo_a.path / "pyproject.toml"
+    original = pyproject_path.read_text()
+    pyproject_path.write_text(original.replace("1.0.0", "1.0.1", 1))
+
+    with patch.object(
+        coordinator, "_lock_repository", side_effect=lambda repo, regen: regen
+    ) as mock_lock:
+        coordinator._rollback_release()
+
+    assert pyproject_path.read_text() == original
+    assert not pyproject_path.with_name("pyproject.toml.tmp").exists()
+    assert coordinator.backups["repo-a"]["pyproject_toml_bytes"] == original.encode()
+    assert [c.args for c in mock_lock.call_args_list] == [
+        (repo_a, False),
+        (repo_a, True),
+    ]
+    assert set(coordinator.release_results) == set(coordinator.backups)
+    assert all(
+        status == ReleaseStatus.ROLLED_BACK
+        for status in coordinator.release_results.values()
+    )
+
+
+def test_flush_pyproject_writes_preserves_formatting(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test version-only edits patch lines in place and keep comments."""
+    coordinator = ReleaseCoordinator(real_config_manager)
+    repo = real_config_manager.get_repository("repo-a")
+    assert repo is not None
+
+    pyproject_path = repo.path / "pyproject.toml"
+    pyproject_path.write_text(
+        '[tool.poetry]\nname = "repo-a"\nversion = "1.0.0"\n\n'
+        "[tool.poetry.dependencies]\n"
+        'python = "^3.11"  # supported interpreters\n'
+        "repo-b = '^1.0.0'\n"
+        'repo_c = { version = "^1.0.0", optional = true }\n\n'
+        "[tool.poetry.group.dev.dependencies]\n"
+        'repo-b = "^0.9.0"\n'
+    )
+
+    assert coordinator._update_dependency_version(repo, "repo-b", "1.1.0") is True
+    assert coordinator._update_dependency_version(repo, "repo-c", "1.2.0") is True
+    coordinator._flush_pyproject_writes()
+
+    assert pyproject_path.read_text() == (
+        '[tool.poetry]\nname = "repo-a"\nversion = "1.0.0"\n\n'
+        "[tool.poetry.dependencies]\n"
+        'python = "^3.11"  # supported interpreters\n'
+        'repo-b = "^1.1.0"\n'
+        'repo_c = { version = "^1.2.0", optional = true }\n\n'
+        "[tool.poetry.group.dev.dependencies]\n"
+        'repo-b = "^0.9.0"\n'
+    )
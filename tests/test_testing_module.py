@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
+import pytest
 import toml
 
-from multi_poetry_runner.core.testing import ExecutorService
-from multi_poetry_runner.utils.config import RepositoryConfig
+from multi_poetry_runner.core.testing import (
+    ExecutorService,
+    _get_executor,
+    _has_pytest_config,
+    _RepositoryLayout,
+    _scan_repository,
+)
+from multi_poetry_runner.utils.config import (
+    ConfigManager,
+    RepositoryConfig,
+    WorkspaceConfig,
+)
 
 
 def mock_run_method(cmd: list[str], **kwargs: Any) -> Any:
@@ -85,7 +97,8 @@ def test_dummy():
     # Create a Mock for load_config and attach it
     config_mock = Mock()
     config_mock.repositories = [
-        Mock(name=repo_name, path=repos_dir / repo_name) for repo_name in mock_repos
+        Mock(name=repo_name, path=repos_dir / repo_name, dependencies=[])
+        for repo_name in mock_repos
     ]
     mock_load_config = Mock()
     mock_load_config.return_value = config_mock
@@ -292,7 +305,6 @@ def test_dummy():
         patch("subprocess.run", side_effect=mock_run_method),
         patch("builtins.print"),
         patch("builtins.open", create=True),
-        patch("json.dump") as mock_json_dump,
     ):
 
         # Simulate running repository tests
@@ -312,7 +324,7 @@ def test_dummy():
         assert hasattr(summary, "stat")
 
         # Ensure some content was generated for the report
-        mock_json_dump.assert_called_once()
+        assert json.loads(summary.read_text())["summary"]["passed"] == len(mock_repos)
 
         # Optional: check that test results were recorded
         assert len(test_runner.test_results) == len(mock_repos)
@@ -436,3 +448,459 @@ def test_empty_test_directory(
 
         result = test_runner._run_repository_tests(repo_config, "unit")
         assert result is True  # Should succeed when no tests found
+
+
+def test_run_tests_parallel(test_runner: ExecutorService, temp_workspace: Path) -> None:
+    """Test parallel runs record every existing repository and skip missing ones."""
+    repos = []
+    for name in ["repo-a", "repo-b", "repo-c"]:
+        repo_path = temp_workspace / "repos" / name
+        (repo_path / "tests").mkdir(parents=True)
+        (repo_path / "pyproject.toml").write_text(f'[tool.poetry]\nname = "{name}"\n')
+        repos.append(
+            RepositoryConfig(name=name, url="", package_name=name, path=repo_path)
+        )
+    repos.append(
+        RepositoryConfig(
+            name="missing",
+            url="",
+            package_name="missing",
+            path=temp_workspace / "missing",
+        )
+    )
+
+    with patch("subprocess.run", side_effect=mock_run_method):
+        assert test_runner._run_tests_parallel(repos, "unit") is True
+
+    assert sorted(test_runner.test_results) == ["repo-a", "repo-b", "repo-c"]
+    assert test_runner._run_tests_parallel([], "unit") is True
+    assert _get_executor() is _get_executor()
+
+
+def test_run_repository_tests_streams_output_to_log(
+    test_runner: ExecutorService, temp_workspace: Path
+) -> None:
+    """Test pytest output goes to a per-repo log file and failures read its tail."""
+    repo_path = temp_workspace / "repos" / "repo-a"
+    (repo_path / "tests").mkdir(parents=True)
+    (repo_path / "pyproject.toml").write_text('[tool.poetry]\nname = "repo-a"\n')
+    repo_config = RepositoryConfig(
+        name="repo-a", url="", package_name="repo-a", path=repo_path
+    )
+
+    def fake_pytest(cmd: list[str], **kwargs: Any) -> Any:
+        kwargs["stdout"].write(b"test_example.py .\n" * 10_000)
+        kwargs["stdout"].write(b"FAILED test_example.py\n")
+        return Mock(returncode=1)
+
+    with (
+        patch("subprocess.run", side_effect=fake_pytest),
+        patch.object(ExecutorService, "_get_venv_python", return_value=None),
+    ):
+        assert test_runner._run_repository_tests(repo_config, "unit") is False
+
+    log_path = temp_workspace / "logs" / "tests" / "repo-a.log"
+    assert log_path.stat().st_size > 100_000
+    tail = test_runner._read_log_tail(log_path, max_bytes=32)
+    assert tail.endswith("FAILED test_example.py\n")
+    assert len(tail) == 32
+
+
+def test_create_default_integration_config_loads_config_once(
+    test_runner: ExecutorService, mock_config_manager: Mock, temp_workspace: Path
+) -> None:
+    """Test the default integration setup reuses one loaded configuration."""
+    mock_config_manager.load_config.return_value = WorkspaceConfig(
+        name="test-workspace",
+        python_version="3.11",
+        repositories=[
+            RepositoryConfig(
+                name="repo-a",
+                url="",
+                package_name="repo-a",
+                path=temp_workspace / "repos" / "repo-a",
+            )
+        ],
+    )
+
+    test_runner._create_default_integration_config()
+
+    mock_config_manager.load_config.assert_called_once()
+    basic_test = temp_workspace / "tests" / "integration" / "test_basic_integration.py"
+    assert "import repo_a" in basic_test.read_text()
+
+
+def test_run_repository_tests_skips_unchanged_sources(
+    test_runner: ExecutorService, temp_workspace: Path
+) -> None:
+    """Test a passing repository is not retested until its sources change."""
+    repo_path = temp_workspace / "repos" / "repo-a"
+    (repo_path / "tests").mkdir(parents=True)
+    (repo_path / "pyproject.toml").write_text('[tool.poetry]\nname = "repo-a"\n')
+    (repo_path / "tests" / "test_example.py").write_text("def test_x(): pass\n")
+    repo_config = RepositoryConfig(
+        name="repo-a", url="", package_name="repo-a", path=repo_path
+    )
+
+    with (
+        patch("subprocess.run", side_effect=mock_run_method) as mock_run,
+        patch.object(ExecutorService, "_get_venv_python", return_value=None),
+    ):
+        assert test_runner._run_repository_tests(repo_config, "unit") is True
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0][:6] == [
+            "poetry",
+            "run",
+            "pytest",
+            "-q",
+            "--tb=line",
+            "--no-header",
+        ]
+
+        # Fresh service reads the persisted state and skips the run
+        cached_runner = ExecutorService(test_runner.config_manager)
+        assert cached_runner._run_repository_tests(repo_config, "unit") is True
+        assert mock_run.call_count == 1
+        assert cached_runner.cached_repositories == {"repo-a"}
+
+        (repo_path / "tests" / "test_example.py").write_text("def test_y(): pass\n")
+        assert cached_runner._run_repository_tests(repo_config, "unit") is True
+        assert mock_run.call_count == 2
+
+        uncached_runner = ExecutorService(test_runner.config_manager, use_cache=False)
+        assert uncached_runner._run_repository_tests(repo_config, "unit") is True
+        assert mock_run.call_count == 3
+
+    state_path = temp_workspace / ".mpr_cache" / "test_state.json"
+    assert "unit" in json.loads(state_path.read_text())["repo-a"]
+
+
+def test_run_repository_tests_reruns_after_dependency_change(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test a cached pass is invalidated by changes in upstream repositories."""
+    runner = ExecutorService(real_config_manager)
+    repo_a = real_config_manager.get_repository("repo-a")
+    repo_d = real_config_manager.get_repository("repo-d")
+    assert repo_a is not None and repo_d is not None
+
+    with (
+        patch("subprocess.run", side_effect=mock_run_method) as mock_run,
+        patch.object(ExecutorService, "_get_venv_python", return_value=None),
+    ):
+        assert runner._run_repository_tests(repo_a, "unit") is True
+        assert runner._run_repository_tests(repo_a, "unit") is True
+        assert mock_run.call_count == 1
+
+        # repo-a depends on repo-d through repo-b and repo-c
+        (repo_d.path / "module.py").write_text("VALUE = 1\n")
+        assert runner._run_repository_tests(repo_a, "unit") is True
+        assert mock_run.call_count == 2
+
+
+def test_generate_test_report_json_without_orjson(
+    test_runner: ExecutorService, mock_config_manager: Mock
+) -> None:
+    """Test the JSON report falls back to the standard library serializer."""
+    mock_config_manager.load_config.return_value = Mock(name="config")
+    mock_config_manager.load_config.return_value.name = "test-workspace"
+    test_runner.test_results = {
+        "repo-a": {"type": "unit", "success": True, "coverage": False}
+    }
+
+    with patch("multi_poetry_runner.core.testing.orjson", None):
+        report_path = test_runner.generate_test_report("json")
+
+    assert report_path is not None
+    report = json.loads(report_path.read_text())
+    assert report["workspace"] == "test-workspace"
+    assert report["summary"] == {"total": 1, "passed": 1, "failed": 0}
+
+
+def test_generate_test_report_html(
+    test_runner: ExecutorService, mock_config_manager: Mock
+) -> None:
+    """Test the HTML report is streamed to disk with one row per repository."""
+    mock_config_manager.load_config.return_value = Mock(name="config")
+    mock_config_manager.load_config.return_value.name = "test-workspace"
+    test_runner.test_results = {
+        "repo-a": {"type": "unit", "success": True, "coverage": True},
+        "repo-b": {"type": "unit", "success": False, "coverage": False},
+    }
+
+    report_path = test_runner.generate_test_report("html")
+
+    assert report_path is not None
+    html = report_path.read_text(encoding="utf-8")
+    assert html == test_runner._generate_html_report(
+        {
+            "workspace": "test-workspace",
+            "timestamp": html.split("<strong>Generated:</strong> ")[1].split("<")[0],
+            "results": test_runner.test_results,
+            "summary": {"total": 2, "passed": 1, "failed": 1},
+        }
+    )
+    assert html.count("<tr>") == 3
+    assert '<td class="failed">✗ Failed</td>' in html
+
+
+def test_scan_repository(temp_workspace: Path) -> None:
+    """Test one scandir pass reports the test-related repository layout."""
+    repo_path = temp_workspace / "repo"
+    assert _scan_repository(repo_path) is None
+
+    (repo_path / "tests" / "unit").mkdir(parents=True)
+    assert _scan_repository(repo_path) == _RepositoryLayout(
+        has_tests=True, has_unit_dir=True
+    )
+
+    (repo_path / "pyproject.toml").write_text("")
+    (repo_path / "tests" / "integration").mkdir()
+    assert _scan_repository(repo_path) == _RepositoryLayout(True, True, True, True)
+
+
+def test_run_integration_tests_local_discards_stdout(
+    test_runner: ExecutorService, temp_workspace: Path
+) -> None:
+    """Test integration runs only pipe stderr, decoding it on failure."""
+    (temp_workspace / "integration-tests.yaml").write_text("name: test\n")
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = Mock(returncode=1, stderr=b"boom \xff")
+        assert test_runner._run_integration_tests_local() is False
+
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["stdout"] is subprocess.DEVNULL
+    assert kwargs["stderr"] is subprocess.PIPE
+    assert "text" not in kwargs
+
+
+def test_get_venv_python_caches_poetry_env(
+    test_runner: ExecutorService, temp_workspace: Path
+) -> None:
+    """Test the virtualenv interpreter is resolved once and then read from cache."""
+    repo_path = temp_workspace / "repos" / "repo-a"
+    repo_path.mkdir(parents=True)
+    repo_config = RepositoryConfig(
+        name="repo-a", url="", package_name="repo-a", path=repo_path
+    )
+    venv_path = temp_workspace / "venv"
+    (venv_path / "bin").mkdir(parents=True)
+    (venv_path / "bin" / "python").write_text("")
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = Mock(returncode=0, stdout=f"{venv_path}\n")
+        python = test_runner._get_venv_python(repo_config)
+        assert python == str(venv_path / "bin" / "python")
+        assert test_runner._get_venv_python(repo_config) == python
+        assert mock_run.call_count == 1
+
+        mock_run.return_value = Mock(returncode=1, stdout="")
+        (venv_path / "bin" / "python").unlink()
+        assert test_runner._get_venv_python(repo_config) is None
+
+
+def test_create_default_docker_config_layers_per_repository(
+    test_runner: ExecutorService, mock_config_manager: Mock, temp_workspace: Path
+) -> None:
+    """Test the generated Dockerfile caches dependencies per repository."""
+    repos = []
+    for name in ["repo-a", "repo-b"]:
+        repo_path = temp_workspace / "repos" / name
+        repo_path.mkdir(parents=True)
+        repos.append(
+            RepositoryConfig(name=name, url="", package_name=name, path=repo_path)
+        )
+    (repos[0].path / "pyproject.toml").write_text("")
+    mock_config_manager.load_config.return_value = WorkspaceConfig(
+        name="test-workspace", python_version="3.12", repositories=repos
+    )
+
+    test_runner._create_default_docker_config()
+
+    dockerfile = (temp_workspace / "Dockerfile.test").read_text()
+    assert dockerfile.startswith("# syntax=docker/dockerfile:1.7\n")
+    assert "FROM python:3.12-slim" in dockerfile
+    assert "COPY repos/repo-a/pyproject.toml" in dockerfile
+    assert "repo-b" not in dockerfile
+    assert dockerfile.index("poetry install --no-root") < dockerfile.index("COPY . .")
+
+
+def test_run_tests_sequential_without_progress(
+    mock_config_manager: Mock, temp_workspace: Path
+) -> None:
+    """Test non-interactive runs log plain progress instead of a spinner."""
+    runner = ExecutorService(mock_config_manager, show_progress=False)
+    repo_path = temp_workspace / "repos" / "repo-a"
+    repo_path.mkdir(parents=True)
+    repo = RepositoryConfig(name="repo-a", url="", package_name="repo-a", path=repo_path)
+
+    with patch("rich.progress.Progress") as mock_progress:
+        assert runner._run_tests_sequential([repo], "unit") is True
+
+    mock_progress.assert_not_called()
+    assert runner.test_results["repo-a"]["success"] is True
+
+
+def test_run_integration_tests_docker_requires_executables(
+    test_runner: ExecutorService,
+) -> None:
+    """Test Docker availability is checked on PATH without spawning processes."""
+    with (
+        patch("multi_poetry_runner.core.testing._find_executable") as mock_find,
+        patch("subprocess.run") as mock_run,
+    ):
+        mock_find.side_effect = lambda name: None if name == "docker" else name
+        assert test_runner._run_integration_tests_docker() is False
+
+        mock_find.side_effect = lambda name: None if name != "docker" else name
+        assert test_runner._run_integration_tests_docker() is False
+
+    mock_run.assert_not_called()
+
+
+def test_run_tests_batched_attributes_junit_results(
+    mock_config_manager: Mock, temp_workspace: Path
+) -> None:
+    """Test repositories sharing a virtualenv run in one pytest process."""
+    runner = ExecutorService(mock_config_manager, use_cache=False)
+    repos = []
+    for name in ("repo-a", "repo-b"):
+        repo_path = temp_workspace / "repos" / name
+        (repo_path / "tests").mkdir(parents=True)
+        (repo_path / "pyproject.toml").write_text("[tool.poetry]\n")
+        repos.append(
+            RepositoryConfig(name=name, url="", package_name=name, path=repo_path)
+        )
+
+    junit = (
+        '<testsuites><testsuite name="pytest">'
+        '<testcase file="repos/repo-a/tests/test_a.py" name="test_ok" />'
+        '<testcase file="repos/repo-b/tests/test_b.py" name="test_bad">'
+        "<failure message=\"boom\" /></testcase>"
+        "</testsuite></testsuites>"
+    )
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> Mock:
+        junit_arg = next(arg for arg in cmd if arg.startswith("--junitxml="))
+        Path(junit_arg.split("=", 1)[1]).write_text(junit)
+        return Mock(returncode=1)
+
+    with (
+        patch.object(runner, "_get_venv_python", return_value="/venv/bin/python"),
+        patch("subprocess.run", side_effect=fake_run) as mock_run,
+    ):
+        assert runner._run_tests_batched(repos, "unit") is False
+
+    mock_run.assert_called_once()
+    cmd = mock_run.call_args[0][0]
+    assert cmd[:3] == ["/venv/bin/python", "-m", "pytest"]
+    assert f"--rootdir={temp_workspace}" in cmd
+    assert runner.test_results["repo-a"]["success"] is True
+    assert runner.test_results["repo-b"]["success"] is False
+
+
+def test_run_tests_batched_keeps_repositories_with_pytest_config_separate(
+    mock_config_manager: Mock, temp_workspace: Path
+) -> None:
+    """Test repositories configuring pytest are not folded into a batch."""
+    runner = ExecutorService(mock_config_manager, use_cache=False)
+    pyprojects = {
+        "repo-a": "[tool.poetry]\n",
+        "repo-b": "[tool.poetry]\n",
+        "repo-c": "[tool.poetry]\n\n[tool.pytest.ini_options]\naddopts = '-x'\n",
+    }
+    repos = []
+    for name, pyproject in pyprojects.items():
+        repo_path = temp_workspace / "repos" / name
+        (repo_path / "tests").mkdir(parents=True)
+        (repo_path / "pyproject.toml").write_text(pyproject)
+        repos.append(
+            RepositoryConfig(name=name, url="", package_name=name, path=repo_path)
+        )
+
+    junit = (
+        '<testsuites><testsuite name="pytest">'
+        '<testcase file="repos/repo-a/tests/test_a.py" name="test_ok" />'
+        '<testcase file="repos/repo-b/tests/test_b.py" name="test_ok" />'
+        "</testsuite></testsuites>"
+    )
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> Mock:
+        junit_arg = next(arg for arg in cmd if arg.startswith("--junitxml="))
+        Path(junit_arg.split("=", 1)[1]).write_text(junit)
+        return Mock(returncode=0)
+
+    with (
+        patch.object(runner, "_get_venv_python", return_value="/venv/bin/python"),
+        patch.object(runner, "_run_repository_tests", return_value=True) as mock_single,
+        patch("subprocess.run", side_effect=fake_run) as mock_run,
+    ):
+        assert runner._run_tests_batched(repos, "unit") is True
+
+    cmd = mock_run.call_args[0][0]
+    assert str(repos[0].path / "tests") in cmd
+    assert str(repos[1].path / "tests") in cmd
+    assert not any(arg.startswith(str(repos[2].path)) for arg in cmd)
+    assert [call.args[0] for call in mock_single.call_args_list] == [repos[2]]
+
+
+@pytest.mark.parametrize(
+    ("filename", "content", "expected"),
+    [
+        ("pytest.ini", "", True),
+        ("pyproject.toml", "[tool.pytest.ini_options]\n", True),
+        ("pyproject.toml", "[tool.poetry]\n", False),
+        ("setup.cfg", "[tool:pytest]\n", True),
+        ("setup.cfg", "[metadata]\n", False),
+        ("tox.ini", "[pytest]\n", True),
+        ("tox.ini", "[tox]\n", False),
+    ],
+)
+def test_has_pytest_config(
+    tmp_path: Path, filename: str, content: str, expected: bool
+) -> None:
+    """Test repository pytest configuration is detected in each config file."""
+    (tmp_path / filename).write_text(content)
+
+    assert _has_pytest_config(tmp_path) is expected
+
+
+def test_run_repository_tests_collects_junit_results(
+    test_runner: ExecutorService, temp_workspace: Path
+) -> None:
+    """Test per-test results are read from the JUnit report."""
+    repo_path = temp_workspace / "repos" / "repo-a"
+    (repo_path / "tests").mkdir(parents=True)
+    (repo_path / "pyproject.toml").write_text("[tool.poetry]\n")
+    repo = RepositoryConfig(name="repo-a", url="", package_name="repo-a", path=repo_path)
+
+    junit = (
+        '<testsuites><testsuite name="pytest">'
+        '<testcase classname="tests.test_a" name="test_ok" time="0.25" />'
+        '<testcase classname="tests.test_a" name="test_skip" time="0">'
+        "<skipped /></testcase>"
+        '<testcase classname="tests.test_a" name="test_bad" time="0.5">'
+        '<failure message="boom" /></testcase>'
+        "</testsuite></testsuites>"
+    )
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> Mock:
+        junit_arg = next(arg for arg in cmd if arg.startswith("--junitxml="))
+        Path(junit_arg.split("=", 1)[1]).write_text(junit)
+        return Mock(returncode=1)
+
+    with (
+        patch.object(test_runner, "_get_venv_python", return_value=None),
+        patch("subprocess.run", side_effect=fake_run),
+    ):
+        assert test_runner._run_repository_tests(repo, "unit") is False
+
+    result = test_runner._make_result("repo-a", "unit", False, False)
+    assert result["tests"] == {
+        "passed": 1,
+        "failed": 1,
+        "skipped": 1,
+        "duration": 0.75,
+        "failing_names": ["tests.test_a::test_bad"],
+    }
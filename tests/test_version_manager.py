@@ -1,9 +1,27 @@
+import asyncio
+import json
+import os
+import subprocess
+import threading
+import tomllib
 import unittest.mock
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from multi_poetry_runner.core.version_manager import VersionManager
-from multi_poetry_runner.utils.config import ConfigManager
+import pytest
+
+from multi_poetry_runner.core.version_manager import (
+    VersionManager,
+    _HistoryRow,
+    _read_tail_lines,
+    _strip_version_prefix,
+)
+from multi_poetry_runner.utils.config import (
+    ConfigManager,
+    RepositoryConfig,
+    WorkspaceConfig,
+)
 
 
 class TestVersionManager:
@@ -14,10 +32,11 @@ class TestVersionManager:
         mock_repo.name = "repo-a"
         mock_repo.path = Path(".")
         mock_config_manager.load_config.return_value.repositories = [mock_repo]
+        mock_config_manager.workspace_root = Path(".")
 
         mock_file = mock_open.return_value.__enter__.return_value
         mock_file.read.return_value = (
-            '[tool.poetry]\nname = "repo-a"\nversion = "1.2.3"\n'
+            b'[tool.poetry]\nname = "repo-a"\nversion = "1.2.3"\n'
         )
 
         version_manager = VersionManager(config_manager=mock_config_manager)
@@ -56,7 +75,9 @@ class TestVersionManager:
             MagicMock(),  # Second call: poetry lock --no-update
         ]
 
-        version_manager = VersionManager(config_manager=mock_config_manager)
+        version_manager = VersionManager(
+            config_manager=mock_config_manager, use_poetry_cli=True
+        )
         # Call with validate=False to skip validation tests
         result = version_manager.bump_version("repo-a", "major", validate=False)
 
@@ -72,8 +93,8 @@ class TestVersionManager:
             unittest.mock.call(
                 ["poetry", "lock", "--no-update"],
                 cwd=mock_repo.path,
+                check=True,
                 capture_output=True,
-                check=False,
             ),
         ]
         mock_subprocess.assert_has_calls(expected_calls)
@@ -86,3 +107,537 @@ class TestVersionManager:
 
         # Assert that the method returned True (success)
         assert result is True
+
+    @patch(
+        "multi_poetry_runner.core.version_manager.VersionManager._record_version_history"
+    )
+    @patch(
+        "multi_poetry_runner.core.version_manager.VersionManager._update_repository_version"
+    )
+    @patch(
+        "multi_poetry_runner.core.version_manager.VersionManager._update_dependency_version"
+    )
+    @patch(
+        "multi_poetry_runner.core.version_manager.VersionManager._get_current_version"
+    )
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_bump_version_updates_dependents(
+        self,
+        mock_get_current_version: MagicMock,
+        mock_update_dependency_version: MagicMock,
+        mock_update_repository_version: MagicMock,
+        mock_record_version_history: MagicMock,
+        parallel: bool,
+    ) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = Path(".")
+        base = RepositoryConfig(
+            name="base", url="", package_name="base", path=Path(".")
+        )
+        dependents = [
+            RepositoryConfig(
+                name=f"app-{i}",
+                url="",
+                package_name=f"app-{i}",
+                path=Path("."),
+                dependencies=["base"],
+            )
+            for i in range(3)
+        ]
+        mock_config_manager.load_config.return_value.repositories = [
+            base,
+            *dependents,
+        ]
+        mock_config_manager.get_repository.return_value = base
+
+        mock_get_current_version.return_value = "1.0.0"
+        mock_update_dependency_version.side_effect = lambda repo, *args, **kwargs: (
+            repo.name != "app-1"
+        )
+
+        printed: list[tuple[str, threading.Thread]] = []
+
+        def record_print(message: str = "", *args: object, **kwargs: object) -> None:
+            printed.append((str(message), threading.current_thread()))
+
+        version_manager = VersionManager(
+            config_manager=mock_config_manager, parallel=parallel
+        )
+        with patch(
+            "multi_poetry_runner.core.version_manager.console.print",
+            side_effect=record_print,
+        ):
+            result = version_manager.bump_version("base", "minor", validate=False)
+
+        assert result is True
+        # Each dependent's messages are printed together from the main thread
+        assert all(thread is threading.main_thread() for _, thread in printed)
+        lines = [message for message, _ in printed]
+        for dependent in dependents:
+            start = lines.index(f"  Processing {dependent.name}...")
+            assert dependent.name in lines[start + 1]
+        dependents_updated = mock_record_version_history.call_args[0][5]
+        assert [dep["name"] for dep in dependents_updated] == ["app-0", "app-2"]
+        assert all(dep["new_version"] == "1.0.1" for dep in dependents_updated)
+        assert mock_update_repository_version.call_count == 3
+        # The mocked dependency edits leave the files unchanged, so no relock
+        assert [
+            call.kwargs.get("lock")
+            for call in mock_update_repository_version.call_args_list
+        ] == [None, False, False]
+
+    def test_run_validation_tests(self) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = Path(".")
+        base = RepositoryConfig(
+            name="base", url="", package_name="base", path=Path("base")
+        )
+        app = RepositoryConfig(name="app", url="", package_name="app", path=Path("."))
+        mock_config_manager.get_repository.return_value = app
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        dependents_updated = [{"name": "app"}]
+
+        async def passing(
+            cmd: list[str], cwd: Path, timeout: float | None = None
+        ) -> subprocess.CompletedProcess[str]:
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch.object(
+            version_manager, "_run_async", side_effect=passing
+        ) as mock_run:
+            assert (
+                version_manager._run_validation_tests(base, dependents_updated) is True
+            )
+        assert {call.kwargs["cwd"] for call in mock_run.call_args_list} == {
+            Path("base"),
+            Path("."),
+        }
+
+        cancelled = []
+
+        async def failing_app(
+            cmd: list[str], cwd: Path, timeout: float | None = None
+        ) -> subprocess.CompletedProcess[str]:
+            if cwd == Path("."):
+                return subprocess.CompletedProcess(cmd, 1, "", "")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(cwd)
+                raise
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with (
+            patch.object(version_manager, "_run_async", side_effect=failing_app),
+            patch("os.cpu_count", return_value=2),
+        ):
+            assert (
+                version_manager._run_validation_tests(base, dependents_updated) is False
+            )
+        # The slow suite is stopped once the other one fails
+        assert cancelled == [Path("base")]
+
+    def test_load_pyproject_reuses_unchanged_file(self, tmp_path: Path) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        repo = RepositoryConfig(
+            name="repo-a", url="", package_name="repo-a", path=tmp_path
+        )
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text('[tool.poetry]\nname = "repo-a"\nversion = "1.2.3"\n')
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        with patch(
+            "multi_poetry_runner.core.version_manager.tomllib.load",
+            wraps=tomllib.load,
+        ) as mock_load:
+            assert version_manager._get_current_version(repo) == "1.2.3"
+            assert version_manager._get_dependency_info(repo) == []
+            assert mock_load.call_count == 1
+
+            pyproject_path.write_text(
+                '[tool.poetry]\nname = "repo-a"\nversion = "1.3.0"\n'
+            )
+            os.utime(pyproject_path, ns=(0, 1))
+            assert version_manager._get_current_version(repo) == "1.3.0"
+            assert mock_load.call_count == 2
+
+    def test_read_pyproject(self, tmp_path: Path) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        repo = RepositoryConfig(
+            name="repo-a", url="", package_name="repo-a", path=tmp_path
+        )
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        assert version_manager.read_pyproject(repo) is None
+
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "repo-a"\nversion = "1.2.3"\n'
+        )
+        assert version_manager._get_current_version(repo) == "1.2.3"
+        pyproject_data = version_manager.read_pyproject(repo)
+        assert pyproject_data is not None
+        assert pyproject_data["tool"]["poetry"]["name"] == "repo-a"
+
+    def test_calculate_new_version(self) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = Path(".")
+        version_manager = VersionManager(config_manager=mock_config_manager)
+
+        assert version_manager._calculate_new_version("1.2.3", "patch") == "1.2.4"
+        assert version_manager._calculate_new_version("1.2.3+dev.7", "minor") == "1.3.0"
+        assert (
+            version_manager._calculate_new_version("1.2.3", "major", alpha=True)
+            == "2.0.0-alpha.1"
+        )
+        assert (
+            version_manager._calculate_new_version("1.2.3-alpha.4", "patch", alpha=True)
+            == "1.2.3-alpha.5"
+        )
+        assert version_manager._calculate_new_version("1.2.3-alpha.4", "patch") == (
+            "1.2.4"
+        )
+        with pytest.raises(ValueError, match="Unable to parse version"):
+            version_manager._calculate_new_version("1.2.3-beta.1", "patch")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_version_history(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        if not use_orjson:
+            monkeypatch.setattr("multi_poetry_runner.core.version_manager.orjson", None)
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        version_manager = VersionManager(config_manager=mock_config_manager)
+
+        legacy = [{"repository": "repo-a", "new_version": "1.0.0"}]
+        version_manager.legacy_history_file.write_text(json.dumps(legacy, indent=2))
+
+        # Reading the history leaves the legacy file in place
+        assert version_manager._get_recent_version_history() == legacy
+        assert version_manager.legacy_history_file.exists()
+        assert not version_manager.version_history_file.exists()
+
+        version_manager._record_version_history(
+            "repo-a", "1.0.0", "1.0.1", "patch", False, []
+        )
+        version_manager._record_version_history(
+            "repo-a", "1.0.1", "1.0.2", "patch", False, []
+        )
+
+        assert not version_manager.legacy_history_file.exists()
+        assert len(version_manager.version_history_file.read_text().splitlines()) == 3
+
+        history = version_manager._get_recent_version_history(limit=2)
+        assert [entry["new_version"] for entry in history] == ["1.0.1", "1.0.2"]
+        assert datetime.fromisoformat(history[-1]["timestamp"])
+
+    @patch("subprocess.run")
+    def test_update_dependency_version_matches_name_variants(
+        self, mock_subprocess: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        repo = RepositoryConfig(name="app", url="", package_name="app", path=tmp_path)
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text(
+            '[tool.poetry]\nname = "app"\nversion = "1.0.0"\n\n'
+            '[tool.poetry.dependencies]\npython = "^3.11"\nmy_lib = "^1.0.0"\n'
+        )
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        assert version_manager._update_dependency_version(repo, "my-lib", "1.1.0")
+
+        with open(pyproject_path, "rb") as f:
+            dependencies = tomllib.load(f)["tool"]["poetry"]["dependencies"]
+        assert dependencies["my_lib"] == "^1.1.0"
+        assert mock_subprocess.call_count == 1
+
+        # Re-running with the same version neither rewrites nor relocks
+        mtime = pyproject_path.stat().st_mtime_ns
+        assert version_manager._update_dependency_version(repo, "my-lib", "1.1.0")
+        assert pyproject_path.stat().st_mtime_ns == mtime
+        assert mock_subprocess.call_count == 1
+        assert not version_manager._update_dependency_version(repo, "other", "1.1.0")
+
+    def test_is_version_compatible(self) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = Path(".")
+        version_manager = VersionManager(config_manager=mock_config_manager)
+
+        assert version_manager._is_version_compatible("1.2.3", "1.2.3")
+        assert version_manager._is_version_compatible("^1.2.0", "1.9.0")
+        assert not version_manager._is_version_compatible("^1.2.0", "2.0.0")
+        assert version_manager._is_version_compatible("~1.2.0", "1.2.9")
+        assert not version_manager._is_version_compatible("~1.2.0", "1.3.0")
+        assert not version_manager._is_version_compatible("~1", "1.0.0")
+        assert version_manager._is_version_compatible(">=1.0", "0.1.0")
+
+    @pytest.mark.parametrize(
+        ("requirement", "version"),
+        [
+            ("^1.2.3", "1.2.3"),
+            ("~=1.2", "1.2"),
+            (">=1.0.0", "1.0.0"),
+            ("== 2.0.0", "2.0.0"),
+            ("1.2.3", "1.2.3"),
+            ("!=1.2.3", "!=1.2.3"),
+            ("<1.2.3", "<1.2.3"),
+            ("<=1.2.3", "<=1.2.3"),
+            (">1.2.3", ">1.2.3"),
+        ],
+    )
+    def test_strip_version_prefix(self, requirement: str, version: str) -> None:
+        assert _strip_version_prefix(requirement) == version
+
+    def test_history_row_from_entry(self) -> None:
+        row = _HistoryRow.from_entry(
+            {
+                "timestamp": "2024-05-01T12:30:00",
+                "repository": "base",
+                "old_version": "1.0.0",
+                "new_version": "1.1.0-alpha.1",
+                "bump_type": "minor",
+                "alpha": True,
+                "dependents_updated": [{"name": "app"}, {"name": "cli"}],
+            }
+        )
+        assert row == (
+            "2024-05-01",
+            "base",
+            "1.0.0 → 1.1.0-alpha.1 (minor alpha)",
+            "app, cli",
+        )
+
+        empty = _HistoryRow.from_entry({})
+        assert empty.date == "Unknown"
+        assert empty.dependents == "[dim]None[/dim]"
+
+    def test_read_tail_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.jsonl"
+        path.write_bytes(b"".join(b'{"n": %d}\n' % i for i in range(50)))
+
+        for block_size in (4, 7, 8192):
+            lines = _read_tail_lines(path, 3, block_size=block_size)
+            assert lines == [b'{"n": 47}', b'{"n": 48}', b'{"n": 49}']
+
+        assert len(_read_tail_lines(path, 100)) == 50
+        assert _read_tail_lines(path, 0) == []
+
+    def test_get_version_status_builds_dependency_graph(self, tmp_path: Path) -> None:
+        lib = RepositoryConfig(
+            name="lib", url="", package_name="lib", path=tmp_path / "lib"
+        )
+        app = RepositoryConfig(
+            name="app",
+            url="",
+            package_name="app",
+            path=tmp_path / "app",
+            dependencies=["lib"],
+        )
+        missing = RepositoryConfig(
+            name="missing", url="", package_name="missing", path=tmp_path / "missing"
+        )
+        lib.path.mkdir()
+        (lib.path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "lib"\nversion = "2.0.0-alpha.1"\n'
+        )
+        app.path.mkdir()
+        (app.path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "app"\nversion = "1.0.0"\n\n'
+            '[tool.poetry.dependencies]\npython = "^3.11"\nlib = "^1.0.0"\n'
+        )
+
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        mock_config_manager.load_config.return_value = WorkspaceConfig(
+            name="test", repositories=[lib, app, missing]
+        )
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        with patch(
+            "multi_poetry_runner.core.version_manager.tomllib.load",
+            wraps=tomllib.load,
+        ) as mock_load:
+            status = version_manager.get_version_status()
+
+        # Each existing pyproject.toml is parsed exactly once
+        assert mock_load.call_count == 2
+        by_name = {repo["name"]: repo for repo in status["repositories"]}
+        assert by_name["lib"]["is_alpha"] is True
+        assert by_name["lib"]["dependents"] == ["app"]
+        assert by_name["missing"]["path_exists"] is False
+        assert status["dependency_graph"]["app"] == [
+            {
+                "name": "lib",
+                "managed": True,
+                "current_version": "2.0.0-alpha.1",
+                "required_version": "^1.0.0",
+                "is_path": False,
+                "source": "pypi",
+                "compatible": False,
+            }
+        ]
+
+    def test_get_dependent_repositories_index_invalidation(
+        self, tmp_path: Path
+    ) -> None:
+        """Test the reverse index is rebuilt for a new config or edit."""
+        lib = RepositoryConfig(name="lib", url="", package_name="lib", path=tmp_path)
+        app = RepositoryConfig(
+            name="app",
+            url="",
+            package_name="app",
+            path=tmp_path,
+            dependencies=["lib", "lib"],
+        )
+        cli = RepositoryConfig(name="cli", url="", package_name="cli", path=tmp_path)
+        config = WorkspaceConfig(name="test", repositories=[lib, app, cli])
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        mock_config_manager.load_config.return_value = config
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        # A dependency listed twice still yields one dependent
+        assert version_manager._get_dependent_repositories("lib") == [app]
+
+        # The index is built once per config
+        cli.dependencies.append("lib")
+        assert version_manager._get_dependent_repositories("lib") == [app]
+
+        # A reloaded config rebuilds it
+        tool = RepositoryConfig(
+            name="tool",
+            url="",
+            package_name="tool",
+            path=tmp_path,
+            dependencies=["lib"],
+        )
+        mock_config_manager.load_config.return_value = WorkspaceConfig(
+            name="test", repositories=[lib, tool, cli]
+        )
+        assert version_manager._get_dependent_repositories("lib") == [tool, cli]
+
+        # So does a dependency edit made through the manager
+        tool.dependencies.clear()
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "tool"\nversion = "1.0.0"\n\n'
+            '[tool.poetry.dependencies]\nlib = "^1.0.0"\n'
+        )
+        assert version_manager._update_dependency_version(
+            tool, "lib", "1.1.0", lock=False
+        )
+        assert version_manager._get_dependent_repositories("lib") == [cli]
+
+    def test_sync_dependency_versions_parses_each_pyproject_once(
+        self, tmp_path: Path
+    ) -> None:
+        lib = RepositoryConfig(
+            name="lib", url="", package_name="lib", path=tmp_path / "lib"
+        )
+        app = RepositoryConfig(
+            name="app",
+            url="",
+            package_name="app",
+            path=tmp_path / "app",
+            dependencies=["lib"],
+        )
+        lib.path.mkdir()
+        (lib.path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "lib"\nversion = "1.1.0"\n'
+        )
+        app.path.mkdir()
+        (app.path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "app"\nversion = "1.0.0"\n\n'
+            '[tool.poetry.dependencies]\npython = "^3.11"\nlib = "^1.0.0"\n'
+        )
+
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        mock_config_manager.load_config.return_value = WorkspaceConfig(
+            name="test", repositories=[lib, app]
+        )
+        mock_config_manager.get_dependency_order.return_value = ["lib", "app"]
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        with (
+            patch(
+                "multi_poetry_runner.core.version_manager.tomllib.load",
+                wraps=tomllib.load,
+            ) as mock_load,
+            patch.object(version_manager, "_update_dependency_version") as mock_update,
+        ):
+            assert version_manager.sync_dependency_versions(force=True) is True
+
+        assert mock_load.call_count == 2
+        mock_update.assert_called_once_with(app, "lib", "1.1.0")
+        mock_config_manager.get_repository.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_update_repository_version_edits_pyproject(
+        self, mock_subprocess: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        repo = RepositoryConfig(name="app", url="", package_name="app", path=tmp_path)
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text(
+            "[tool.poetry]\n"
+            'name = "app"\n'
+            'version = "1.0.0"  # bumped by mpr\n\n'
+            "[tool.poetry.dependencies]\n"
+            'lib = { version = "^1.0.0" }\n'
+        )
+
+        version_manager = VersionManager(config_manager=mock_config_manager)
+        version_manager._update_repository_version(repo, "1.1.0", lock=False)
+
+        assert pyproject_path.read_text() == (
+            "[tool.poetry]\n"
+            'name = "app"\n'
+            'version = "1.1.0"  # bumped by mpr\n\n'
+            "[tool.poetry.dependencies]\n"
+            'lib = { version = "^1.0.0" }\n'
+        )
+        mock_subprocess.assert_not_called()
+
+        # Fall back to Poetry when there is no version line to edit
+        pyproject_path.write_text('[tool.poetry]\nname = "app"\n')
+        version_manager._update_repository_version(repo, "1.2.0", lock=False)
+        mock_subprocess.assert_called_once_with(
+            ["poetry", "version", "1.2.0"],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+    @patch("subprocess.run")
+    def test_update_repository_version_relocks_with_fallback(
+        self, mock_subprocess: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test Poetry 2 falls back to a plain lock and failures are raised."""
+        mock_config_manager = MagicMock(spec=ConfigManager)
+        mock_config_manager.workspace_root = tmp_path
+        repo = RepositoryConfig(name="app", url="", package_name="app", path=tmp_path)
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.poetry]\nname = "app"\nversion = "1.0.0"\n'
+        )
+        no_update = subprocess.CalledProcessError(1, ["poetry", "lock", "--no-update"])
+        version_manager = VersionManager(config_manager=mock_config_manager)
+
+        mock_subprocess.side_effect = [no_update, MagicMock(returncode=0)]
+        version_manager._update_repository_version(repo, "1.1.0")
+        assert [call.args[0] for call in mock_subprocess.call_args_list] == [
+            ["poetry", "lock", "--no-update"],
+            ["poetry", "lock"],
+        ]
+
+        mock_subprocess.reset_mock()
+        mock_subprocess.side_effect = [
+            no_update,
+            subprocess.CalledProcessError(1, ["poetry", "lock"]),
+        ]
+        with pytest.raises(Exception, match="Failed to update lock file for app"):
+            version_manager._update_repository_version(repo, "1.2.0")
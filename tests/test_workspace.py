@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import shutil
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from multi_poetry_runner.core.workspace import WorkspaceManager
+import pytest
+
+from multi_poetry_runner.core.workspace import (
+    WorkspaceManager,
+    _find_build_artifacts,
+    _parse_branch_header,
+    _remove_paths,
+    _run_streaming,
+)
+from multi_poetry_runner.utils.config import ConfigManager, RepositoryConfig
 
 
 def test_workspace_manager_initialization(
@@ -33,6 +45,24 @@ def test_workspace_initialization(
     assert (temp_workspace / "scripts").exists()
     assert (temp_workspace / "tests").exists()
 
+    makefile = (temp_workspace / "Makefile").read_text()
+    assert makefile.startswith("# Makefile for MPR workspace\n")
+    assert makefile.endswith("mpr workspace status\n")
+    gitignore = (temp_workspace / ".gitignore").read_text()
+    assert gitignore.startswith("# Virtual environments\n")
+
+
+def test_workspace_initialization_keeps_gitignore(
+    workspace_manager: WorkspaceManager,
+    temp_workspace: Path,
+) -> None:
+    """Test that an existing .gitignore is not overwritten."""
+    (temp_workspace / ".gitignore").write_text("custom\n")
+
+    workspace_manager.initialize_workspace("test-workspace")
+
+    assert (temp_workspace / ".gitignore").read_text() == "custom\n"
+
 
 def test_workspace_status(
     workspace_manager: WorkspaceManager,
@@ -108,3 +138,214 @@ def test_workspace_clean(
     assert backups_dir.exists()
     assert not any(logs_dir.iterdir())
     assert not any(backups_dir.iterdir())
+
+
+def test_workspace_status_collects_repositories_in_order(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test that repository statuses keep the configured order."""
+    workspace_manager = WorkspaceManager(real_config_manager)
+
+    status = workspace_manager.get_status()
+
+    repositories = status["repositories"]
+    assert [repo["name"] for repo in repositories] == [
+        "repo-a",
+        "repo-b",
+        "repo-c",
+        "repo-d",
+        "repo-e",
+    ]
+    assert all(repo["git_status"] == "dirty" for repo in repositories)
+    assert all(repo["package_version"] == "1.0.0" for repo in repositories)
+    assert all(repo["dependency_mode"] == "none" for repo in repositories)
+
+    expected_branch = subprocess.run(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        cwd=real_config_manager.load_config().repositories[0].path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert all(repo["git_branch"] == expected_branch for repo in repositories)
+
+
+@pytest.mark.parametrize(
+    ("header", "branch"),
+    [
+        ("## main", "main"),
+        ("## main...origin/main [ahead 1]", "main"),
+        ("## feature/x...origin/feature/x", "feature/x"),
+        ("## No commits yet on main", "main"),
+        ("## HEAD (no branch)", "HEAD"),
+        ("", "unknown"),
+    ],
+)
+def test_parse_branch_header(header: str, branch: str) -> None:
+    """Test branch extraction from `git status --branch` output."""
+    assert _parse_branch_header(header) == branch
+
+
+def test_setup_workspace_installs_dependencies_first(
+    real_config_manager: ConfigManager,
+) -> None:
+    """Test that environments are set up one dependency level at a time."""
+    workspace_manager = WorkspaceManager(real_config_manager)
+
+    levels = workspace_manager._dependency_levels(
+        real_config_manager.load_config().repositories
+    )
+    assert [[repo.name for repo in level] for level in levels] == [
+        ["repo-d", "repo-e"],
+        ["repo-c"],
+        ["repo-b"],
+        ["repo-a"],
+    ]
+
+    installed: list[str] = []
+    with (
+        patch.object(workspace_manager, "_clone_repository") as mock_clone,
+        patch.object(
+            workspace_manager,
+            "_setup_poetry_environment",
+            side_effect=lambda repo, ci_mode: installed.append(repo.name),
+        ),
+    ):
+        workspace_manager.setup_workspace(ci_mode=True)
+
+    assert mock_clone.call_count == 5
+    assert sorted(installed[:2]) == ["repo-d", "repo-e"]
+    assert installed[2:] == ["repo-c", "repo-b", "repo-a"]
+
+
+def test_remove_build_artifacts(temp_workspace: Path) -> None:
+    """Test that build artifacts are removed anywhere in a repository."""
+    repo_path = temp_workspace / "repo"
+    (repo_path / "src" / "pkg" / "__pycache__").mkdir(parents=True)
+    (repo_path / "src" / "pkg" / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"")
+    (repo_path / "src" / "pkg.egg-info").mkdir()
+    (repo_path / "dist").mkdir()
+    (repo_path / "dist" / "pkg-1.0.0.tar.gz").write_bytes(b"")
+    (repo_path / "src" / "pkg" / "module.py").write_text("")
+    (repo_path / "build").write_text("")
+    # A symlinked virtualenv is unlinked, its target is kept
+    shared_venv = temp_workspace / "shared-venv"
+    (shared_venv / "bin").mkdir(parents=True)
+    (repo_path / ".venv").symlink_to(shared_venv)
+
+    _remove_paths([str(repo_path / ".venv"), *_find_build_artifacts(repo_path)])
+
+    remaining = sorted(
+        path.relative_to(repo_path).as_posix() for path in repo_path.rglob("*")
+    )
+    assert remaining == ["src", "src/pkg", "src/pkg/module.py"]
+    assert (shared_venv / "bin").is_dir()
+
+
+def test_remove_paths_continues_after_failure(
+    temp_workspace: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a path that cannot be removed does not stop the others."""
+    paths = [temp_workspace / name for name in ("first", "second", "third")]
+    for path in paths:
+        (path / "sub").mkdir(parents=True)
+    real_rmtree = shutil.rmtree
+
+    def rmtree(path: str) -> None:
+        if path == str(paths[1]):
+            raise PermissionError("denied")
+        real_rmtree(path)
+
+    with patch("multi_poetry_runner.core.workspace.shutil.rmtree", side_effect=rmtree):
+        _remove_paths([str(path) for path in paths])
+
+    assert [path.exists() for path in paths] == [False, True, False]
+    assert "Could not remove" in caplog.text
+
+
+def test_find_build_artifacts_skips_hidden_directories(temp_workspace: Path) -> None:
+    """Test that virtualenvs and VCS metadata are not searched for artifacts."""
+    repo_path = temp_workspace / "repo"
+    site_packages = repo_path / ".venv" / "lib" / "python3.11" / "site-packages"
+    (site_packages / "dep" / "__pycache__").mkdir(parents=True)
+    (site_packages / "dep-1.0.0.egg-info").mkdir()
+    (repo_path / ".git" / "build").mkdir(parents=True)
+    (repo_path / "pkg" / "__pycache__").mkdir(parents=True)
+
+    assert _find_build_artifacts(repo_path) == [str(repo_path / "pkg" / "__pycache__")]
+
+
+def test_run_streaming_keeps_output_tail_on_failure() -> None:
+    """Test that a failing command reports the end of its output."""
+    script = "import sys\nfor i in range(500): print(i)\nsys.exit(3)"
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        _run_streaming([sys.executable, "-c", script])
+
+    assert exc_info.value.returncode == 3
+    lines = exc_info.value.output.splitlines()
+    assert len(lines) == 200
+    assert lines[-1] == "499"
+
+
+def test_check_write_permissions(
+    workspace_manager: WorkspaceManager,
+    temp_workspace: Path,
+) -> None:
+    """Test the writability check of repository directories."""
+    assert workspace_manager._check_write_permissions(temp_workspace) is True
+    missing = temp_workspace / "missing"
+    assert workspace_manager._check_write_permissions(missing) is False
+    assert list(temp_workspace.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("dependencies", "mode"),
+    [
+        ('python = "^3.11"', "none"),
+        ('lib = { path = "../lib", develop = true }', "local"),
+        ('lib = { version = "^1.0", source = "test-pypi" }', "test"),
+        ('lib = "^1.0"\nother = { version = "^2.0" }', "remote"),
+        ('lib = { path = "../lib" }\nother = "^2.0"', "mixed"),
+        ('lib = { git = "https://example.com/lib.git" }', "none"),
+    ],
+)
+def test_check_dependency_mode(
+    workspace_manager: WorkspaceManager,
+    temp_workspace: Path,
+    dependencies: str,
+    mode: str,
+) -> None:
+    """Test classification of a repository's dependency mode."""
+    (temp_workspace / "pyproject.toml").write_text(
+        f"[tool.poetry.dependencies]\n{dependencies}\n"
+    )
+    repo = RepositoryConfig(
+        name="repo", url="", package_name="repo", path=temp_workspace
+    )
+
+    assert workspace_manager._check_dependency_mode(repo) == mode
+
+
+@pytest.mark.parametrize(
+    ("pyproject", "version"),
+    [
+        ('[tool.poetry]\nversion = "1.2.3"\n\n[project]\nversion = "9.9.9"\n', "1.2.3"),
+        ('[project]\nname = "pkg"\nversion = "2.0.0"\n', "2.0.0"),
+        ('[project]\nname = "pkg"\ndynamic = ["version"]\n', "dynamic"),
+        ('[tool.poetry]\nname = "pkg"\n', "not found"),
+    ],
+)
+def test_get_package_version(
+    workspace_manager: WorkspaceManager,
+    temp_workspace: Path,
+    pyproject: str,
+    version: str,
+) -> None:
+    """Test reading the declared package version."""
+    (temp_workspace / "pyproject.toml").write_text(pyproject)
+    repo = RepositoryConfig(
+        name="repo", url="", package_name="repo", path=temp_workspace
+    )
+
+    assert workspace_manager._get_package_version(repo) == version